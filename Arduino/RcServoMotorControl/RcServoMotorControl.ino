@@ -4,6 +4,27 @@
 //  Version   
 //            v0.1  2025.11.05  Tony Kwon
 //                Initial revision
+//
+//            v0.2  2026.10.17  Tony Kwon
+//                Add protocol v2 delta frame
+//                Keep previous byte only on read bytes
+//
+//            v0.3  2026.10.17  Tony Kwon
+//                Add trajectory upload and board timer playback
+//--------------------------------------------------------------------------------
+
+//--------------------------------------------------------------------------------
+//  Frame
+//    v1  0xFF 0xFF count (tick_hi tick_lo) * count
+//    v2  0xFF 0xFF 0xFE seq count (ch tick_hi tick_lo) * count
+//          seq   0x00 ~ 0x7F, +1 per v2 frame
+//          ch    0 ~ MOTOR_CH_MAX - 1, only changed channels
+//    Upload
+//      chunk     0xFF 0xFF 0xFD seq count (tick_hi tick_lo) * motor count * count
+//      control   0xFF 0xFF 0xFC cmd arg
+//      ack       0xFF 0xFF 0xFD seq free state   (board -> host)
+//          seq   0x00 ~ 0x7F, last accepted chunk
+//          free  free frames in upload buffer
 //--------------------------------------------------------------------------------
 
 //--------------------------------------------------------------------------------
@@ -35,19 +56,158 @@ void setupMotor() {
 }
 
 //--------------------------------------------------------------------------------
-//  RX state process
+//  RX state
 //--------------------------------------------------------------------------------
 #define RX_STATE_START  0
 #define RX_STATE_COUNT  1
 #define RX_STATE_DATA   2
 #define RX_STATE_RUN    3
+#define RX_STATE_SEQ    4
+#define RX_STATE_DELTA  5
+#define RX_STATE_CHUNK_SEQ    6
+#define RX_STATE_CHUNK_COUNT  7
+
+#define FRAME_V2        0xFE
+#define FRAME_UPLOAD    0xFD
+#define FRAME_CONTROL   0xFC
+#define FRAME_SEQ_MAX   0x80
+
+#define FRAME_TYPE_FULL     1
+#define FRAME_TYPE_DELTA    2
+#define FRAME_TYPE_CHUNK    3
+#define FRAME_TYPE_CONTROL  4
 
 int rxState = RX_STATE_START;
+int rxFrameType = FRAME_TYPE_FULL;
 int rxMotorCnt;
 int rxDataCnt;
+int rxDataSize;
 byte rxData[256];
 byte rxDataPre = 0x00;
+int rxSeq = -1;
+unsigned long rxLostCnt = 0;
+int rxChunkSeq;
+
+//--------------------------------------------------------------------------------
+//  Upload playback
+//    Chunks are buffered in a ring buffer and played on the board timer.
+//    Every chunk and control frame is acknowledged, played frames are
+//    acknowledged every UPLOAD_ACK_PERIOD frames and on an empty buffer.
+//--------------------------------------------------------------------------------
+#define UPLOAD_BUF_SIZE     384
+#define UPLOAD_ACK_PERIOD   8
+
+#define CONTROL_CLEAR       0x01    // arg: motor count
+#define CONTROL_PLAY        0x02    // arg: interval [ms]
+#define CONTROL_STOP        0x03
+
+#define UPLOAD_STATE_PLAY       0x01
+#define UPLOAD_STATE_UNDERRUN   0x02
+
+byte uploadBuf[UPLOAD_BUF_SIZE];
+int uploadMotorCnt = 0;
+int uploadFrameMax = 0;
+int uploadHead = 0;
+int uploadCnt = 0;
+int uploadSeq = FRAME_SEQ_MAX - 1;
+bool uploadPlay = false;
+bool uploadUnderrun = false;
+unsigned long uploadInterval = 20000;  // [us]
+unsigned long uploadTime = 0;
+unsigned long uploadPlayedCnt = 0;
+
+void sendUploadAck() {
+  int uploadFree = min(uploadFrameMax - uploadCnt, 0xFE);
+  byte uploadState = 0x00;
+  if(uploadPlay == true) {
+    uploadState |= UPLOAD_STATE_PLAY;
+  }
+  if(uploadUnderrun == true) {
+    uploadState |= UPLOAD_STATE_UNDERRUN;
+  }
+  Serial.write(0xFF);
+  Serial.write(0xFF);
+  Serial.write(FRAME_UPLOAD);
+  Serial.write((byte)uploadSeq);
+  Serial.write((byte)uploadFree);
+  Serial.write(uploadState);
+}
 
+void processUploadChunk(int seq, int frameCnt) {
+  //  Accept next chunk only (duplicates and gaps are acknowledged with last seq)
+  if(seq == ((uploadSeq + 1) % FRAME_SEQ_MAX) && frameCnt <= (uploadFrameMax - uploadCnt)) {
+    int frameSize = uploadMotorCnt * 2;
+    for(int i = 0; i < frameCnt; i++) {
+      int index = ((uploadHead + uploadCnt) % uploadFrameMax) * frameSize;
+      memcpy(&uploadBuf[index], &rxData[i * frameSize], frameSize);
+      uploadCnt++;
+    }
+    uploadSeq = seq;
+  }
+  sendUploadAck();
+}
+
+void processUploadControl(int cmd, int arg) {
+  if(cmd == CONTROL_CLEAR) {
+    if(arg > 0 && arg <= MOTOR_CH_MAX) {
+      uploadMotorCnt = arg;
+      uploadFrameMax = UPLOAD_BUF_SIZE / (uploadMotorCnt * 2);
+    }
+    uploadHead = 0;
+    uploadCnt = 0;
+    uploadSeq = FRAME_SEQ_MAX - 1;
+    uploadPlay = false;
+    uploadUnderrun = false;
+    uploadPlayedCnt = 0;
+  } else if(cmd == CONTROL_PLAY) {
+    if(arg > 0) {
+      uploadInterval = (unsigned long)arg * 1000;
+    }
+    uploadPlay = true;
+    uploadTime = micros();
+  } else if(cmd == CONTROL_STOP) {
+    uploadPlay = false;
+    uploadHead = 0;
+    uploadCnt = 0;
+  }
+  sendUploadAck();
+}
+
+void processUploadPlay() {
+  if(uploadPlay == false) {
+    return;
+  }
+
+  unsigned long now = micros();
+  if((now - uploadTime) < uploadInterval) {
+    return;
+  }
+
+  //  Empty buffer, hold the last frame and restart timing on the next chunk
+  if(uploadCnt == 0) {
+    uploadUnderrun = true;
+    uploadTime = now;
+    return;
+  }
+  uploadTime += uploadInterval;
+
+  int index = uploadHead * uploadMotorCnt * 2;
+  for(int i = 0; i < uploadMotorCnt; i++) {
+    int motorTick = (((int)uploadBuf[index + (i * 2)]) << 8) + uploadBuf[index + (i * 2) + 1];
+    servoDriver.setPWM(i, 0, motorTick);
+  }
+  uploadHead = (uploadHead + 1) % uploadFrameMax;
+  uploadCnt--;
+  uploadPlayedCnt++;
+
+  if((uploadPlayedCnt % UPLOAD_ACK_PERIOD) == 0 || uploadCnt == 0) {
+    sendUploadAck();
+  }
+}
+
+//--------------------------------------------------------------------------------
+//  RX state process
+//--------------------------------------------------------------------------------
 void processRxState(byte data, bool isRead) {
 
   //  'Start' state
@@ -61,14 +221,78 @@ void processRxState(byte data, bool isRead) {
   //  'Count' state
   } else if(rxState == RX_STATE_COUNT) {
     if(isRead == true) {
-      if(data == 0xFF || data == 0x00) {
+      if(data == FRAME_V2) {
+        rxState = RX_STATE_SEQ;
+      } else if(data == FRAME_UPLOAD) {
+        rxState = RX_STATE_CHUNK_SEQ;
+      } else if(data == FRAME_CONTROL) {
+        rxFrameType = FRAME_TYPE_CONTROL;
+        rxDataCnt = 0;
+        rxDataSize = 2;
+        rxState = RX_STATE_DATA;
+      } else if(data == 0xFF || data == 0x00 || data > MOTOR_CH_MAX) {
         rxState = RX_STATE_START;
       } else {
+        rxFrameType = FRAME_TYPE_FULL;
         rxMotorCnt = data;
         rxDataCnt = 0;
+        rxDataSize = rxMotorCnt * 2;
         rxState = RX_STATE_DATA;      
       }
     }    
+
+  //  'Seq' state (v2)
+  } else if(rxState == RX_STATE_SEQ) {
+    if(isRead == true) {
+      if(data >= FRAME_SEQ_MAX) {
+        rxState = RX_STATE_START;
+      } else {
+        if(rxSeq >= 0 && data != ((rxSeq + 1) % FRAME_SEQ_MAX)) {
+          rxLostCnt++;
+        }
+        rxSeq = data;
+        rxState = RX_STATE_DELTA;
+      }
+    }
+
+  //  'Delta' count state (v2)
+  } else if(rxState == RX_STATE_DELTA) {
+    if(isRead == true) {
+      if(data == 0x00 || data > MOTOR_CH_MAX) {
+        rxState = RX_STATE_START;
+      } else {
+        rxFrameType = FRAME_TYPE_DELTA;
+        rxMotorCnt = data;
+        rxDataCnt = 0;
+        rxDataSize = rxMotorCnt * 3;
+        rxState = RX_STATE_DATA;
+      }
+    }
+
+  //  'Chunk seq' state (upload)
+  } else if(rxState == RX_STATE_CHUNK_SEQ) {
+    if(isRead == true) {
+      if(data >= FRAME_SEQ_MAX) {
+        rxState = RX_STATE_START;
+      } else {
+        rxChunkSeq = data;
+        rxState = RX_STATE_CHUNK_COUNT;
+      }
+    }
+
+  //  'Chunk count' state (upload)
+  } else if(rxState == RX_STATE_CHUNK_COUNT) {
+    if(isRead == true) {
+      if(data == 0x00 || uploadMotorCnt == 0 || (data * uploadMotorCnt * 2) > (int)sizeof(rxData)) {
+        rxState = RX_STATE_START;
+      } else {
+        rxFrameType = FRAME_TYPE_CHUNK;
+        rxMotorCnt = data;
+        rxDataCnt = 0;
+        rxDataSize = data * uploadMotorCnt * 2;
+        rxState = RX_STATE_DATA;
+      }
+    }
     
   //  'Data' state
   } else if(rxState == RX_STATE_DATA) {
@@ -78,7 +302,7 @@ void processRxState(byte data, bool isRead) {
       } else {      
         rxData[rxDataCnt] = data;
         rxDataCnt++;
-        if((rxMotorCnt * 2) <= rxDataCnt) {
+        if(rxDataSize <= rxDataCnt) {
           rxState = RX_STATE_RUN;
         }
       }
@@ -86,19 +310,38 @@ void processRxState(byte data, bool isRead) {
 
   //  'Run' state
   } else if(rxState == RX_STATE_RUN) {    
-    for(int i = 0; i < rxMotorCnt; i++) {
-      int motorTick = (((int)rxData[i * 2]) << 8) + rxData[(i * 2) + 1];
-      servoDriver.setPWM(i, 0, motorTick); 
-    }    
+    if(rxFrameType == FRAME_TYPE_CHUNK) {
+      processUploadChunk(rxChunkSeq, rxMotorCnt);
+    } else if(rxFrameType == FRAME_TYPE_CONTROL) {
+      processUploadControl(rxData[0], rxData[1]);
+    } else if(rxFrameType == FRAME_TYPE_DELTA) {
+      for(int i = 0; i < rxMotorCnt; i++) {
+        int motorCh = rxData[i * 3];
+        int motorTick = (((int)rxData[(i * 3) + 1]) << 8) + rxData[(i * 3) + 2];
+        if(motorCh < MOTOR_CH_MAX) {
+          servoDriver.setPWM(motorCh, 0, motorTick);
+        }
+      }
+    } else {
+      for(int i = 0; i < rxMotorCnt; i++) {
+        int motorTick = (((int)rxData[i * 2]) << 8) + rxData[(i * 2) + 1];
+        servoDriver.setPWM(i, 0, motorTick); 
+      }    
+    }
     rxState = RX_STATE_START;
 
+    //  Frame end, a last 0xFF tick byte is not a start byte
+    rxDataPre = 0x00;
+
   //  Else
   } else {
     rxState = RX_STATE_START;
      
   }
 
-  rxDataPre = data;
+  if(isRead == true) {
+    rxDataPre = data;
+  }
 }
 
 //--------------------------------------------------------------------------------
@@ -113,15 +356,18 @@ void setup() {
 //  Loop
 //--------------------------------------------------------------------------------
 void loop() {
-  byte data;
+  byte data = 0x00;
   bool isRead = false;
 
-  //  Read serial comm data
-  if(Serial.available()) {
+  //  Read serial comm data (not in 'Run' state, the byte is kept for the next pass)
+  if(rxState != RX_STATE_RUN && Serial.available()) {
     data = Serial.read();  
     isRead = true;
   }
 
   //  Process RX state
   processRxState(data, isRead);  
+
+  //  Play uploaded frames
+  processUploadPlay();
 }
\ No newline at end of file
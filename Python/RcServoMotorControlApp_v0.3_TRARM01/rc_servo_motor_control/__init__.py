@@ -1,5 +1,42 @@
-from . import rc_servo_motor_control
-from . import rc_servo_motor_control_model
-from . import rc_servo_motor_control_view
-from . import serial_comm
-from . import interp
\ No newline at end of file
+# --------------------------------------------------------------------------------
+#   File        __init__.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Submodules are imported on first access, so headless tools do not pay
+#   for PySide6 (rc_servo_motor_control, rc_servo_motor_control_view).
+# --------------------------------------------------------------------------------
+import importlib
+
+__all__ = [
+    'rc_servo_motor_control',
+    'rc_servo_motor_control_model',
+    'rc_servo_motor_control_view',
+    'serial_comm',
+    'interp',
+    'action_player',
+    'frame_pacer',
+    'frame_encoder',
+    'tx_coalescer',
+    'board_emulator',
+    'trajectory_file',
+    'trajectory_compiler',
+    'trajectory_stream',
+    'motion_profile',
+    'fleet_controller',
+    'trajectory_uploader',
+    'telemetry',
+    'pose_table_model',
+    'forward_kinematics',
+    'inverse_kinematics',
+    'workspace_map',
+    'config',
+]
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
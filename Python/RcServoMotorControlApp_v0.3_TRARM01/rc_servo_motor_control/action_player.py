@@ -0,0 +1,161 @@
+# --------------------------------------------------------------------------------
+#   File        action_player.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Pace frames with FramePacer deadlines
+#                   Throttle frames while serial TX is busy
+#                   Play CompiledTrajectory frames
+#
+#               v0.3  2026.10.17  Tony Kwon
+#                   Add start_stream() function
+#
+#               v0.4  2026.10.17  Tony Kwon
+#                   Pass scheduled frame time to rotate_data() (telemetry)
+#                   Always clear running and call finish callback on error
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import threading
+
+from .frame_pacer import FramePacer
+
+# --------------------------------------------------------------------------------
+#   Class - ActionPlayer
+# --------------------------------------------------------------------------------
+class ActionPlayer:
+    def __init__(self, model):
+        self.model = model
+        
+        # Frames
+        self.trajectories = iter([])
+        self.trajectory = None
+        self.interval = 0.02
+        self.index = 0
+        self.pacer = FramePacer(self.interval)
+
+        # Thread
+        self.thread = None
+        self.running = False
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.resume_event = threading.Event()
+        self.resume_event.set()
+
+        # Callbacks (called on the player thread)
+        self.frame_callback = None
+        self.finish_callback = None
+
+    def set_frame_callback(self, callback):
+        self.frame_callback = callback
+
+    def set_finish_callback(self, callback):
+        self.finish_callback = callback
+
+    def start(self, trajectory, interval):
+        self.start_stream(iter([trajectory]), interval)
+
+    def start_stream(self, trajectories, interval):
+        # Play CompiledTrajectory chunks from an iterator (pulled on the
+        # player thread, seek() moves within the current chunk)
+        self.stop()
+
+        self.trajectories = trajectories
+        self.trajectory = None
+        self.interval = interval
+        self.index = 0
+
+        self.stop_event.clear()
+        self.resume_event.set()
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.resume_event.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+    def pause(self):
+        self.resume_event.clear()
+
+    def resume(self):
+        self.resume_event.set()
+
+    def seek(self, index):
+        with self.lock:
+            self.index = min(max(index, 0), self.get_frame_cnt())
+
+    def is_running(self):
+        return self.running
+
+    def is_paused(self):
+        return self.is_running() and not self.resume_event.is_set()
+
+    def get_index(self):
+        return self.index
+
+    def get_frame_cnt(self):
+        if self.trajectory is None:
+            return 0
+        return self.trajectory.get_frame_cnt()
+
+    def get_pacer(self):
+        return self.pacer
+
+    def run(self):
+        try:
+            self.pacer.set_interval(self.interval)
+            self.pacer.reset()
+            for trajectory in self.trajectories:
+                with self.lock:
+                    self.trajectory = trajectory
+                    self.index = 0
+                if not self.play():
+                    break
+        except Exception as e:
+            print(f'Action Player Error - {e}')
+        finally:
+            self.running = False
+            if self.finish_callback is not None:
+                self.finish_callback()
+
+    def play(self):
+        # Play current trajectory (False if stopped)
+        while not self.stop_event.is_set():
+            # Wait while paused (re-anchor deadline on resume)
+            if not self.resume_event.is_set():
+                self.resume_event.wait()
+                self.pacer.start()
+            if self.stop_event.is_set():
+                return False
+
+            # Get next frame
+            with self.lock:
+                if self.index >= self.trajectory.get_frame_cnt():
+                    return True
+                index = self.index
+                self.index += 1
+
+            # Throttle while serial TX is backed up
+            self.model.wait_writable(self.interval)
+
+            # Rotate motor with pre-encoded frame
+            data = self.trajectory.get_frame(index)
+            if self.trajectory.is_tick is True:
+                self.model.set_ticks(data)
+            else:
+                self.model.set_angles(data)
+            self.model.rotate_data(self.trajectory.get_data(index), self.pacer.get_frame_time())
+
+            if self.frame_callback is not None:
+                self.frame_callback(index, data)
+
+            self.pacer.wait(self.stop_event)
+        return False
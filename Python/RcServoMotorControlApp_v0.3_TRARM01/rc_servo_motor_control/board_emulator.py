@@ -0,0 +1,371 @@
+# --------------------------------------------------------------------------------
+#   File        board_emulator.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Add protocol v2 delta frame
+#                   Keep previous byte only on read bytes (RcServoMotorControl.ino v0.2)
+#
+#               v0.3  2026.10.17  Tony Kwon
+#                   Add trajectory upload and board timer playback (RcServoMotorControl.ino v0.3)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import os
+import select
+import threading
+import time
+
+# --------------------------------------------------------------------------------
+#   Define (RcServoMotorControl.ino)
+# --------------------------------------------------------------------------------
+MOTOR_CH_MAX = 16
+MOTOR_PWM_INIT = 320
+
+RX_STATE_START = 0
+RX_STATE_COUNT = 1
+RX_STATE_DATA = 2
+RX_STATE_RUN = 3
+RX_STATE_SEQ = 4
+RX_STATE_DELTA = 5
+RX_STATE_CHUNK_SEQ = 6
+RX_STATE_CHUNK_COUNT = 7
+
+FRAME_V2 = 0xFE
+FRAME_UPLOAD = 0xFD
+FRAME_CONTROL = 0xFC
+FRAME_SEQ_MAX = 0x80
+
+FRAME_TYPE_FULL = 1
+FRAME_TYPE_DELTA = 2
+FRAME_TYPE_CHUNK = 3
+FRAME_TYPE_CONTROL = 4
+
+UPLOAD_BUF_SIZE = 384
+UPLOAD_ACK_PERIOD = 8
+
+CONTROL_CLEAR = 0x01
+CONTROL_PLAY = 0x02
+CONTROL_STOP = 0x03
+
+UPLOAD_STATE_PLAY = 0x01
+UPLOAD_STATE_UNDERRUN = 0x02
+
+# --------------------------------------------------------------------------------
+#   Class - BoardEmulator
+#
+#   Emulates the RcServoMotorControl.ino RX state machine on a Linux
+#   pseudo-terminal, so SerialComm can connect to get_port() like a real
+#   board. Every applied frame is recorded as (time, pwms) with
+#   time.perf_counter() time. Uploaded frames are played on the emulator
+#   thread, on perf_counter() instead of micros().
+# --------------------------------------------------------------------------------
+class BoardEmulator:
+    def __init__(self):
+        # RX state
+        self.rx_state = RX_STATE_START
+        self.rx_frame_type = FRAME_TYPE_FULL
+        self.rx_motor_cnt = 0
+        self.rx_data_cnt = 0
+        self.rx_data_size = 0
+        self.rx_data = bytearray(256)
+        self.rx_data_pre = 0x00
+        self.rx_seq = -1
+        self.rx_lost_cnt = 0
+        self.rx_chunk_seq = 0
+
+        # Upload playback
+        self.upload_buf = bytearray(UPLOAD_BUF_SIZE)
+        self.upload_motor_cnt = 0
+        self.upload_frame_max = 0
+        self.upload_head = 0
+        self.upload_cnt = 0
+        self.upload_seq = FRAME_SEQ_MAX - 1
+        self.upload_play = False
+        self.upload_underrun = False
+        self.upload_interval = 0.02
+        self.upload_time = 0.0
+        self.upload_played_cnt = 0
+
+        # Motor PWM
+        self.pwms = [MOTOR_PWM_INIT] * MOTOR_CH_MAX
+
+        # Record
+        self.lock = threading.Lock()
+        self.frames = []
+        self.rx_bytes = 0
+
+        # Pseudo-terminal
+        self.master_fd = None
+        self.slave_fd = None
+        self.port = None
+        self.thread = None
+        self.running = False
+
+    def open(self):
+        import tty
+
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.slave_fd)
+        self.port = os.ttyname(self.slave_fd)
+
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self.port
+
+    def close(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        for fd in (self.master_fd, self.slave_fd):
+            if fd is not None:
+                os.close(fd)
+        self.master_fd = None
+        self.slave_fd = None
+        self.port = None
+
+    def get_port(self):
+        return self.port
+
+    def write(self, data):
+        # Board -> host (dropped if not open)
+        if self.master_fd is not None:
+            os.write(self.master_fd, bytes(data))
+
+    def feed(self, data):
+        # Process bytes as if read back-to-back by loop()
+        for byte in data:
+            self.process_rx_state(byte, True)
+            if self.rx_state == RX_STATE_RUN:
+                # Next loop() pass does not read in 'Run' state
+                self.process_rx_state(0x00, False)
+        with self.lock:
+            self.rx_bytes += len(data)
+
+    def process_rx_state(self, data, is_read):
+        # 'Start' state
+        if self.rx_state == RX_STATE_START:
+            if is_read is True:
+                if self.rx_data_pre == 0xFF and data == 0xFF:
+                    self.rx_state = RX_STATE_COUNT
+
+        # 'Count' state
+        elif self.rx_state == RX_STATE_COUNT:
+            if is_read is True:
+                if data == FRAME_V2:
+                    self.rx_state = RX_STATE_SEQ
+                elif data == FRAME_UPLOAD:
+                    self.rx_state = RX_STATE_CHUNK_SEQ
+                elif data == FRAME_CONTROL:
+                    self.rx_frame_type = FRAME_TYPE_CONTROL
+                    self.rx_data_cnt = 0
+                    self.rx_data_size = 2
+                    self.rx_state = RX_STATE_DATA
+                elif data == 0xFF or data == 0x00 or data > MOTOR_CH_MAX:
+                    self.rx_state = RX_STATE_START
+                else:
+                    self.rx_frame_type = FRAME_TYPE_FULL
+                    self.rx_motor_cnt = data
+                    self.rx_data_cnt = 0
+                    self.rx_data_size = self.rx_motor_cnt * 2
+                    self.rx_state = RX_STATE_DATA
+
+        # 'Seq' state (v2)
+        elif self.rx_state == RX_STATE_SEQ:
+            if is_read is True:
+                if data >= FRAME_SEQ_MAX:
+                    self.rx_state = RX_STATE_START
+                else:
+                    if self.rx_seq >= 0 and data != (self.rx_seq + 1) % FRAME_SEQ_MAX:
+                        self.rx_lost_cnt += 1
+                    self.rx_seq = data
+                    self.rx_state = RX_STATE_DELTA
+
+        # 'Delta' count state (v2)
+        elif self.rx_state == RX_STATE_DELTA:
+            if is_read is True:
+                if data == 0x00 or data > MOTOR_CH_MAX:
+                    self.rx_state = RX_STATE_START
+                else:
+                    self.rx_frame_type = FRAME_TYPE_DELTA
+                    self.rx_motor_cnt = data
+                    self.rx_data_cnt = 0
+                    self.rx_data_size = self.rx_motor_cnt * 3
+                    self.rx_state = RX_STATE_DATA
+
+        # 'Chunk seq' state (upload)
+        elif self.rx_state == RX_STATE_CHUNK_SEQ:
+            if is_read is True:
+                if data >= FRAME_SEQ_MAX:
+                    self.rx_state = RX_STATE_START
+                else:
+                    self.rx_chunk_seq = data
+                    self.rx_state = RX_STATE_CHUNK_COUNT
+
+        # 'Chunk count' state (upload)
+        elif self.rx_state == RX_STATE_CHUNK_COUNT:
+            if is_read is True:
+                if data == 0x00 or self.upload_motor_cnt == 0 or data * self.upload_motor_cnt * 2 > len(self.rx_data):
+                    self.rx_state = RX_STATE_START
+                else:
+                    self.rx_frame_type = FRAME_TYPE_CHUNK
+                    self.rx_motor_cnt = data
+                    self.rx_data_cnt = 0
+                    self.rx_data_size = data * self.upload_motor_cnt * 2
+                    self.rx_state = RX_STATE_DATA
+
+        # 'Data' state
+        elif self.rx_state == RX_STATE_DATA:
+            if is_read is True:
+                if self.rx_data_pre == 0xFF and data == 0xFF:
+                    self.rx_state = RX_STATE_COUNT
+                else:
+                    self.rx_data[self.rx_data_cnt] = data
+                    self.rx_data_cnt += 1
+                    if self.rx_data_size <= self.rx_data_cnt:
+                        self.rx_state = RX_STATE_RUN
+
+        # 'Run' state
+        elif self.rx_state == RX_STATE_RUN:
+            if self.rx_frame_type == FRAME_TYPE_CHUNK:
+                self.process_upload_chunk(self.rx_chunk_seq, self.rx_motor_cnt)
+            elif self.rx_frame_type == FRAME_TYPE_CONTROL:
+                self.process_upload_control(self.rx_data[0], self.rx_data[1])
+            elif self.rx_frame_type == FRAME_TYPE_DELTA:
+                for i in range(self.rx_motor_cnt):
+                    ch = self.rx_data[i * 3]
+                    if ch < MOTOR_CH_MAX:
+                        self.pwms[ch] = (self.rx_data[(i * 3) + 1] << 8) + self.rx_data[(i * 3) + 2]
+            else:
+                for i in range(self.rx_motor_cnt):
+                    self.pwms[i] = (self.rx_data[i * 2] << 8) + self.rx_data[(i * 2) + 1]
+            if self.rx_frame_type in (FRAME_TYPE_FULL, FRAME_TYPE_DELTA):
+                with self.lock:
+                    self.frames.append((time.perf_counter(), tuple(self.pwms)))
+            self.rx_state = RX_STATE_START
+
+            # Frame end, a last 0xFF tick byte is not a start byte
+            self.rx_data_pre = 0x00
+
+        # Else
+        else:
+            self.rx_state = RX_STATE_START
+
+        if is_read is True:
+            self.rx_data_pre = data
+
+    def send_upload_ack(self):
+        upload_free = min(self.upload_frame_max - self.upload_cnt, 0xFE)
+        upload_state = 0x00
+        if self.upload_play is True:
+            upload_state |= UPLOAD_STATE_PLAY
+        if self.upload_underrun is True:
+            upload_state |= UPLOAD_STATE_UNDERRUN
+        self.write((0xFF, 0xFF, FRAME_UPLOAD, self.upload_seq, upload_free, upload_state))
+
+    def process_upload_chunk(self, seq, frame_cnt):
+        # Accept next chunk only (duplicates and gaps are acknowledged with last seq)
+        if seq == (self.upload_seq + 1) % FRAME_SEQ_MAX and frame_cnt <= self.upload_frame_max - self.upload_cnt:
+            frame_size = self.upload_motor_cnt * 2
+            for i in range(frame_cnt):
+                index = ((self.upload_head + self.upload_cnt) % self.upload_frame_max) * frame_size
+                self.upload_buf[index:index + frame_size] = self.rx_data[i * frame_size:(i + 1) * frame_size]
+                self.upload_cnt += 1
+            self.upload_seq = seq
+        self.send_upload_ack()
+
+    def process_upload_control(self, cmd, arg):
+        if cmd == CONTROL_CLEAR:
+            if 0 < arg <= MOTOR_CH_MAX:
+                self.upload_motor_cnt = arg
+                self.upload_frame_max = UPLOAD_BUF_SIZE // (self.upload_motor_cnt * 2)
+            self.upload_head = 0
+            self.upload_cnt = 0
+            self.upload_seq = FRAME_SEQ_MAX - 1
+            self.upload_play = False
+            self.upload_underrun = False
+            self.upload_played_cnt = 0
+        elif cmd == CONTROL_PLAY:
+            if arg > 0:
+                self.upload_interval = arg / 1000
+            self.upload_play = True
+            self.upload_time = time.perf_counter()
+        elif cmd == CONTROL_STOP:
+            self.upload_play = False
+            self.upload_head = 0
+            self.upload_cnt = 0
+        self.send_upload_ack()
+
+    def process_upload_play(self):
+        if self.upload_play is False:
+            return
+
+        now = time.perf_counter()
+        if now - self.upload_time < self.upload_interval:
+            return
+
+        # Empty buffer, hold the last frame and restart timing on the next chunk
+        if self.upload_cnt == 0:
+            self.upload_underrun = True
+            self.upload_time = now
+            return
+        self.upload_time += self.upload_interval
+
+        index = self.upload_head * self.upload_motor_cnt * 2
+        for i in range(self.upload_motor_cnt):
+            self.pwms[i] = (self.upload_buf[index + (i * 2)] << 8) + self.upload_buf[index + (i * 2) + 1]
+        with self.lock:
+            self.frames.append((now, tuple(self.pwms)))
+        self.upload_head = (self.upload_head + 1) % self.upload_frame_max
+        self.upload_cnt -= 1
+        self.upload_played_cnt += 1
+
+        if self.upload_played_cnt % UPLOAD_ACK_PERIOD == 0 or self.upload_cnt == 0:
+            self.send_upload_ack()
+
+    def get_upload_cnt(self):
+        # Buffered upload frames
+        return self.upload_cnt
+
+    def get_pwms(self):
+        return list(self.pwms)
+
+    def get_frames(self):
+        with self.lock:
+            return list(self.frames)
+
+    def get_frame_cnt(self):
+        return len(self.frames)
+
+    def get_lost_cnt(self):
+        # v2 sequence gaps
+        return self.rx_lost_cnt
+
+    def get_rx_bytes(self):
+        return self.rx_bytes
+
+    def clear(self):
+        with self.lock:
+            self.frames = []
+            self.rx_bytes = 0
+
+    def run(self):
+        while self.running:
+            # Wake up for the next upload frame while playing
+            timeout = 0.05
+            if self.upload_play is True:
+                timeout = min(max(self.upload_time + self.upload_interval - time.perf_counter(), 0.0), timeout)
+            readable, _, _ = select.select([self.master_fd], [], [], timeout)
+            if readable:
+                try:
+                    data = os.read(self.master_fd, 4096)
+                except OSError:
+                    break
+                self.feed(data)
+            self.process_upload_play()
@@ -0,0 +1,57 @@
+# --------------------------------------------------------------------------------
+#   File        config.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision (from rc_servo_motor_control_cli.py)
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Load action in ticks and tick step (same as the GUI)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import json
+import os
+
+from .rc_servo_motor_control_model import RcServoMotor, RcServoMotorControlModel
+from .trajectory_file import TrajectoryFile
+
+# --------------------------------------------------------------------------------
+#   Function - Config.json, Action.json for headless tools
+# --------------------------------------------------------------------------------
+def load_config(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    model = RcServoMotorControlModel()
+    for i in range(config['motor_cnt']):
+        limits = config['motor_limits'][i] if 'motor_limits' in config else None
+        model.add_motor(RcServoMotor(config['motor_ticks'][i], config['motor_angles'][i], limits))
+    model.set_protocol(config.get('protocol', 1))
+    return model, config
+
+def load_action(path, model, step=None):
+    # Action.json or trajectory file (.trj) -> ticks and tick step
+    # (step None: 5 tick or 1 angle)
+    file = TrajectoryFile()
+    if os.path.splitext(path)[1].lower() == '.json':
+        data, _, is_tick = file.load_json(path)
+    else:
+        data, _, is_tick = file.load(path)
+
+    # Angle action is converted once on load and run in ticks like the GUI
+    if step is None:
+        step = 5 if is_tick else 1
+    if is_tick is False:
+        data = model.convert_angles_to_ticks(data)
+        step = model.convert_angle_step_to_ticks(step)
+    return data, step
+
+def get_port(port, config):
+    # Port argument or config port, None (dry run) if 'none' or ''
+    if port is None:
+        port = config.get('port')
+    if port is None or port.strip().lower() in ('', 'none'):
+        return None
+    return port
@@ -0,0 +1,217 @@
+# --------------------------------------------------------------------------------
+#   File        fleet_controller.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Pass shared deadline to rotate_data() (telemetry)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from .frame_pacer import FramePacer
+
+# --------------------------------------------------------------------------------
+#   Class - FleetArm
+#
+#   One arm of the fleet (model with its own SerialComm) and its statistics.
+#   lag is the write time of a frame minus its shared deadline.
+# --------------------------------------------------------------------------------
+class FleetArm:
+    def __init__(self, name, model):
+        self.name = name
+        self.model = model
+        self.reset()
+
+    def reset(self):
+        self.frame_cnt = 0
+        self.skipped_cnt = 0
+        self.lag_sum = 0.0
+        self.lag_max = 0.0
+        self.start_time = 0.0
+        self.end_time = 0.0
+        self.sent_bytes = self.model.comm.get_sent_bytes()
+        self.dropped_cnt = self.model.comm.get_dropped_cnt()
+
+    def get_name(self):
+        return self.name
+
+    def get_model(self):
+        return self.model
+
+    def add_frame(self, lag):
+        self.frame_cnt += 1
+        self.lag_sum += lag
+        self.lag_max = max(self.lag_max, lag)
+
+    def get_frame_cnt(self):
+        return self.frame_cnt
+
+    def get_skipped_cnt(self):
+        return self.skipped_cnt
+
+    def get_lag_mean(self):
+        if self.frame_cnt == 0:
+            return 0.0
+        return self.lag_sum / self.frame_cnt
+
+    def get_lag_max(self):
+        return self.lag_max
+
+    def get_elapsed(self):
+        end_time = self.end_time if self.end_time > 0 else time.perf_counter()
+        return max(end_time - self.start_time, 0.0)
+
+    def get_sent_bytes(self):
+        return self.model.comm.get_sent_bytes() - self.sent_bytes
+
+    def get_dropped_cnt(self):
+        return self.model.comm.get_dropped_cnt() - self.dropped_cnt
+
+    def get_stats(self):
+        elapsed = self.get_elapsed()
+        return {
+            'frames': self.frame_cnt,
+            'skipped': self.skipped_cnt,
+            'dropped': self.get_dropped_cnt(),
+            'bytes': self.get_sent_bytes(),
+            'elapsed': elapsed,
+            'frame_rate': self.frame_cnt / elapsed if elapsed > 0 else 0.0,
+            'byte_rate': self.get_sent_bytes() / elapsed if elapsed > 0 else 0.0,
+            'lag_mean': self.get_lag_mean(),
+            'lag_max': self.lag_max,
+        }
+
+# --------------------------------------------------------------------------------
+#   Class - FleetController
+#
+#   Plays trajectories on N arms in parallel (one pool worker per arm).
+#   All arms share one time base: frame k of every arm is due at
+#   start_time + k * interval. An arm more than a frame late skips frames
+#   (within its current chunk) instead of drifting behind the others.
+# --------------------------------------------------------------------------------
+class FleetController:
+    def __init__(self, spin_time=0.002):
+        self.arms = {}
+        self.spin_time = spin_time
+
+        # Thread pool
+        self.executor = None
+        self.futures = []
+        self.stop_event = threading.Event()
+        self.start_time = 0.0
+
+    def add_arm(self, name, model):
+        if name in self.arms:
+            raise ValueError(f'Arm {name} already exists')
+        self.arms[name] = FleetArm(name, model)
+        return self.arms[name]
+
+    def remove_arm(self, name):
+        self.arms.pop(name)
+
+    def get_arm(self, name):
+        return self.arms[name]
+
+    def get_arm_names(self):
+        return list(self.arms.keys())
+
+    def connect(self, ports):
+        # ports: {name: (port, baud)}, returns names that failed to connect
+        failed = []
+        for name, (port, baud) in ports.items():
+            model = self.arms[name].get_model()
+            model.connect(port, baud)
+            if not model.connected:
+                failed.append(name)
+        return failed
+
+    def disconnect(self):
+        for arm in self.arms.values():
+            model = arm.get_model()
+            if model.connected:
+                model.comm.flush()
+                model.disconnect()
+
+    def start(self, trajectories, interval, start_delay=0.05):
+        # trajectories: {name: CompiledTrajectory or iterator of chunks}
+        self.stop()
+
+        self.stop_event.clear()
+        self.start_time = time.perf_counter() + start_delay
+        self.executor = ThreadPoolExecutor(max_workers=max(len(trajectories), 1),
+                                           thread_name_prefix='fleet')
+        self.futures = []
+        for name, trajectory in trajectories.items():
+            if hasattr(trajectory, 'get_frame_cnt'):
+                trajectory = iter([trajectory])
+            arm = self.arms[name]
+            arm.reset()
+            self.futures.append(self.executor.submit(self.run, arm, trajectory, interval))
+
+    def wait(self, timeout=None):
+        # Wait until all arms finish (False on timeout, arm errors re-raised)
+        done, not_done = wait(self.futures, timeout)
+        for future in done:
+            future.result()
+        return len(not_done) == 0
+
+    def stop(self):
+        self.stop_event.set()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+        self.executor = None
+
+    def is_running(self):
+        return any(not future.done() for future in self.futures)
+
+    def get_start_time(self):
+        return self.start_time
+
+    def get_stats(self):
+        return {name: arm.get_stats() for name, arm in self.arms.items()}
+
+    def run(self, arm, trajectories, interval):
+        model = arm.get_model()
+        pacer = FramePacer(interval, self.spin_time)
+        arm.start_time = self.start_time
+        tick = 0
+        try:
+            for trajectory in trajectories:
+                index = 0
+                frame_cnt = trajectory.get_frame_cnt()
+                while index < frame_cnt:
+                    # Wait for shared deadline of this frame
+                    deadline = self.start_time + tick * interval
+                    if not pacer.wait_until(deadline, self.stop_event):
+                        return
+
+                    # Skip late frames (keep the last frame of the chunk)
+                    late = int((time.perf_counter() - deadline) / interval)
+                    skip = min(late, frame_cnt - 1 - index)
+                    if skip > 0:
+                        index += skip
+                        tick += skip
+                        arm.skipped_cnt += skip
+                        deadline = self.start_time + tick * interval
+
+                    # Rotate motor with pre-encoded frame
+                    model.wait_writable(interval)
+                    data = trajectory.get_frame(index)
+                    if trajectory.is_tick is True:
+                        model.set_ticks(data)
+                    else:
+                        model.set_angles(data)
+                    model.rotate_data(trajectory.get_data(index), deadline)
+                    arm.add_frame(time.perf_counter() - deadline)
+
+                    index += 1
+                    tick += 1
+        finally:
+            arm.end_time = time.perf_counter()
@@ -0,0 +1,196 @@
+# --------------------------------------------------------------------------------
+#   File        forward_kinematics.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Add convert_angles_to_ticks() and get_angle_limits() functions
+#
+#               v0.3  2026.10.17  Tony Kwon
+#                   Add set_calibration() and get_params() functions (process pool)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import numpy as np
+
+# --------------------------------------------------------------------------------
+#   Define
+#
+#   TRARM01 dimensions [mm] (STL/Aseemble, all joint angles 0)
+#       Base        100x100x20 bottom + 100x100x10 top, motor 1 axis at x = y = 0
+#       Link1       R80 turntable on the base, motor 2 axis 70 above the base
+#       Link2       100x40, motor 2 axis to motor 3 axis (vertical at 0)
+#       Link3       100x40, motor 3 axis to tip hole (horizontal +x at 0)
+#   Motor 1 turns about +z, motors 2 and 3 about +y (+angle leans forward/down).
+# --------------------------------------------------------------------------------
+TRARM01_BASE_HEIGHT = 30.0
+TRARM01_LINK1_HEIGHT = 70.0
+TRARM01_LINK2_LENGTH = 100.0
+TRARM01_LINK3_LENGTH = 100.0
+
+LINK_NAMES = ['Link1', 'Link2', 'Link3', 'Tool']
+
+# --------------------------------------------------------------------------------
+#   Class - ForwardKinematics
+#
+#   Maps (frames x 3) joint angles [deg] to tool positions and link frames
+#   [mm] in one numpy call. Ticks are mapped to angles with the motor
+#   calibration (tick/angle min-max) in float, not through the integer
+#   lookup tables.
+# --------------------------------------------------------------------------------
+class ForwardKinematics:
+    def __init__(self, model=None, base_height=TRARM01_BASE_HEIGHT, link1_height=TRARM01_LINK1_HEIGHT,
+                 link2_length=TRARM01_LINK2_LENGTH, link3_length=TRARM01_LINK3_LENGTH, signs=(1, 1, 1),
+                 calibration=None):
+        self.base_height = base_height
+        self.link1_height = link1_height
+        self.link2_length = link2_length
+        self.link3_length = link3_length
+        self.signs = np.radians(np.array(signs, dtype=float))
+
+        # Calibration (angle = tick * scale + offset)
+        self.model = None
+        self.calibration = None
+        if model is not None:
+            self.set_model(model)
+        elif calibration is not None:
+            self.set_calibration(*calibration)
+
+    def set_model(self, model):
+        if model.get_motor_cnt() != 3:
+            raise ValueError(f'TRARM01 has 3 motors, not {model.get_motor_cnt()}')
+        self.model = model
+        self.set_calibration([model.get_tick_min(i) for i in range(3)],
+                             [model.get_tick_max(i) for i in range(3)],
+                             [model.get_angle_min(i) for i in range(3)],
+                             [model.get_angle_max(i) for i in range(3)])
+
+    def set_calibration(self, tick_mins, tick_maxs, angle_mins, angle_maxs):
+        # Motor tick/angle min-max without a model (e.g. in a worker process)
+        self.calibration = [list(tick_mins), list(tick_maxs), list(angle_mins), list(angle_maxs)]
+        self.tick_mins = np.array(tick_mins, dtype=float)
+        self.tick_maxs = np.array(tick_maxs, dtype=float)
+        angle_mins = np.array(angle_mins, dtype=float)
+        angle_maxs = np.array(angle_maxs, dtype=float)
+        self.scale = (angle_maxs - angle_mins) / (self.tick_maxs - self.tick_mins)
+        self.offset = angle_mins - self.tick_mins * self.scale
+
+    def get_params(self):
+        # Picklable dimensions and calibration, ForwardKinematics(**params)
+        return {
+            'base_height': self.base_height,
+            'link1_height': self.link1_height,
+            'link2_length': self.link2_length,
+            'link3_length': self.link3_length,
+            'signs': np.sign(self.signs).tolist(),
+            'calibration': self.calibration,
+        }
+
+    def get_shoulder_height(self):
+        # Motor 2 axis height
+        return self.base_height + self.link1_height
+
+    def convert_ticks_to_angles(self, ticks):
+        # (frames x 3) ticks -> (frames x 3) float angles [deg]
+        if self.calibration is None:
+            raise ValueError('No tick calibration')
+        ticks = np.clip(np.asarray(ticks, dtype=float), self.tick_mins, self.tick_maxs)
+        return ticks * self.scale + self.offset
+
+    def convert_angles_to_ticks(self, angles):
+        # (frames x 3) angles [deg] -> (frames x 3) float ticks (not clipped)
+        if self.calibration is None:
+            raise ValueError('No tick calibration')
+        return (np.asarray(angles, dtype=float) - self.offset) / self.scale
+
+    def get_angle_limits(self):
+        # Angles at tick_min/tick_max, (3 mins, 3 maxs)
+        limits = self.convert_ticks_to_angles(np.array([self.tick_mins, self.tick_maxs]))
+        return limits.min(axis=0), limits.max(axis=0)
+
+    def get_joint_radians(self, angles):
+        angles = np.asarray(angles, dtype=float)
+        if angles.shape[-1] != 3:
+            raise ValueError(f'Joint angles need 3 columns, not {angles.shape[-1]}')
+        q = angles * self.signs
+        return q[..., 0], q[..., 1], q[..., 2]
+
+    def get_positions(self, angles):
+        # (frames x 3) angles -> (frames x 3) tool positions
+        q1, q2, q3 = self.get_joint_radians(angles)
+        q23 = q2 + q3
+        r = self.link2_length * np.sin(q2) + self.link3_length * np.cos(q23)
+        positions = np.empty(q1.shape + (3,))
+        positions[..., 0] = r * np.cos(q1)
+        positions[..., 1] = r * np.sin(q1)
+        positions[..., 2] = self.get_shoulder_height() + self.link2_length * np.cos(q2) - self.link3_length * np.sin(q23)
+        return positions
+
+    def get_positions_from_ticks(self, ticks):
+        return self.get_positions(self.convert_ticks_to_angles(ticks))
+
+    def get_joint_positions(self, angles):
+        # (frames x 3) angles -> (frames x 4 x 3) motor 1, 2, 3 axis and tool positions
+        q1, q2, q3 = self.get_joint_radians(angles)
+        c1 = np.cos(q1)
+        s1 = np.sin(q1)
+        r2 = self.link2_length * np.sin(q2)
+        z2 = self.get_shoulder_height() + self.link2_length * np.cos(q2)
+        r3 = r2 + self.link3_length * np.cos(q2 + q3)
+        z3 = z2 - self.link3_length * np.sin(q2 + q3)
+
+        positions = np.zeros(q1.shape + (4, 3))
+        positions[..., 0, 2] = self.base_height
+        positions[..., 1, 2] = self.get_shoulder_height()
+        positions[..., 2, 0] = r2 * c1
+        positions[..., 2, 1] = r2 * s1
+        positions[..., 2, 2] = z2
+        positions[..., 3, 0] = r3 * c1
+        positions[..., 3, 1] = r3 * s1
+        positions[..., 3, 2] = z3
+        return positions
+
+    def get_link_frames(self, angles):
+        # (frames x 3) angles -> (frames x 4 x 4 x 4) homogeneous transforms
+        # of Link1, Link2, Link3 and Tool (LINK_NAMES) in base coordinates
+        q1, q2, q3 = self.get_joint_radians(angles)
+        c1 = np.cos(q1)
+        s1 = np.sin(q1)
+        frames = np.zeros(q1.shape + (4, 4, 4))
+
+        # Link1 = Rz(q1)
+        frames[..., 0, 0, 0] = c1
+        frames[..., 0, 0, 1] = -s1
+        frames[..., 0, 1, 0] = s1
+        frames[..., 0, 1, 1] = c1
+        frames[..., 0, 2, 2] = 1.0
+
+        # Link2 = Rz(q1) Ry(q2), Link3 and Tool = Rz(q1) Ry(q2 + q3)
+        for link, q in ((1, q2), (2, q2 + q3), (3, q2 + q3)):
+            c = np.cos(q)
+            s = np.sin(q)
+            frames[..., link, 0, 0] = c1 * c
+            frames[..., link, 0, 1] = -s1
+            frames[..., link, 0, 2] = c1 * s
+            frames[..., link, 1, 0] = s1 * c
+            frames[..., link, 1, 1] = c1
+            frames[..., link, 1, 2] = s1 * s
+            frames[..., link, 2, 0] = -s
+            frames[..., link, 2, 2] = c
+
+        # Origins (motor axes and tool)
+        frames[..., :, 3, 3] = 1.0
+        frames[..., :, 0:3, 3] = self.get_joint_positions(angles)
+        return frames
+
+    def get_path_length(self, positions):
+        # Tool path length of (frames x 3) positions
+        return float(np.linalg.norm(np.diff(positions, axis=0), axis=1).sum())
+
+    def get_reach(self, positions):
+        # Tool distance from motor 2 axis (min, max) and bounding box (min xyz, max xyz)
+        distance = np.linalg.norm(positions - [0.0, 0.0, self.get_shoulder_height()], axis=1)
+        return (float(distance.min()), float(distance.max())), (positions.min(axis=0), positions.max(axis=0))
@@ -0,0 +1,151 @@
+# --------------------------------------------------------------------------------
+#   File        frame_encoder.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Add DeltaFrameEncoder (protocol v2)
+#
+#               v0.3  2026.10.17  Tony Kwon
+#                   Add UploadFrameEncoder (trajectory upload)
+#
+#               v0.4  2026.10.17  Tony Kwon
+#                   Pack encode() frame from the ticks in one call and return bytes (no shared buffer)
+#                   Raise ValueError for control arg out of range (was clamped)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import struct
+import numpy as np
+
+# --------------------------------------------------------------------------------
+#   Define
+# --------------------------------------------------------------------------------
+FRAME_START = 0xFF
+FRAME_V2 = 0xFE
+FRAME_UPLOAD = 0xFD
+FRAME_CONTROL = 0xFC
+FRAME_SEQ_MAX = 0x80
+
+CONTROL_CLEAR = 0x01        # arg: motor count
+CONTROL_PLAY = 0x02         # arg: interval [ms]
+CONTROL_STOP = 0x03
+CONTROL_ARG_MAX = 0xFE      # 0xFF would start a frame
+
+# --------------------------------------------------------------------------------
+#   Class - FrameEncoder
+#
+#   Frame   0xFF 0xFF count (tick_hi tick_lo) * count
+# --------------------------------------------------------------------------------
+class FrameEncoder:
+    def __init__(self, motor_cnt):
+        self.motor_cnt = motor_cnt
+
+        # Single frame layout
+        self.layout = struct.Struct(f'>BBB{motor_cnt}H')
+
+        # Batch frame layout
+        self.dtype = np.dtype([('header', 'u1', (3,)), ('ticks', '>u2', (motor_cnt,))])
+
+    def get_motor_cnt(self):
+        return self.motor_cnt
+
+    def get_frame_size(self):
+        return self.layout.size
+
+    def encode(self, ticks):
+        # ticks: sequence of motor_cnt ticks
+        return self.layout.pack(FRAME_START, FRAME_START, self.motor_cnt, *ticks)
+
+    def encode_array(self, ticks_array):
+        # (frames x motors) ticks -> contiguous frame bytes
+        ticks_array = np.asarray(ticks_array).reshape(-1, self.motor_cnt)
+        frames = np.empty(len(ticks_array), dtype=self.dtype)
+        frames['header'] = (FRAME_START, FRAME_START, self.motor_cnt)
+        frames['ticks'] = ticks_array
+        return frames.tobytes()
+
+# --------------------------------------------------------------------------------
+#   Class - DeltaFrameEncoder
+#
+#   Frame v2    0xFF 0xFF 0xFE seq count (ch tick_hi tick_lo) * count
+#
+#   Converts full frames to v2 frames with only the channels changed since
+#   the last converted frame. Conversion runs at TX time, so coalesced
+#   (never written) frames do not break the delta chain.
+#   A full frame is kept first, every key_interval frames (refresh after a
+#   lost frame) and when the v2 frame would not be smaller.
+# --------------------------------------------------------------------------------
+class DeltaFrameEncoder:
+    def __init__(self, motor_cnt, key_interval=50):
+        self.motor_cnt = motor_cnt
+        self.key_interval = key_interval
+        self.layout = struct.Struct(f'>{motor_cnt}H')
+        self.frame_size = 3 + self.layout.size
+
+        # Delta state
+        self.ticks_pre = None
+        self.seq = 0
+        self.frame_cnt = 0
+
+    def reset(self):
+        # Next frame is a full frame
+        self.ticks_pre = None
+
+    def get_seq(self):
+        return self.seq
+
+    def convert(self, data):
+        # Full frame -> v2 frame, full frame or b'' (nothing changed)
+        if len(data) != self.frame_size or data[2] != self.motor_cnt:
+            self.reset()
+            return data
+        ticks = self.layout.unpack_from(data, 3)
+        ticks_pre = self.ticks_pre
+        self.ticks_pre = ticks
+
+        # Key frame
+        is_key = self.frame_cnt % self.key_interval == 0
+        self.frame_cnt += 1
+        if ticks_pre is None or is_key:
+            return data
+
+        # Changed channels
+        changed = [i for i in range(self.motor_cnt) if ticks[i] != ticks_pre[i]]
+        if len(changed) == 0:
+            return b''
+        if 5 + len(changed) * 3 >= self.frame_size:
+            return data
+
+        frame = bytearray((FRAME_START, FRAME_START, FRAME_V2, self.seq, len(changed)))
+        for i in changed:
+            frame += bytes((i, ticks[i] >> 8, ticks[i] & 0xFF))
+        self.seq = (self.seq + 1) % FRAME_SEQ_MAX
+        return bytes(frame)
+
+# --------------------------------------------------------------------------------
+#   Class - UploadFrameEncoder
+#
+#   Chunk       0xFF 0xFF 0xFD seq count (tick_hi tick_lo) * motor_cnt * count
+#   Control     0xFF 0xFF 0xFC cmd arg
+# --------------------------------------------------------------------------------
+class UploadFrameEncoder:
+    def __init__(self, motor_cnt):
+        self.motor_cnt = motor_cnt
+
+    def get_chunk_frame_max(self):
+        # Board RX buffer is 256 bytes
+        return 256 // (self.motor_cnt * 2)
+
+    def encode_chunk(self, seq, ticks_array):
+        ticks_array = np.asarray(ticks_array).reshape(-1, self.motor_cnt)
+        header = bytes((FRAME_START, FRAME_START, FRAME_UPLOAD, seq, len(ticks_array)))
+        return header + ticks_array.astype('>u2').tobytes()
+
+    def encode_control(self, cmd, arg=0):
+        if not 0 <= arg <= CONTROL_ARG_MAX:
+            raise ValueError(f'Control arg {arg} out of 0~{CONTROL_ARG_MAX}')
+        return bytes((FRAME_START, FRAME_START, FRAME_CONTROL, cmd, arg))
@@ -0,0 +1,102 @@
+# --------------------------------------------------------------------------------
+#   File        frame_pacer.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Add start_time to start() and wait_until() function
+#                   Add get_frame_time() function
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import time
+
+# --------------------------------------------------------------------------------
+#   Class - FramePacer
+# --------------------------------------------------------------------------------
+class FramePacer:
+    def __init__(self, interval, spin_time=0.002):
+        self.interval = interval
+        self.spin_time = spin_time
+        self.deadline = 0.0
+
+        # Statistics
+        self.frame_cnt = 0
+        self.missed_cnt = 0
+        self.jitter_sum = 0.0
+        self.jitter_max = 0.0
+
+    def set_interval(self, interval):
+        self.interval = interval
+
+    def start(self, start_time=None):
+        # Anchor next deadline to the monotonic clock (or a shared start_time)
+        if start_time is None:
+            start_time = time.perf_counter()
+        self.deadline = start_time + self.interval
+
+    def reset(self):
+        self.frame_cnt = 0
+        self.missed_cnt = 0
+        self.jitter_sum = 0.0
+        self.jitter_max = 0.0
+        self.start()
+
+    def wait(self, stop_event=None):
+        now = time.perf_counter()
+        if now > self.deadline:
+            self.missed_cnt += 1
+        if not self.wait_until(self.deadline, stop_event):
+            return False
+
+        # Update statistics
+        now = time.perf_counter()
+        jitter = now - self.deadline
+        self.frame_cnt += 1
+        self.jitter_sum += jitter
+        self.jitter_max = max(self.jitter_max, jitter)
+
+        # Set next deadline
+        #   Late by more than a frame: re-anchor instead of bursting
+        #   frames to catch up
+        if jitter > self.interval:
+            self.deadline = now + self.interval
+        else:
+            self.deadline += self.interval
+        return True
+
+    def wait_until(self, deadline, stop_event=None):
+        # Coarse sleep until spin window
+        remain = deadline - time.perf_counter() - self.spin_time
+        if remain > 0:
+            if stop_event is not None:
+                if stop_event.wait(remain):
+                    return False
+            else:
+                time.sleep(remain)
+
+        # Spin until deadline
+        while time.perf_counter() < deadline:
+            time.sleep(0)
+        return True
+
+    def get_frame_time(self):
+        # Scheduled time of the frame before the next wait()
+        return self.deadline - self.interval
+
+    def get_frame_cnt(self):
+        return self.frame_cnt
+
+    def get_missed_cnt(self):
+        return self.missed_cnt
+
+    def get_jitter_mean(self):
+        if self.frame_cnt == 0:
+            return 0.0
+        return self.jitter_sum / self.frame_cnt
+
+    def get_jitter_max(self):
+        return self.jitter_max
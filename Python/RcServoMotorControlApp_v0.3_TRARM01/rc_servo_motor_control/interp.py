@@ -3,12 +3,16 @@
 #
 #   Version     v0.1  2025.11.14  Tony Kwon
 #                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Add get_interp_array() function
+#                   Vectorize get_interp_lists() and get_interp_list()
 # --------------------------------------------------------------------------------
 
 # --------------------------------------------------------------------------------
 #   Import
 # --------------------------------------------------------------------------------
-import copy
+import numpy as np
 
 # --------------------------------------------------------------------------------
 #   Class - Interp
@@ -16,33 +20,37 @@ import copy
 class Interp:
 
     def get_interp_lists(self, arrs, step):
-        arr_list = []
-        arr_list.append(arrs[0])     
-        for i in range(len(arrs) - 1):
-            arr_list.extend(self.get_interp_list(arrs[i], arrs[i + 1], step))
-        return arr_list
+        return self.get_interp_array(arrs, step).tolist()
 
     def get_interp_list(self, arr1, arr2, step):
-        arr_list = []
-        arr1 = copy.copy(arr1)
-        arr2 = copy.copy(arr2)
-        cnt = int(self.get_max_value(arr1, arr2) / step)
-        for j in range(cnt):
-            arr = []
-            for i in range(len(arr1)):
-                if arr1[i] < arr2[i]:
-                    if arr1[i] < (arr2[i] + step):
-                        arr.append(arr1[i] + step)
-                    else:
-                        arr.append(arr2[i])
-                else:
-                    if (arr1[i] - step) > arr2[i]:
-                        arr.append(arr1[i] - step)
-                    else:
-                        arr.append(arr2[i])
-                arr1[i] = arr[i]
-            arr_list.append(arr)
-        return arr_list
+        return self.get_interp_array([arr1, arr2], step)[1:].tolist()
+
+    def get_interp_array(self, arrs, step):
+        # (N poses x M joints) keyframes -> (frames x M joints) trajectory
+        arrs = np.asarray(arrs)
+        starts = arrs[:-1]
+        ends = arrs[1:]
+
+        # Frame count per segment (same truncation as int(max / step))
+        cnts = (np.abs(ends - starts).max(axis=1, initial=0) / step).astype(np.int64)
+        total = int(cnts.sum())
+
+        # Segment index and step number of every interpolated frame
+        seg = np.repeat(np.arange(len(cnts)), cnts)
+        offsets = np.cumsum(cnts) - cnts
+        k = (np.arange(total) - np.repeat(offsets, cnts) + 1)[:, None]
+
+        # Step each joint toward the target, then hold the target value
+        #   rising : a + k * step while the previous frame is below the target
+        #            (the last step may overshoot by less than one step)
+        #   falling: a - k * step while above the target
+        a = starts[seg]
+        b = ends[seg]
+        rise = np.where(a + (k - 1) * step < b, a + k * step, b)
+        fall = np.maximum(a - k * step, b)
+        frames = np.where(a < b, rise, fall)
+
+        return np.concatenate((arrs[:1], frames))
 
     def get_max_value(self, arr1, arr2):
         diffs = [abs(x - y) for x, y in zip(arr1, arr2)]
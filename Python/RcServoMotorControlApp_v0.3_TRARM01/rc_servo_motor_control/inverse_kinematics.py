@@ -0,0 +1,234 @@
+# --------------------------------------------------------------------------------
+#   File        inverse_kinematics.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Search nearest reachable point over the joint limits (grid + pattern search)
+#                   Key cache by warm start ticks
+#                   Add is_reachable() (joint angles before tick rounding within tolerance)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+from collections import OrderedDict
+import numpy as np
+
+from .forward_kinematics import ForwardKinematics
+
+# --------------------------------------------------------------------------------
+#   Define
+# --------------------------------------------------------------------------------
+IK_BRANCH_CNT = 4       # (base front, base back) x (elbow +, elbow -)
+
+IK_GRID_CNT = 37        # Motor 2, 3 coarse grid points over the limits
+IK_MIN_STEP = 0.01      # Pattern search end step [deg]
+
+IK_ROUND_CORNERS = np.array([[i >> 2 & 1, i >> 1 & 1, i & 1] for i in range(8)])     # Floor/ceil of 3 ticks
+
+# --------------------------------------------------------------------------------
+#   Class - InverseKinematics
+#
+#   Cartesian tool targets [mm] -> TRARM01 joint ticks within tick_min/max.
+#   All closed form branches are computed in one numpy call and clipped to
+#   the joint limits. The branch closest to the warm start (last solution)
+#   is taken among the ones that reach the target. Targets out of reach
+#   within the limits are searched for the nearest reachable point: motor 1
+#   toward the target (front or back), motors 2 and 3 over a coarse grid of
+#   the limits then a pattern search, rounded to the nearest ticks.
+#   Single targets are memoized (LRU) by target (resolution [mm]) and warm
+#   start ticks.
+# --------------------------------------------------------------------------------
+class InverseKinematics:
+    def __init__(self, model, fk=None, tolerance=0.5, resolution=0.1, cache_size=1024, max_iter=200):
+        self.model = model
+        self.fk = fk if fk is not None else ForwardKinematics(model)
+        self.tolerance = tolerance
+        self.resolution = resolution
+        self.max_iter = max_iter
+        self.angle_mins, self.angle_maxs = self.fk.get_angle_limits()
+        self.tick_mins = np.array([model.get_tick_min(i) for i in range(3)])
+        self.tick_maxs = np.array([model.get_tick_max(i) for i in range(3)])
+        self.signs = np.sign(self.fk.signs)
+
+        # Warm start
+        self.angles = np.zeros(3)
+        self.branch = 0
+
+        # Cache
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.hit_cnt = 0
+        self.miss_cnt = 0
+
+        # Result
+        self.errors = np.zeros(0)
+        self.reachables = np.zeros(0, dtype=bool)
+
+    def set_warm_start(self, ticks):
+        # Start from current joint ticks (e.g. model ticks before a Cartesian move)
+        self.angles = self.fk.convert_ticks_to_angles(ticks)
+        candidates, _ = self.get_candidates(self.fk.get_positions(self.angles)[None])
+        self.branch = int(np.abs(candidates[0] - self.angles).sum(axis=1).argmin())
+
+    def clear(self):
+        self.cache.clear()
+        self.hit_cnt = 0
+        self.miss_cnt = 0
+
+    def get_hit_cnt(self):
+        return self.hit_cnt
+
+    def get_miss_cnt(self):
+        return self.miss_cnt
+
+    def get_error(self):
+        # Tool position error [mm] of the last solve()
+        return float(self.errors[-1]) if len(self.errors) > 0 else 0.0
+
+    def get_errors(self):
+        # Tool position errors [mm] of the last solve_array()
+        return self.errors
+
+    def is_reachable(self):
+        # Target of the last solve() reached within tolerance (before tick rounding)
+        return bool(self.reachables[-1]) if len(self.reachables) > 0 else True
+
+    def get_reachables(self):
+        return self.reachables
+
+    def get_candidates(self, targets):
+        # (n x 3) targets -> (n x 4 x 3) branch angles [deg] clipped to limits, (n x 4) errors
+        targets = np.asarray(targets, dtype=float)
+        l2 = self.fk.link2_length
+        l3 = self.fk.link3_length
+        h = targets[:, 2] - self.fk.get_shoulder_height()
+        rho = np.hypot(targets[:, 0], targets[:, 1])
+        base = np.arctan2(targets[:, 1], targets[:, 0])
+
+        q = np.empty((len(targets), IK_BRANCH_CNT, 3))
+        for branch in range(IK_BRANCH_CNT):
+            r = rho if branch < 2 else -rho
+            elbow = 1.0 if branch % 2 == 0 else -1.0
+            # Elbow angle between Link2 and Link3 (q3 + 90), straight arm if out of reach
+            c = np.clip((r * r + h * h - l2 * l2 - l3 * l3) / (2 * l2 * l3), -1.0, 1.0)
+            theta = elbow * np.arccos(c)
+            q[:, branch, 0] = base if branch < 2 else base + np.pi
+            q[:, branch, 1] = np.arctan2(r, h) - np.arctan2(l3 * np.sin(theta), l2 + l3 * np.cos(theta))
+            q[:, branch, 2] = theta - np.pi / 2
+
+        # Wrap to [-180, 180) and clip to limits
+        angles = (np.degrees(q) + 180.0) % 360.0 - 180.0
+        angles = np.clip(angles * self.signs, self.angle_mins, self.angle_maxs)
+        errors = np.linalg.norm(self.fk.get_positions(angles) - targets[:, None, :], axis=2)
+        return angles, errors
+
+    def get_base_angles(self, targets):
+        # (n x 3) targets -> (n x 2) motor 1 angles within limits closest to the
+        # target direction (front) and the opposite one (back)
+        base = np.degrees(np.arctan2(targets[:, 1], targets[:, 0]))[:, None] + [0.0, 180.0]
+        base = base * self.signs[0]
+        turns = np.array([-360.0, 0.0, 360.0])[:, None, None]
+        angles = np.clip(base + turns, self.angle_mins[0], self.angle_maxs[0])
+        distance = np.abs((angles - base + 180.0) % 360.0 - 180.0)
+        return np.take_along_axis(angles, distance.argmin(axis=0)[None], axis=0)[0]
+
+    def get_distances(self, angles, targets):
+        return np.linalg.norm(self.fk.get_positions(angles) - targets, axis=-1)
+
+    def refine(self, targets):
+        # Nearest reachable point within limits, (n x 3) angles
+        # Motor 1 only turns the arm plane, so toward the target (front) or
+        # away (back) is the best for every motor 2, 3 pose
+        n = len(targets)
+        targets = np.repeat(targets, 2, axis=0)
+        angles = np.empty((2 * n, 3))
+        angles[:, 0] = self.get_base_angles(targets[::2]).reshape(-1)
+
+        # Coarse grid of motors 2, 3
+        grid = np.stack(np.meshgrid(np.linspace(self.angle_mins[1], self.angle_maxs[1], IK_GRID_CNT),
+                                    np.linspace(self.angle_mins[2], self.angle_maxs[2], IK_GRID_CNT),
+                                    indexing='ij'), axis=-1).reshape(-1, 2)
+        samples = np.empty((2 * n, len(grid), 3))
+        samples[:, :, 0] = angles[:, 0, None]
+        samples[:, :, 1:] = grid
+        best = self.get_distances(samples, targets[:, None, :]).argmin(axis=1)
+        angles[:, 1:] = grid[best]
+
+        # Pattern search around the best grid point, halve step if no move
+        offsets = np.stack(np.meshgrid([-1.0, 0.0, 1.0], [-1.0, 0.0, 1.0], indexing='ij'), axis=-1).reshape(-1, 2)
+        step = np.tile((self.angle_maxs[1:] - self.angle_mins[1:]) / (IK_GRID_CNT - 1) / 2, (2 * n, 1))
+        for _ in range(self.max_iter):
+            samples = np.repeat(angles[:, None, :], len(offsets), axis=1)
+            samples[:, :, 1:] = np.clip(samples[:, :, 1:] + offsets * step[:, None, :], self.angle_mins[1:], self.angle_maxs[1:])
+            distances = self.get_distances(samples, targets[:, None, :])
+            best = distances.argmin(axis=1)
+            is_moved = distances[np.arange(2 * n), best] < distances[:, 4] - 1e-9
+            angles[is_moved] = samples[is_moved, best[is_moved]]
+            step[~is_moved] /= 2
+            if np.all(step < IK_MIN_STEP):
+                break
+
+        # Front or back
+        distances = self.get_distances(angles, targets).reshape(n, 2)
+        return angles.reshape(n, 2, 3)[np.arange(n), distances.argmin(axis=1)]
+
+    def round_ticks(self, angles, targets):
+        # (n x 3) angles -> (n x 3) ticks, nearest to targets of the 8 floor/ceil roundings
+        ticks = self.fk.convert_angles_to_ticks(angles)
+        samples = np.clip(np.floor(ticks)[:, None, :] + IK_ROUND_CORNERS, self.tick_mins, self.tick_maxs)
+        distances = np.linalg.norm(self.fk.get_positions_from_ticks(samples) - targets[:, None, :], axis=2)
+        return samples[np.arange(len(ticks)), distances.argmin(axis=1)].astype(int)
+
+    def solve_array(self, targets):
+        # (n x 3) targets -> (n x 3) ticks, branch closest to the warm start
+        targets = np.asarray(targets, dtype=float).reshape(-1, 3)
+        if len(targets) == 0:
+            self.errors = np.zeros(0)
+            self.reachables = np.zeros(0, dtype=bool)
+            return np.zeros((0, 3), dtype=int)
+        candidates, errors = self.get_candidates(targets)
+
+        # Branches within tolerance of the best one, then closest to warm start
+        reachable = errors <= errors.min(axis=1, keepdims=True) + self.tolerance
+        distance = np.abs(candidates - self.angles).sum(axis=2)
+        distance[:, self.branch] -= 1e-6
+        branches = np.where(reachable, distance, np.inf).argmin(axis=1)
+        angles = candidates[np.arange(len(targets)), branches]
+
+        # Nearest reachable point for targets out of reach within the limits
+        is_far = errors[np.arange(len(targets)), branches] > self.tolerance
+        if np.any(is_far):
+            angles[is_far] = self.refine(targets[is_far])
+        self.reachables = self.get_distances(angles, targets) <= self.tolerance
+
+        ticks = self.round_ticks(angles, targets)
+        self.errors = np.linalg.norm(self.fk.get_positions_from_ticks(ticks) - targets, axis=1)
+        self.angles = angles[-1]
+        self.branch = int(branches[-1])
+        return ticks
+
+    def solve(self, target):
+        # Target [x, y, z] -> ticks list (memoized by target and warm start ticks)
+        target = np.asarray(target, dtype=float)
+        warm_ticks = np.rint(self.fk.convert_angles_to_ticks(self.angles)).astype(int)
+        key = (tuple(np.rint(target / self.resolution).astype(int).tolist()), tuple(warm_ticks.tolist()))
+        result = self.cache.get(key)
+        if result is not None:
+            self.cache.move_to_end(key)
+            self.hit_cnt += 1
+            ticks, angles, branch, error, reachable = result
+            self.angles = angles
+            self.branch = branch
+            self.errors = np.array([error])
+            self.reachables = np.array([reachable])
+            return list(ticks)
+
+        self.miss_cnt += 1
+        ticks = self.solve_array(target[None])[0].tolist()
+        self.cache[key] = (tuple(ticks), self.angles, self.branch, float(self.errors[0]), bool(self.reachables[0]))
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return ticks
@@ -0,0 +1,177 @@
+# --------------------------------------------------------------------------------
+#   File        motion_profile.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Add catmull_rom and cubic_spline profiles
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import numpy as np
+
+# --------------------------------------------------------------------------------
+#   Define
+# --------------------------------------------------------------------------------
+PROFILE_TRAPEZOID = 'trapezoid'
+PROFILE_MIN_JERK = 'min_jerk'
+PROFILE_CATMULL_ROM = 'catmull_rom'
+PROFILE_CUBIC_SPLINE = 'cubic_spline'
+PROFILE_SPLINES = (PROFILE_CATMULL_ROM, PROFILE_CUBIC_SPLINE)
+
+# Minimum-jerk peak velocity and acceleration (x distance / T, / T^2)
+MIN_JERK_VEL_PEAK = 1.875
+MIN_JERK_ACC_PEAK = 10.0 / np.sqrt(3.0)
+
+# --------------------------------------------------------------------------------
+#   Class - MotionProfile
+#
+#   Time-based keyframe interpolation. Every segment takes the time of its
+#   slowest joint under the per-motor velocity and acceleration limits, so
+#   all joints leave and reach each keyframe together.
+#       trapezoid   each joint accelerates at its limit, cruise velocity
+#                   lowered to fit the segment time
+#       min_jerk    10t^3 - 15t^4 + 6t^5 shape for all joints
+#   Spline profiles pass through the keyframes without stopping, with
+#   trapezoid segment times as knot spacing and rest at both ends.
+#       catmull_rom   C1, local tangents (p[i+1] - p[i-1]) / (t[i+1] - t[i-1])
+#       cubic_spline  C2 clamped cubic spline
+# --------------------------------------------------------------------------------
+class MotionProfile:
+    def __init__(self, profile, vel_max, acc_max):
+        if profile not in (PROFILE_TRAPEZOID, PROFILE_MIN_JERK) + PROFILE_SPLINES:
+            raise ValueError(f'MotionProfile - Unknown profile {profile}')
+        self.profile = profile
+        self.vel_max = np.asarray(vel_max, dtype=float)
+        self.acc_max = np.asarray(acc_max, dtype=float)
+
+    def get_segment_times(self, dists):
+        # (segments x joints) distances -> (segments,) synchronized times
+        if self.profile != PROFILE_MIN_JERK:
+            # Triangle if the joint never reaches vel_max
+            vel_reach = self.vel_max ** 2 / self.acc_max
+            times = np.where(dists >= vel_reach,
+                             dists / self.vel_max + self.vel_max / self.acc_max,
+                             2.0 * np.sqrt(dists / self.acc_max))
+        else:
+            times = np.maximum(MIN_JERK_VEL_PEAK * dists / self.vel_max,
+                               np.sqrt(MIN_JERK_ACC_PEAK * dists / self.acc_max))
+        return times.max(axis=1, initial=0.0)
+
+    def get_profile_array(self, arrs, interval):
+        # (N poses x M joints) keyframes -> (frames x M joints) at interval
+        if self.profile in PROFILE_SPLINES:
+            return self.get_spline_array(arrs, interval)
+
+        arrs = np.asarray(arrs, dtype=float)
+        starts = arrs[:-1]
+        ends = arrs[1:]
+        deltas = ends - starts
+        dists = np.abs(deltas)
+        times = self.get_segment_times(dists)
+
+        # Frame count per segment, segment time stretched to whole frames
+        # (last frame lands on the keyframe)
+        cnts = np.ceil(times / interval - 1e-9).astype(np.int64)
+        cnts = np.where(np.any(dists > 0, axis=1), np.maximum(cnts, 1), 0)
+        total = int(cnts.sum())
+
+        # Segment index and time of every frame
+        seg = np.repeat(np.arange(len(cnts)), cnts)
+        offsets = np.cumsum(cnts) - cnts
+        k = np.arange(total) - np.repeat(offsets, cnts) + 1
+        T = (cnts[seg] * interval)[:, None]
+        t = (k * interval)[:, None]
+
+        # Normalized position 0..1 for every frame and joint
+        if self.profile == PROFILE_TRAPEZOID:
+            d = dists[seg]
+            a = np.broadcast_to(self.acc_max, d.shape)
+            # Cruise velocity so that d = v (T - v / a)
+            disc = np.maximum(a * a * T * T - 4.0 * a * d, 0.0)
+            v = (a * T - np.sqrt(disc)) / 2.0
+            ta = v / a
+            pos = np.where(t < ta, 0.5 * a * t * t,
+                  np.where(t < T - ta, 0.5 * a * ta * ta + v * (t - ta),
+                           d - 0.5 * a * (T - t) ** 2))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                s = np.where(d > 0, pos / d, 1.0)
+        else:
+            tau = t / T
+            s = tau ** 3 * (10.0 - 15.0 * tau + 6.0 * tau * tau)
+
+        frames = starts[seg] + deltas[seg] * s
+        return np.rint(np.concatenate((arrs[:1], frames))).astype(int)
+
+    def get_spline_array(self, arrs, interval):
+        arrs = np.asarray(arrs, dtype=float)
+        dists = np.abs(arrs[1:] - arrs[:-1])
+        times = self.get_segment_times(dists)
+
+        # Knots on whole frames, repeated keyframes removed
+        cnts = np.ceil(times / interval - 1e-9).astype(np.int64)
+        cnts = np.where(np.any(dists > 0, axis=1), np.maximum(cnts, 1), 0)
+        points = arrs[np.concatenate(([True], cnts > 0))]
+        cnts = cnts[cnts > 0]
+        if len(cnts) == 0:
+            return np.rint(points).astype(int)
+        h = cnts * interval
+        tangents = self.get_tangents(points, h)
+
+        # Segment index and normalized time of every frame
+        total = int(cnts.sum())
+        seg = np.repeat(np.arange(len(cnts)), cnts)
+        offsets = np.cumsum(cnts) - cnts
+        k = np.arange(total) - np.repeat(offsets, cnts) + 1
+        u = (k / cnts[seg])[:, None]
+        hs = h[seg][:, None]
+
+        # Cubic Hermite basis
+        u2 = u * u
+        u3 = u2 * u
+        frames = ((2.0 * u3 - 3.0 * u2 + 1.0) * points[seg]
+                  + (u3 - 2.0 * u2 + u) * hs * tangents[seg]
+                  + (-2.0 * u3 + 3.0 * u2) * points[seg + 1]
+                  + (u3 - u2) * hs * tangents[seg + 1])
+        return np.rint(np.concatenate((points[:1], frames))).astype(int)
+
+    def get_tangents(self, points, h):
+        # (N x M) knot velocities, zero at both ends
+        tangents = np.zeros_like(points)
+        if len(points) < 3:
+            return tangents
+
+        if self.profile == PROFILE_CATMULL_ROM:
+            tangents[1:-1] = (points[2:] - points[:-2]) / (h[:-1] + h[1:])[:, None]
+            return tangents
+
+        # Clamped cubic spline (C2), tridiagonal system for interior tangents
+        #   h[i] m[i-1] + 2 (h[i-1] + h[i]) m[i] + h[i-1] m[i+1]
+        #       = 3 (h[i] d[i-1] + h[i-1] d[i]),   d[i] = (p[i+1] - p[i]) / h[i]
+        slopes = (points[1:] - points[:-1]) / h[:, None]
+        sub = h[1:]
+        diag = 2.0 * (h[:-1] + h[1:])
+        sup = h[:-1]
+        rhs = 3.0 * (h[1:, None] * slopes[:-1] + h[:-1, None] * slopes[1:])
+
+        # Thomas algorithm (vectorized over joints)
+        n = len(diag)
+        c = np.zeros(n)
+        d = np.zeros_like(rhs)
+        c[0] = sup[0] / diag[0]
+        d[0] = rhs[0] / diag[0]
+        for i in range(1, n):
+            w = diag[i] - sub[i] * c[i - 1]
+            c[i] = sup[i] / w
+            d[i] = (rhs[i] - sub[i] * d[i - 1]) / w
+        for i in range(n - 2, -1, -1):
+            d[i] = d[i] - c[i] * d[i + 1]
+        tangents[1:-1] = d
+        return tangents
+
+    def get_duration(self, arrs):
+        arrs = np.asarray(arrs, dtype=float)
+        return float(self.get_segment_times(np.abs(arrs[1:] - arrs[:-1])).sum())
@@ -0,0 +1,215 @@
+# --------------------------------------------------------------------------------
+#   File        pose_table_model.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Keep rows in ticks, show and edit in tick or angle
+#                   Check names and ticks shape in set_rows()
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import ast
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+# --------------------------------------------------------------------------------
+#   Define
+# --------------------------------------------------------------------------------
+COLUMN_NAME = 0
+COLUMN_DATA = 1
+
+ITEM_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+# --------------------------------------------------------------------------------
+#   Class - PoseTableModel
+#
+#   Pose/action rows for QTableView: names (list) and a (rows x motors)
+#   numpy array of ticks. Ticks are converted to angles only for the rows
+#   drawn or edited in angle mode, so set_is_tick() converts no data and
+#   tick/angle switches never change the stored ticks. Rows are inserted,
+#   moved and removed in bulk with one array operation.
+# --------------------------------------------------------------------------------
+class PoseTableModel(QAbstractTableModel):
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.motor_cnt = model.get_motor_cnt()
+        self.is_tick = True
+        self.names = []
+        self.ticks_array = np.zeros((0, self.motor_cnt), dtype=int)
+
+    # ----------------------------------------
+    # QAbstractTableModel
+    # ----------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.names)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 2
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        if index.column() == COLUMN_NAME:
+            return self.names[index.row()]
+        return str(self.get_values(index.row()))
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row = index.row()
+        if index.column() == COLUMN_NAME:
+            self.names[row] = str(value)
+        else:
+            try:
+                data = np.array(ast.literal_eval(str(value)), dtype=int)
+                if data.shape != (self.motor_cnt,):
+                    raise ValueError(f'{self.motor_cnt} values need')
+            except (ValueError, SyntaxError, TypeError) as e:
+                print(f'Pose Data Error - {e}')
+                return False
+            if self.is_tick is True:
+                self.ticks_array[row] = self.model.clip_ticks_array(data)
+            else:
+                self.ticks_array[row] = self.model.convert_angles_to_ticks(data)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return ['Name', 'Data'][section]
+        return str(section + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return ITEM_FLAGS
+
+    # ----------------------------------------
+    # Tick/angle type
+    # ----------------------------------------
+    def set_is_tick(self, is_tick):
+        # Only redraws the Data column, stored ticks are not converted
+        if self.is_tick == is_tick:
+            return
+        self.is_tick = is_tick
+        if len(self.names) > 0:
+            self.dataChanged.emit(self.index(0, COLUMN_DATA), self.index(len(self.names) - 1, COLUMN_DATA))
+
+    def get_is_tick(self):
+        return self.is_tick
+
+    # ----------------------------------------
+    # Rows
+    # ----------------------------------------
+    def get_row_cnt(self):
+        return len(self.names)
+
+    def get_name(self, row):
+        return self.names[row]
+
+    def get_names(self):
+        return list(self.names)
+
+    def get_ticks(self, row):
+        return self.ticks_array[row].tolist()
+
+    def get_values(self, row):
+        # Row in tick or angle (is_tick)
+        if self.is_tick is True:
+            return self.ticks_array[row].tolist()
+        return self.model.convert_ticks_to_angles(self.ticks_array[row]).tolist()
+
+    def get_ticks_array(self):
+        # (rows x motors) ticks, read only
+        ticks_array = self.ticks_array.view()
+        ticks_array.flags.writeable = False
+        return ticks_array
+
+    def set_rows(self, names, ticks_array):
+        ticks_array = np.array(ticks_array, dtype=int)
+        if ticks_array.ndim != 2 or ticks_array.shape[1] != self.motor_cnt:
+            raise ValueError(f'Ticks shape {ticks_array.shape} != (rows, {self.motor_cnt})')
+        if len(names) != len(ticks_array):
+            raise ValueError(f'Name count {len(names)} != row count {len(ticks_array)}')
+        self.beginResetModel()
+        self.names = list(names)
+        self.ticks_array = ticks_array
+        self.endResetModel()
+
+    def insert_rows(self, row, names, ticks_array):
+        ticks_array = np.asarray(ticks_array, dtype=int).reshape(-1, self.motor_cnt)
+        if len(names) != len(ticks_array):
+            raise ValueError(f'Name count {len(names)} != row count {len(ticks_array)}')
+        if len(names) == 0:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(names) - 1)
+        self.names[row:row] = list(names)
+        self.ticks_array = np.insert(self.ticks_array, row, ticks_array, axis=0)
+        self.endInsertRows()
+
+    def append_rows(self, names, ticks_array):
+        self.insert_rows(len(self.names), names, ticks_array)
+
+    def remove_rows(self, rows):
+        rows = np.unique(np.asarray(rows, dtype=int))
+        if len(rows) == 0:
+            return
+        if rows[-1] - rows[0] + 1 == len(rows):
+            # One contiguous block
+            self.beginRemoveRows(QModelIndex(), int(rows[0]), int(rows[-1]))
+        else:
+            self.beginResetModel()
+        keep = np.ones(len(self.names), dtype=bool)
+        keep[rows] = False
+        self.names = [name for name, is_keep in zip(self.names, keep) if is_keep]
+        self.ticks_array = self.ticks_array[keep]
+        if rows[-1] - rows[0] + 1 == len(rows):
+            self.endRemoveRows()
+        else:
+            self.endResetModel()
+
+    def move_rows(self, rows, offset):
+        # Move rows up (offset -1) or down (offset 1) by one, blocks at the
+        # table edge stay. Returns moved rows in their new position.
+        row_cnt = len(self.names)
+        rows = sorted(set(rows), reverse=offset > 0)
+        order = np.arange(row_cnt)
+        edge = 0 if offset < 0 else row_cnt - 1
+        new_rows = []
+        for row in rows:
+            if row == edge:
+                # Pinned at the edge, next row of the block is the edge
+                edge -= offset
+                new_rows.append(row)
+                continue
+            order[row], order[row + offset] = order[row + offset], order[row]
+            new_rows.append(row + offset)
+        if np.array_equal(order, np.arange(row_cnt)):
+            return sorted(new_rows)
+
+        self.layoutAboutToBeChanged.emit()
+        self.names = [self.names[i] for i in order]
+        self.ticks_array = self.ticks_array[order]
+
+        # Keep persistent indexes (selection) on the moved rows
+        new_row = np.empty(row_cnt, dtype=int)
+        new_row[order] = np.arange(row_cnt)
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(int(new_row[index.row()]), index.column()) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+        return sorted(new_rows)
+
+    def clear(self):
+        self.set_rows([], np.zeros((0, self.motor_cnt), dtype=int))
@@ -11,19 +11,45 @@
 #                   Add set_ticks() and set_angles() functions
 #                   Add convert_angle_to_tick() and convert_tick_to_angle()
 #                       functions
+#
+#               v0.4  2026.10.17  Tony Kwon
+#                   Encode rotate() frame with FrameEncoder
+#                   Add set_echo() and encode_ticks_array() functions
+#                   Add rotate_coalesced() function
+#                   Add wait_writable() function
+#                   Convert tick and angle with lookup tables
+#                   Add convert_angles_to_ticks() and convert_ticks_to_angles()
+#                       batch functions
+#                   Add clip_ticks_array() and rotate_data() functions
+#                   Add motion limits (velocity, acceleration)
+#                   Add set_protocol() function (protocol v2 delta frames)
+#                   Add set_rx_callback() and write_data() functions (trajectory upload)
+#                   Add set_telemetry() function
+#                   Add convert_angle_step_to_ticks() function
+#                   Pack get_frame() ticks in one struct call
+#                   Resync delta frames after comm TX error
 # --------------------------------------------------------------------------------
 
 # --------------------------------------------------------------------------------
 #   Import
 # --------------------------------------------------------------------------------
+import time
 import numpy as np
 from .serial_comm import SerialComm
+from .frame_encoder import FrameEncoder, DeltaFrameEncoder
+from .tx_coalescer import TxCoalescer
+
+# --------------------------------------------------------------------------------
+#   Define
+# --------------------------------------------------------------------------------
+MOTOR_VEL_MAX = 200.0       # [deg/sec]
+MOTOR_ACC_MAX = 1000.0      # [deg/sec^2]
 
 # --------------------------------------------------------------------------------
 #   Class - RcServoMotor
 # --------------------------------------------------------------------------------
 class RcServoMotor:
-    def __init__(self, ticks, angles):
+    def __init__(self, ticks, angles, limits=None):
         self.tick = ticks[0]
         self.tick_init = ticks[0]
         self.tick_min = ticks[1]
@@ -36,9 +62,25 @@ class RcServoMotor:
         self.angle_max = angles[2]
         self.angle_min_max = np.array([self.angle_min, self.angle_max])
 
+        # Motion limits [deg/sec, deg/sec^2]
+        if limits is None:
+            limits = [MOTOR_VEL_MAX, MOTOR_ACC_MAX]
+        self.vel_max = limits[0]
+        self.acc_max = limits[1]
+
+        # Lookup tables (index = tick - tick_min, angle - angle_min)
+        self.tick_to_angle_table = self.get_table(self.tick_min_max, self.angle_min_max)
+        self.angle_to_tick_table = self.get_table(self.angle_min_max, self.tick_min_max)
+        self.tick_to_angle_array = np.array(self.tick_to_angle_table)
+        self.angle_to_tick_array = np.array(self.angle_to_tick_table)
+
+    def get_table(self, xp, fp):
+        x = np.arange(xp[0], xp[1] + 1)
+        return np.interp(x, xp, fp).astype(int).tolist()
+
     def set_tick(self, tick):
         self.tick = min(max(tick, self.tick_min), self.tick_max)
-        self.angle = int(np.interp(tick, self.tick_min_max, self.angle_min_max))
+        self.angle = self.convert_tick_to_angle(tick)
 
     def get_tick(self):
         return self.tick
@@ -54,7 +96,7 @@ class RcServoMotor:
 
     def set_angle(self, angle):
         self.angle = min(max(angle, self.angle_min), self.angle_max)
-        self.tick = int(np.interp(angle, self.angle_min_max, self.tick_min_max))
+        self.tick = self.convert_angle_to_tick(angle)
 
     def get_angle(self):
         return self.angle
@@ -68,15 +110,42 @@ class RcServoMotor:
     def get_angle_max(self):
         return self.angle_max
 
+    def get_vel_max(self):
+        return self.vel_max
+
+    def get_acc_max(self):
+        return self.acc_max
+
+    def get_tick_per_angle(self):
+        return abs((self.tick_max - self.tick_min) / (self.angle_max - self.angle_min))
+
     def convert_angle_to_tick(self, angle):
         angle = min(max(angle, self.angle_min), self.angle_max)
-        tick = int(np.interp(angle, self.angle_min_max, self.tick_min_max))
-        return tick
+        try:
+            return self.angle_to_tick_table[angle - self.angle_min]
+        except TypeError:
+            # Non-integer angle
+            return int(np.interp(angle, self.angle_min_max, self.tick_min_max))
 
     def convert_tick_to_angle(self, tick):
         tick = min(max(tick, self.tick_min), self.tick_max)
-        angle = int(np.interp(tick, self.tick_min_max, self.angle_min_max))
-        return angle        
+        try:
+            return self.tick_to_angle_table[tick - self.tick_min]
+        except TypeError:
+            # Non-integer tick
+            return int(np.interp(tick, self.tick_min_max, self.angle_min_max))
+
+    def convert_angles_to_ticks(self, angles):
+        angles = np.clip(angles, self.angle_min, self.angle_max)
+        if np.issubdtype(angles.dtype, np.integer):
+            return self.angle_to_tick_array[angles - self.angle_min]
+        return np.interp(angles, self.angle_min_max, self.tick_min_max).astype(int)
+
+    def convert_ticks_to_angles(self, ticks):
+        ticks = np.clip(ticks, self.tick_min, self.tick_max)
+        if np.issubdtype(ticks.dtype, np.integer):
+            return self.tick_to_angle_array[ticks - self.tick_min]
+        return np.interp(ticks, self.tick_min_max, self.angle_min_max).astype(int)
 
 # --------------------------------------------------------------------------------
 #   Class - RcServoMotorControlModel
@@ -85,26 +154,85 @@ class RcServoMotorControlModel:
     def __init__(self):
         # Comm        
         self.comm = SerialComm()
+        self.tx = TxCoalescer(self.comm)
+        self.comm.set_tx_error_callback(self.tx.set_resync)
         self.connected = False
 
         # Motors
         self.motors = []        
 
+        # Frame
+        self.encoder = FrameEncoder(0)
+        self.is_echo = False
+        self.protocol = 1
+
+        # Telemetry (None: disabled)
+        self.telemetry = None
+
     def add_motor(self, motor):
         self.motors.append(motor)
+        self.encoder = FrameEncoder(len(self.motors))
+        self.set_protocol(self.protocol)
+
+    def set_protocol(self, protocol):
+        # 1: full frames, 2: delta frames (RcServoMotorControl.ino v0.2)
+        if protocol not in (1, 2):
+            raise ValueError(f'Unknown protocol {protocol}')
+        self.protocol = protocol
+        if protocol == 2:
+            self.tx.set_delta_encoder(DeltaFrameEncoder(len(self.motors)))
+        else:
+            self.tx.set_delta_encoder(None)
+
+    def get_protocol(self):
+        return self.protocol
+
+    def set_echo(self, is_echo):
+        self.is_echo = is_echo
 
     def get_motor_cnt(self):
         return len(self.motors)
         
     def connect(self, port, baud):
         if self.comm.init(port, baud):
+            self.set_protocol(self.protocol)
+            self.tx.start()
             self.connected = True
         else:
             self.connected = False
 
     def disconnect(self):
-        self.comm.deinit()
         self.connected = False
+        self.tx.stop()
+        self.comm.deinit()
+
+    def set_tx_max_rate(self, max_rate):
+        self.tx.set_max_rate(max_rate)
+
+    def get_tx(self):
+        return self.tx
+
+    def set_telemetry(self, telemetry):
+        self.telemetry = telemetry
+        self.comm.set_telemetry(telemetry)
+        self.tx.set_telemetry(telemetry)
+
+    def get_telemetry(self):
+        return self.telemetry
+
+    def add_telemetry_frame(self, scheduled=None):
+        # Record id of a frame to be written (None if disabled)
+        if self.telemetry is None:
+            return None
+        return self.telemetry.add_frame(scheduled, time.perf_counter(), self.comm.get_queue_cnt())
+
+    def set_rx_callback(self, callback):
+        self.comm.set_rx_callback(callback)
+
+    def wait_writable(self, timeout):
+        if self.connected:
+            return self.comm.wait_writable(timeout)
+        return True
 
     def set_tick(self, index, tick):
         self.motors[index].set_tick(tick)
@@ -144,23 +272,84 @@ class RcServoMotorControlModel:
     def get_angle_max(self, index):
         return self.motors[index].get_angle_max()
 
+    def get_motion_limits(self, is_tick):
+        # Per motor velocity and acceleration limits in tick or angle
+        vel_max = np.array([motor.get_vel_max() for motor in self.motors], dtype=float)
+        acc_max = np.array([motor.get_acc_max() for motor in self.motors], dtype=float)
+        if is_tick is True:
+            scale = np.array([motor.get_tick_per_angle() for motor in self.motors])
+            vel_max = vel_max * scale
+            acc_max = acc_max * scale
+        return vel_max, acc_max
+
+    def convert_angle_step_to_ticks(self, step):
+        # Angle step -> tick step no motor moves more than step angle (at least 1)
+        return max(1, int(step * min(motor.get_tick_per_angle() for motor in self.motors)))
+
     def convert_angle_to_tick(self, index, angle):
         return self.motors[index].convert_angle_to_tick(angle)
 
     def convert_tick_to_angle(self, index, tick):
         return self.motors[index].convert_tick_to_angle(tick)
 
+    def convert_angles_to_ticks(self, angles_array):
+        # (rows x motors) angles -> (rows x motors) ticks
+        angles_array = np.asarray(angles_array)
+        ticks_array = np.empty(angles_array.shape, dtype=int)
+        for index in range(angles_array.shape[-1]):
+            ticks_array[..., index] = self.motors[index].convert_angles_to_ticks(angles_array[..., index])
+        return ticks_array
+
+    def clip_ticks_array(self, ticks_array):
+        # Clamp (rows x motors) ticks like set_ticks()
+        tick_mins = [motor.get_tick_min() for motor in self.motors]
+        tick_maxs = [motor.get_tick_max() for motor in self.motors]
+        return np.clip(ticks_array, tick_mins, tick_maxs)
+
+    def convert_ticks_to_angles(self, ticks_array):
+        # (rows x motors) ticks -> (rows x motors) angles
+        ticks_array = np.asarray(ticks_array)
+        angles_array = np.empty(ticks_array.shape, dtype=int)
+        for index in range(ticks_array.shape[-1]):
+            angles_array[..., index] = self.motors[index].convert_ticks_to_angles(ticks_array[..., index])
+        return angles_array
+
+    def encode_ticks_array(self, ticks_array):
+        return self.encoder.encode_array(ticks_array)
+
+    def get_frame(self):
+        # Read motor ticks (RcServoMotor set_*() may be called directly)
+        data = self.encoder.encode([motor.tick for motor in self.motors])
+        if self.is_echo:
+            print(list(data))
+        return data
+
     def rotate(self):
         # Set comm data
-        data = [0xFF, 0xFF, len(self.motors)]
-        for motor in self.motors:
-            data.append(0xFF & (motor.tick >> 8))
-            data.append(0xFF & motor.tick)
-
-        print(data)
+        data = self.get_frame()
 
         # TX comm data
         if self.connected:
-            self.comm.write(data)
+            self.tx.send(data, self.add_telemetry_frame())
+
+    def rotate_data(self, data, scheduled=None):
+        # TX pre-encoded frame data (scheduled: paced frame time)
+        if self.is_echo:
+            print(list(data))
+        if self.connected:
+            self.tx.send(data, self.add_telemetry_frame(scheduled))
+
+    def write_data(self, data):
+        # TX raw frame (upload chunk, control) in order with rotate frames
+        if self.connected:
+            self.tx.send(data)
+
+    def rotate_coalesced(self):
+        # Set comm data
+        data = self.get_frame()
+
+        # TX comm data (latest wins, rate limited)
+        if self.connected:
+            self.tx.submit(data, self.add_telemetry_frame())
 
 
@@ -9,6 +9,24 @@
 #
 #               v0.3  2025.11.13  Tony Kwon
 #                   Add pose and action control functions
+#
+#               v0.4  2026.10.17  Tony Kwon
+#                   Run action on ActionPlayer thread
+#                   Add action pause/resume function
+#                   Print action frame pacing statistics
+#                   Rotate slider motion with rotate_coalesced()
+#                   Convert pose and action data with batch functions
+#                   Run action from TrajectoryCompiler cache
+#                   Add action profile selection
+#                   Add catmull_rom and cubic_spline profiles
+#                   Add protocol selection
+#                   Add telemetry statistics and export
+#                   Remove per-value slider print
+#                   Show pose and action tables with PoseTableModel
+#                   Keep pose and action data in ticks (convert on display)
+#                   Add Cartesian pose move (InverseKinematics)
+#                   Do not move to targets out of reach
+#                   Compile actions from ticks in angle mode too (step scaled to ticks)
 # --------------------------------------------------------------------------------
 
 # --------------------------------------------------------------------------------
@@ -17,7 +35,7 @@
 import json
 import os
 import ast
-import time
+import numpy as np
 from PySide6.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -30,24 +48,37 @@ from PySide6.QtWidgets import (
     QSlider,
     QRadioButton,
     QButtonGroup,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,    
+    QCheckBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal, QTimer, QItemSelection, QItemSelectionModel
 
 from .rc_servo_motor_control_model import RcServoMotor, RcServoMotorControlModel
-from .interp import Interp
+from .action_player import ActionPlayer
+from .trajectory_compiler import TrajectoryCompiler
+from .telemetry import Telemetry
+from .pose_table_model import PoseTableModel
+from .inverse_kinematics import InverseKinematics
 
 # --------------------------------------------------------------------------------
 #   Class - RcServoMotorControlView
 # --------------------------------------------------------------------------------
 class RcServoMotorControlView(QWidget):
+    action_frame_changed = Signal(int, list)
+    action_finished = Signal()
+
     def __init__(self, model):
         super().__init__()        
         self.model = model
         self.motor_cnt = model.get_motor_cnt()
-        self.interp = Interp()
+        self.player = ActionPlayer(model)
+        self.compiler = TrajectoryCompiler(model)
+        self.telemetry = Telemetry()
+        self.telemetry_timer = QTimer(self)
+        self.pose_table_model = PoseTableModel(model, self)
+        self.action_table_model = PoseTableModel(model, self)
+        self.ik = InverseKinematics(model) if self.motor_cnt == 3 else None
         self.is_tick = True
         self.is_slider_rotate = True
         self.pose_count = 1
@@ -61,6 +92,14 @@ class RcServoMotorControlView(QWidget):
         self.sliders = []
 
         self.init_ui()
+        self.pose_table_model.set_is_tick(self.is_tick)
+        self.action_table_model.set_is_tick(self.is_tick)
+
+        # Set action player
+        self.player.set_frame_callback(self.action_frame_changed.emit)
+        self.player.set_finish_callback(self.action_finished.emit)
+        self.action_frame_changed.connect(self.on_action_frame_changed)
+        self.action_finished.connect(self.on_action_finished)
 
         # Set slider range and value
         self.is_initialized = False
@@ -94,6 +133,15 @@ class RcServoMotorControlView(QWidget):
         setup_port_layout.addWidget(self.setup_port_combo_box)
         setup_layout.addLayout(setup_port_layout)
 
+        setup_protocol_layout = QHBoxLayout()
+        setup_protocol_label = QLabel('Protocol')
+        self.setup_protocol_combo_box = QComboBox()
+        self.setup_protocol_combo_box.addItem('v1 (Full)', 1)
+        self.setup_protocol_combo_box.addItem('v2 (Delta)', 2)
+        setup_protocol_layout.addWidget(setup_protocol_label)
+        setup_protocol_layout.addWidget(self.setup_protocol_combo_box)
+        setup_layout.addLayout(setup_protocol_layout)
+
         setup_connect_disconnect_layout = QHBoxLayout()
         self.setup_connect_button = QPushButton('Connect')
         self.setup_disconnect_button = QPushButton('Disconnect')
@@ -209,12 +257,23 @@ class RcServoMotorControlView(QWidget):
         pose_name_layout.addWidget(self.add_pose_button)        
         pose_layout.addLayout(pose_name_layout)
 
-        self.pose_table_widget = QTableWidget()
-        self.pose_table_widget.setColumnCount(2)
-        self.pose_table_widget.setHorizontalHeaderLabels(['Name', 'Data'])
-        self.pose_table_widget.horizontalHeader().setStretchLastSection(True)
-        self.pose_table_widget.setColumnWidth(0, 100)
-        pose_layout.addWidget(self.pose_table_widget)
+        if self.ik is not None:
+            pose_xyz_layout = QHBoxLayout()
+            xyz_label = QLabel('XYZ')
+            self.pose_xyz_line_edit = QLineEdit()
+            self.pose_xyz_line_edit.setText('100, 0, 200')
+            self.pose_move_button = QPushButton('Move')
+            pose_xyz_layout.addWidget(xyz_label)
+            pose_xyz_layout.addWidget(self.pose_xyz_line_edit)
+            pose_xyz_layout.addWidget(self.pose_move_button)
+            pose_layout.addLayout(pose_xyz_layout)
+            self.pose_move_button.clicked.connect(self.on_pose_move_clicked)
+
+        self.pose_table_view = QTableView()
+        self.pose_table_view.setModel(self.pose_table_model)
+        self.pose_table_view.horizontalHeader().setStretchLastSection(True)
+        self.pose_table_view.setColumnWidth(0, 100)
+        pose_layout.addWidget(self.pose_table_view)
 
         pose_do_add_to_action_layout = QHBoxLayout()
         self.do_button = QPushButton('Do')
@@ -258,18 +317,31 @@ class RcServoMotorControlView(QWidget):
         action_step_interval_layout.addWidget(action_interval_label)
         action_step_interval_layout.addWidget(self.action_interval_line_edit)    
         action_layout.addLayout(action_step_interval_layout)
+
+        action_profile_layout = QHBoxLayout()
+        action_profile_label = QLabel('Profile')
+        self.action_profile_combo_box = QComboBox()
+        self.action_profile_combo_box.addItem('Linear', 'linear')
+        self.action_profile_combo_box.addItem('Trapezoid', 'trapezoid')
+        self.action_profile_combo_box.addItem('Min Jerk', 'min_jerk')
+        self.action_profile_combo_box.addItem('Catmull-Rom', 'catmull_rom')
+        self.action_profile_combo_box.addItem('Cubic Spline', 'cubic_spline')
+        action_profile_layout.addWidget(action_profile_label)
+        action_profile_layout.addWidget(self.action_profile_combo_box, 1)
+        action_layout.addLayout(action_profile_layout)
         
-        self.action_table_widget = QTableWidget()
-        self.action_table_widget.setColumnCount(2)
-        self.action_table_widget.setHorizontalHeaderLabels(['Name', 'Data'])
-        self.action_table_widget.setColumnWidth(0, 100)
-        self.action_table_widget.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        action_layout.addWidget(self.action_table_widget)
+        self.action_table_view = QTableView()
+        self.action_table_view.setModel(self.action_table_model)
+        self.action_table_view.setColumnWidth(0, 100)
+        self.action_table_view.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        action_layout.addWidget(self.action_table_view)
 
         action_run_stop_layout = QHBoxLayout()
         self.action_run_button = QPushButton('Run')
+        self.action_pause_button = QPushButton('Pause')
         self.action_stop_button = QPushButton('Stop')
         action_run_stop_layout.addWidget(self.action_run_button)
+        action_run_stop_layout.addWidget(self.action_pause_button)
         action_run_stop_layout.addWidget(self.action_stop_button)
         action_layout.addLayout(action_run_stop_layout)
         
@@ -290,12 +362,22 @@ class RcServoMotorControlView(QWidget):
         action_pose_save_load_clear_layout.addWidget(self.action_load_button)
         action_pose_save_load_clear_layout.addWidget(self.action_clear_button)
         action_layout.addLayout(action_pose_save_load_clear_layout)
+
+        action_telemetry_layout = QHBoxLayout()
+        self.action_telemetry_check_box = QCheckBox('Telemetry')
+        self.action_telemetry_export_button = QPushButton('Export')
+        action_telemetry_layout.addWidget(self.action_telemetry_check_box)
+        action_telemetry_layout.addWidget(self.action_telemetry_export_button)
+        action_layout.addLayout(action_telemetry_layout)
+        self.action_telemetry_label = QLabel('')
+        action_layout.addWidget(self.action_telemetry_label)
         
         self.action_group_box = QGroupBox('Action')
         self.action_group_box.setLayout(action_layout)
         self.action_group_box.setFixedWidth(adjusted_width)
 
         self.action_run_button.clicked.connect(self.on_action_run_clicked)
+        self.action_pause_button.clicked.connect(self.on_action_pause_clicked)
         self.action_stop_button.clicked.connect(self.on_action_stop_clicked)
         self.action_up_button.clicked.connect(self.on_action_up_clicked)
         self.action_down_button.clicked.connect(self.on_action_down_clicked)
@@ -303,6 +385,9 @@ class RcServoMotorControlView(QWidget):
         self.action_save_button.clicked.connect(self.on_action_save_clicked)
         self.action_load_button.clicked.connect(self.on_action_load_clicked)
         self.action_clear_button.clicked.connect(self.on_action_clear_clicked)
+        self.action_telemetry_check_box.toggled.connect(self.on_action_telemetry_toggled)
+        self.action_telemetry_export_button.clicked.connect(self.on_action_telemetry_export_clicked)
+        self.telemetry_timer.timeout.connect(self.on_telemetry_timer)
                 
         pose_action_layout.addWidget(self.pose_group_box)
         pose_action_layout.addWidget(self.action_group_box)
@@ -322,6 +407,7 @@ class RcServoMotorControlView(QWidget):
     def on_setup_connect_clicked(self):
         print('Connect')
         selected_port = self.setup_port_combo_box.currentText()
+        self.model.set_protocol(self.setup_protocol_combo_box.currentData())
         self.model.connect(selected_port, 115200)  
         
     def on_setup_disconnect_clicked(self):
@@ -341,17 +427,11 @@ class RcServoMotorControlView(QWidget):
         self.model.rotate()
         
     def on_setup_radio_clicked(self, index):    
-        is_tick_pre = self.is_tick
+        # Stop action (frames are in the previous tick/angle type)
+        if self.player.is_running():
+            self.player.stop()
         
-        # Update current slider value 
-        if self.is_tick is True:
-            for i in range(self.motor_cnt):
-                self.model.set_tick(i, self.sliders[i].value())
-        else:
-            for i in range(self.motor_cnt):
-                self.model.set_angle(i, self.sliders[i].value())
-        
-        # Set tick/angle type
+        # Set tick/angle type (model ticks are kept as they are)
         if index == 0:
             self.is_tick = True
         else:
@@ -373,41 +453,9 @@ class RcServoMotorControlView(QWidget):
                 self.sliders[i].setValue(self.model.get_angle(i))    
         self.is_initialized = True
 
-        # Set 'Pose' tick/angle value
-        if self.is_tick is True and is_tick_pre is False:
-            for row in range(self.pose_table_widget.rowCount()):
-                data = ast.literal_eval(self.pose_table_widget.item(row, 1).text())
-                data_new = []
-                for i in range(len(data)):
-                    data_new.append(self.model.convert_angle_to_tick(i, data[i]))
-                self.pose_table_widget.setItem(row, 1, QTableWidgetItem(str(data_new)))
-        elif self.is_tick is False and is_tick_pre is True:
-            for row in range(self.pose_table_widget.rowCount()):
-                data = ast.literal_eval(self.pose_table_widget.item(row, 1).text())
-                data_new = []
-                for i in range(len(data)):
-                    data_new.append(self.model.convert_tick_to_angle(i, data[i]))
-                self.pose_table_widget.setItem(row, 1, QTableWidgetItem(str(data_new)))
-        else:
-            pass
-
-        # Set 'Action' tick/angle value
-        if self.is_tick is True and is_tick_pre is False:
-            for row in range(self.action_table_widget.rowCount()):
-                data = ast.literal_eval(self.action_table_widget.item(row, 1).text())
-                data_new = []
-                for i in range(len(data)):
-                    data_new.append(self.model.convert_angle_to_tick(i, data[i]))
-                self.action_table_widget.setItem(row, 1, QTableWidgetItem(str(data_new)))
-        elif self.is_tick is False and is_tick_pre is True:
-            for row in range(self.action_table_widget.rowCount()):
-                data = ast.literal_eval(self.action_table_widget.item(row, 1).text())
-                data_new = []
-                for i in range(len(data)):
-                    data_new.append(self.model.convert_tick_to_angle(i, data[i]))
-                self.action_table_widget.setItem(row, 1, QTableWidgetItem(str(data_new)))
-        else:
-            pass
+        # Set 'Pose' and 'Action' tick/angle display
+        self.pose_table_model.set_is_tick(self.is_tick)
+        self.action_table_model.set_is_tick(self.is_tick)
           
         # Set 'Action' step and interval value
         if self.is_tick is True:
@@ -415,6 +463,42 @@ class RcServoMotorControlView(QWidget):
         else:
             self.action_step_line_edit.setText('1')
 
+    # ----------------------------------------
+    # 'Pose' and 'Action' table data
+    # ----------------------------------------
+    def set_table_data(self, table_model, items, is_tick):
+        # Set table rows from saved items, converting data to ticks if saved in angle
+        names = [item['name'] for item in items]
+        data_array = np.array([ast.literal_eval(item['data']) for item in items], dtype=int)
+        if is_tick is False:
+            data_array = self.model.convert_angles_to_ticks(data_array)
+        table_model.set_rows(names, data_array)
+
+    def get_table_items(self, table_model):
+        # Rows as saved items (ticks)
+        return [{'name': name, 'data': str(data)}
+                for name, data in zip(table_model.get_names(), table_model.get_ticks_array().tolist())]
+
+    def get_selected_rows(self, table_view):
+        # Rows from selection ranges (not per cell indexes)
+        rows = set()
+        for selection_range in table_view.selectionModel().selection():
+            rows.update(range(selection_range.top(), selection_range.bottom() + 1))
+        return sorted(rows)
+
+    def select_rows(self, table_view, rows):
+        # Select rows as one selection of contiguous ranges
+        table_model = table_view.model()
+        last_column = table_model.columnCount() - 1
+        selection = QItemSelection()
+        rows = sorted(rows)
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i] != rows[i - 1] + 1:
+                selection.select(table_model.index(rows[start], 0), table_model.index(rows[i - 1], last_column))
+                start = i
+        table_view.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
+
     # ----------------------------------------
     # 'Motor' event
     # ----------------------------------------        
@@ -451,7 +535,6 @@ class RcServoMotorControlView(QWidget):
 
     def on_motor_slider_value_changed(self, index, value):        
         if self.is_initialized is True:
-            print('Motor' + str(index + 1)  + ' Slider Value = ' + str(value))         
             self.line_edits[index].setText(str(value))    
             if self.is_tick is True:
                 self.model.set_tick(index, value)
@@ -459,7 +542,7 @@ class RcServoMotorControlView(QWidget):
                 self.model.set_angle(index, value)
             
             if self.is_slider_rotate is True:
-                self.model.rotate()
+                self.model.rotate_coalesced()
       
     # ----------------------------------------
     # 'Pose' event
@@ -468,65 +551,72 @@ class RcServoMotorControlView(QWidget):
         print('Pose Add')
         pose_name = self.pose_name_line_edit.text().strip()
         if pose_name:
-            value = [slider.value() for slider in self.sliders]
-            pose_data = str(value)
-
-            row = self.pose_table_widget.rowCount()
-            self.pose_table_widget.insertRow(row)
-            self.pose_table_widget.setItem(row, 0, QTableWidgetItem(pose_name))
-            self.pose_table_widget.setItem(row, 1, QTableWidgetItem(pose_data))
+            ticks = [self.model.get_tick(i) for i in range(self.motor_cnt)]
+            self.pose_table_model.append_rows([pose_name], [ticks])
 
             self.pose_count += 1
             self.pose_name_line_edit.setText(f"Pose{self.pose_count}")
 
     def on_pose_do_clicked(self):
         print('Pose Do')
-        selected_items = self.pose_table_widget.selectedItems()
-        if not selected_items:
+        selected_rows = self.get_selected_rows(self.pose_table_view)
+        if not selected_rows:
             print('Pose Do - No item selected')
             return
 
-        row = selected_items[0].row()        
-        data = json.loads(self.pose_table_widget.item(row, 1).text())  
+        values = self.pose_table_model.get_values(selected_rows[0])
        
         self.is_slider_rotate = False
-        for index, value in enumerate(data):
+        for index, value in enumerate(values):
             self.sliders[index].setValue(value)        
+        self.model.set_ticks(self.pose_table_model.get_ticks(selected_rows[0]))
+        self.model.rotate()
+        self.is_slider_rotate = True
+
+    def on_pose_move_clicked(self):
+        print('Pose Move')
+        try:
+            target = [float(value) for value in self.pose_xyz_line_edit.text().split(',')]
+            if len(target) != 3:
+                raise ValueError('X, Y, Z need')
+        except ValueError as e:
+            print(f'Pose Move Error - {e}')
+            return
+
+        # Solve from current pose (warm start)
+        self.ik.set_warm_start([self.model.get_tick(i) for i in range(self.motor_cnt)])
+        ticks = self.ik.solve(target)
+        if not self.ik.is_reachable():
+            print(f'Pose Move - Not reachable, nearest Ticks {ticks}, Error {self.ik.get_error():.1f}[mm]')
+            return
+        print(f'Pose Move - Ticks {ticks}, Error {self.ik.get_error():.1f}[mm]')
+
         if self.is_tick is True:
-            self.model.set_ticks(data)
+            values = ticks
         else:
-            self.model.set_angles(data)
+            values = self.model.convert_ticks_to_angles(ticks).tolist()
+        self.is_slider_rotate = False
+        for index, value in enumerate(values):
+            self.sliders[index].setValue(value)
+        self.model.set_ticks(ticks)
         self.model.rotate()
         self.is_slider_rotate = True
 
     def on_pose_add_to_action_clicked(self):
         print('Pose Add to Action')
-        selected_items = list(set(item.row() for item in self.pose_table_widget.selectedItems()))
-        if not selected_items:
+        selected_rows = self.get_selected_rows(self.pose_table_view)
+        if not selected_rows:
             print('Pose Add to Action - No item selected')
             return
 
-        for row in selected_items:
-            name = self.pose_table_widget.item(row, 0)
-            data = self.pose_table_widget.item(row, 1)
-            if name and data:
-                row_position = self.action_table_widget.rowCount()
-                self.action_table_widget.insertRow(row_position)
-                self.action_table_widget.setItem(row_position, 0, QTableWidgetItem(name.text()))
-                self.action_table_widget.setItem(row_position, 1, QTableWidgetItem(data.text()))
+        names = [self.pose_table_model.get_name(row) for row in selected_rows]
+        self.action_table_model.append_rows(names, self.pose_table_model.get_ticks_array()[selected_rows])
         
     def on_pose_save_clicked(self):
         print('Pose Save')
         poses = []
-        poses.append({'is_tick': self.is_tick})
-        for row in range(self.pose_table_widget.rowCount()):
-            name = self.pose_table_widget.item(row, 0)
-            data = self.pose_table_widget.item(row, 1)
-            if name and data:
-                poses.append({
-                    'name': name.text(),
-                    'data': data.text()
-                })        
+        poses.append({'is_tick': True})
+        poses.extend(self.get_table_items(self.pose_table_model))
         try:
             with open('Pose.json', 'w', encoding='utf-8') as f:
                 json.dump(poses, f, indent=4, ensure_ascii=False)
@@ -545,50 +635,16 @@ class RcServoMotorControlView(QWidget):
             if len(poses) < 2:
                 print('Pose.json File Error')
                 return                
-            self.pose_table_widget.setRowCount(0)
-            self.pose_count = 1
-
-            if self.is_tick is True and poses[0]['is_tick'] is False:
-                for pose in poses[1:]:
-                    row = self.pose_table_widget.rowCount()
-                    self.pose_table_widget.insertRow(row)
-                    self.pose_table_widget.setItem(row, 0, QTableWidgetItem(pose['name']))                    
-                    data = ast.literal_eval(pose['data'])
-                    data_new = []
-                    for i in range(len(data)):
-                        data_new.append(self.model.convert_angle_to_tick(i, data[i]))
-                    self.pose_table_widget.setItem(row, 1, QTableWidgetItem(str(data_new)))                    
-                    self.pose_count = self.pose_count + 1
-                self.pose_name_line_edit.setText(f"Pose{self.pose_count}")            
-                
-            elif self.is_tick is False and poses[0]['is_tick'] is True:
-                for pose in poses[1:]:
-                    row = self.pose_table_widget.rowCount()
-                    self.pose_table_widget.insertRow(row)
-                    self.pose_table_widget.setItem(row, 0, QTableWidgetItem(pose['name']))                    
-                    data = ast.literal_eval(pose['data'])
-                    data_new = []
-                    for i in range(len(data)):
-                        data_new.append(self.model.convert_tick_to_angle(i, data[i]))
-                    self.pose_table_widget.setItem(row, 1, QTableWidgetItem(str(data_new)))                    
-                    self.pose_count = self.pose_count + 1
-                self.pose_name_line_edit.setText(f"Pose{self.pose_count}")  
-            
-            else:
-                for pose in poses[1:]:
-                    row = self.pose_table_widget.rowCount()
-                    self.pose_table_widget.insertRow(row)
-                    self.pose_table_widget.setItem(row, 0, QTableWidgetItem(pose['name']))           
-                    self.pose_table_widget.setItem(row, 1, QTableWidgetItem(pose['data']))           
-                    self.pose_count = self.pose_count + 1
-                self.pose_name_line_edit.setText(f"Pose{self.pose_count}") 
+            self.set_table_data(self.pose_table_model, poses[1:], poses[0]['is_tick'])
+            self.pose_count = len(poses)
+            self.pose_name_line_edit.setText(f"Pose{self.pose_count}")
 
         except Exception as e:
             print(f'Pose Load Error - {e}')
       
     def on_pose_clear_clicked(self):
         print('Pose Clear')
-        self.pose_table_widget.setRowCount(0)
+        self.pose_table_model.clear()
         self.pose_count = 1
         self.pose_name_line_edit.setText(f"Pose{self.pose_count}")        
         
@@ -597,91 +653,93 @@ class RcServoMotorControlView(QWidget):
     # ----------------------------------------
     def on_action_run_clicked(self):
         print('Action Run')
-        if self.action_table_widget.rowCount() < 2:
+        if self.action_table_model.get_row_cnt() < 2:
             print('Action Run - At least 2 Pose need')
             return        
 
         step = int(self.action_step_line_edit.text())
         interval = float(self.action_interval_line_edit.text())
         
-        # Set motor data
-        pose_list = []
-        for row in range(self.action_table_widget.rowCount()):
-            data = ast.literal_eval(self.action_table_widget.item(row, 1).text())
-            pose_list.append(data)        
-        data_list = self.interp.get_interp_lists(pose_list, step)
-
-        # Rotate motor
+        # Set motor data from ticks (step is in tick or angle)
+        if self.is_tick is False:
+            step = self.model.convert_angle_step_to_ticks(step)
+        profile = self.action_profile_combo_box.currentData()
+        trajectory = self.compiler.compile(self.action_table_model.get_ticks_array(), step, True, profile, interval)
+
+        # Rotate motor on player thread
         self.is_slider_rotate = False
-        for i in range(len(data_list)):
-            data = data_list[i]    
-            for index, value in enumerate(data):
-                self.sliders[index].setValue(value)      
-            if self.is_tick is True:
-                self.model.set_ticks(data)
-            else:
-                self.model.set_angles(data)
-            self.model.rotate()
-            time.sleep(interval)
-        self.is_slider_rotate = True
+        self.action_pause_button.setText('Pause')
+        self.player.start(trajectory, interval)
+
+    def on_action_pause_clicked(self):
+        if not self.player.is_running():
+            print('Action Pause - Not running')
+            return
+
+        if self.player.is_paused():
+            print('Action Resume')
+            self.player.resume()
+            self.action_pause_button.setText('Pause')
+        else:
+            print('Action Pause')
+            self.player.pause()
+            self.action_pause_button.setText('Resume')
 
     def on_action_stop_clicked(self):
         print('Action Stop')
+        self.player.stop()
+
+    def on_action_frame_changed(self, index, data):
+        # Frames are in ticks
+        self.is_initialized = False
+        for i, value in enumerate(data):
+            if self.is_tick is False:
+                value = self.model.convert_tick_to_angle(i, value)
+            self.line_edits[i].setText(str(value))
+            self.sliders[i].setValue(value)
+        self.is_initialized = True
+
+    def on_action_finished(self):
+        if self.player.is_running():
+            return
+        pacer = self.player.get_pacer()
+        print(f'Action Finished - Frames {pacer.get_frame_cnt()}, Missed {pacer.get_missed_cnt()}, '
+              f'Jitter mean {pacer.get_jitter_mean() * 1000:.3f}[ms] max {pacer.get_jitter_max() * 1000:.3f}[ms]')
+        self.action_pause_button.setText('Pause')
+        self.is_slider_rotate = True
         
     def on_action_up_clicked(self):
         print('Action Up')
-        selected_rows = sorted(list(set(item.row() for item in self.action_table_widget.selectedItems())))
+        selected_rows = self.get_selected_rows(self.action_table_view)
         if not selected_rows:
             print('Action Up - No item selected')
             return
 
-        for row in selected_rows:
-            if row > 0:
-                current_row_data = [self.action_table_widget.item(row, col).text() for col in range(self.action_table_widget.columnCount())]                
-                self.action_table_widget.insertRow(row - 1)                
-                for col, data in enumerate(current_row_data):
-                    self.action_table_widget.setItem(row - 1, col, QTableWidgetItem(data))                
-                self.action_table_widget.removeRow(row + 1)                
-                self.action_table_widget.selectRow(row - 1)
+        self.select_rows(self.action_table_view, self.action_table_model.move_rows(selected_rows, -1))
 
     def on_action_down_clicked(self):
         print('Action Down')
-        selected_rows = sorted(list(set(item.row() for item in self.action_table_widget.selectedItems())), reverse=True)
+        selected_rows = self.get_selected_rows(self.action_table_view)
         if not selected_rows:
             print('Action Down - No item selected')
             return
 
-        for row in selected_rows:
-            if row < self.action_table_widget.rowCount() - 1:
-                current_row_data = [self.action_table_widget.item(row, col).text() for col in range(self.action_table_widget.columnCount())]                
-                self.action_table_widget.insertRow(row + 2)                
-                for col, data in enumerate(current_row_data):
-                    self.action_table_widget.setItem(row + 2, col, QTableWidgetItem(data))                
-                self.action_table_widget.removeRow(row)
-                self.action_table_widget.selectRow(row + 1)
+        self.select_rows(self.action_table_view, self.action_table_model.move_rows(selected_rows, 1))
 
     def on_action_remove_clicked(self):
         print('Action Remove')
-        selected_rows = sorted(list(set(item.row() for item in self.action_table_widget.selectedItems())), reverse=True)
+        selected_rows = self.get_selected_rows(self.action_table_view)
         if not selected_rows:
             print('Action Remove - No item selected')
             return
         
-        for row in selected_rows:
-            self.action_table_widget.removeRow(row)
+        self.action_table_model.remove_rows(selected_rows)
 
     def on_action_save_clicked(self):
         print('Action Save')
         actions = []
-        actions.append({'is_tick': self.is_tick})
-        for row in range(self.action_table_widget.rowCount()):
-            name = self.action_table_widget.item(row, 0)
-            data = self.action_table_widget.item(row, 1)
-            if name and data:
-                actions.append({
-                    'name': name.text(),
-                    'data': data.text(),
-                })
+        actions.append({'is_tick': True})
+        actions.extend(self.get_table_items(self.action_table_model))
 
         try:
             with open('Action.json', 'w', encoding='utf-8') as f:
@@ -701,40 +759,35 @@ class RcServoMotorControlView(QWidget):
             if len(actions) < 2:
                 print('Action.json File Error')
                 return                 
-            self.action_table_widget.setRowCount(0)
-
-            if self.is_tick is True and actions[0]['is_tick'] is False:
-                for action in actions[1:]:
-                    row = self.action_table_widget.rowCount()
-                    self.action_table_widget.insertRow(row)
-                    self.action_table_widget.setItem(row, 0, QTableWidgetItem(action['name']))                    
-                    data = ast.literal_eval(action['data'])
-                    data_new = []
-                    for i in range(len(data)):
-                        data_new.append(self.model.convert_angle_to_tick(i, data[i]))
-                    self.action_table_widget.setItem(row, 1, QTableWidgetItem(str(data_new)))                    
-
-            elif self.is_tick is False and actions[0]['is_tick'] is True:
-                for action in actions[1:]:
-                    row = self.action_table_widget.rowCount()
-                    self.action_table_widget.insertRow(row)
-                    self.action_table_widget.setItem(row, 0, QTableWidgetItem(action['name']))                    
-                    data = ast.literal_eval(action['data'])
-                    data_new = []
-                    for i in range(len(data)):
-                        data_new.append(self.model.convert_tick_to_angle(i, data[i]))
-                    self.action_table_widget.setItem(row, 1, QTableWidgetItem(str(data_new)))                    
-            else:
-                for action in actions[1:]:
-                    row = self.action_table_widget.rowCount()
-                    self.action_table_widget.insertRow(row)
-                    self.action_table_widget.setItem(row, 0, QTableWidgetItem(action['name']))
-                    self.action_table_widget.setItem(row, 1, QTableWidgetItem(action['data']))                  
+            self.set_table_data(self.action_table_model, actions[1:], actions[0]['is_tick'])
 
         except Exception as e:
             print(f'Action Load Error - {e}')
         
     def on_action_clear_clicked(self):
         print('Action Clear')
-        self.action_table_widget.setRowCount(0)
-        
\ No newline at end of file
+        self.action_table_model.clear()
+        
+    def on_action_telemetry_toggled(self, checked):
+        print('Action Telemetry ' + ('On' if checked else 'Off'))
+        if checked is True:
+            self.telemetry.clear()
+            self.model.set_telemetry(self.telemetry)
+            self.telemetry_timer.start(500)
+        else:
+            self.model.set_telemetry(None)
+            self.telemetry_timer.stop()
+
+    def on_action_telemetry_export_clicked(self):
+        print('Action Telemetry Export')
+        try:
+            self.telemetry.save('Telemetry.csv')
+        except Exception as e:
+            print(f'Action Telemetry Export Error - {e}')
+
+    def on_telemetry_timer(self):
+        stats = self.telemetry.get_stats()
+        self.action_telemetry_label.setText(
+            f'{stats["rate"]:.1f} fps, {stats["byte_rate"]:.0f} B/s, '
+            f'Jitter {stats["jitter"] * 1000:.2f} ms, Latency {stats["latency_mean"] * 1000:.2f} ms, '
+            f'Dropped {stats["dropped"]}')
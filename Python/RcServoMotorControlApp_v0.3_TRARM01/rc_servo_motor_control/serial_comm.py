@@ -3,23 +3,73 @@
 #
 #   Version     v0.1  2025.11.05  Tony Kwon
 #                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Write bytes-like data without copy
+#
+#               v0.3  2026.10.17  Tony Kwon
+#                   Write on TX thread through bounded queue
+#                   Add flush(), is_busy() and wait_writable() functions
+#
+#               v0.4  2026.10.17  Tony Kwon
+#                   Read on RX thread and add set_rx_callback() function
+#                   Record written time to Telemetry
+#                   Close the open port in init()
+#                   Wait for the in-flight write in flush() (task_done)
+#                   Add set_tx_error_callback() function
 # --------------------------------------------------------------------------------
 
 # --------------------------------------------------------------------------------
 #   Import
 # --------------------------------------------------------------------------------
+import queue
+import threading
+import time
 import serial
 
+from .telemetry import FRAME_DROPPED
+
 # --------------------------------------------------------------------------------
 #   Class - SerialComm
 # --------------------------------------------------------------------------------
 class SerialComm:
-    def __init__(self):
+    def __init__(self, queue_size=64, out_high_water=256):
         self.ser = None
 
+        # TX queue and thread
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.queue_high_water = max(queue_size // 2, 1)
+        self.out_high_water = out_high_water
+        self.thread = None
+
+        # RX thread (callback is called on the RX thread)
+        self.rx_thread = None
+        self.rx_running = False
+        self.rx_callback = None
+
+        # TX error callback (called on the TX thread after a failed write)
+        self.tx_error_callback = None
+
+        # Telemetry (None: disabled)
+        self.telemetry = None
+
+        # Counters
+        self.sent_bytes = 0
+        self.received_bytes = 0
+        self.dropped_cnt = 0
+        self.error_cnt = 0
+
     def init(self, port, baud):
+        # Close the open port and stop its threads first
+        if self.ser is not None:
+            self.deinit()
         try:
-            self.ser = serial.Serial(port, baud, timeout=1)
+            self.ser = serial.Serial(port, baud, timeout=1, write_timeout=1)
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+            self.rx_running = True
+            self.rx_thread = threading.Thread(target=self.run_rx, daemon=True)
+            self.rx_thread.start()
             print('SerialComm init() OK')
             return True
         except:
@@ -27,12 +77,128 @@ class SerialComm:
             return False
 
     def deinit(self):
+        # Drop pending data and stop TX thread
+        self.clear()
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+        if self.rx_thread is not None:
+            self.rx_running = False
+            try:
+                self.ser.cancel_read()
+            except:
+                pass
+            self.rx_thread.join()
+            self.rx_thread = None
         try:
             self.ser.close()
             self.ser = None
         except:
             pass
 
-    def write(self, data):
-        self.ser.write(bytearray(data))
+    def set_telemetry(self, telemetry):
+        self.telemetry = telemetry
+
+    def write(self, data, record_id=None):
+        # Non-blocking submit (False if not open or queue is full)
+        if self.ser is None:
+            return False
+        try:
+            self.queue.put_nowait((bytes(data), record_id))
+            return True
+        except queue.Full:
+            self.dropped_cnt += 1
+            if record_id is not None and self.telemetry is not None:
+                self.telemetry.set_status(record_id, FRAME_DROPPED)
+            return False
+
+    def set_rx_callback(self, callback):
+        self.rx_callback = callback
+
+    def set_tx_error_callback(self, callback):
+        self.tx_error_callback = callback
+
+    def clear(self):
+        while True:
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+            except queue.Empty:
+                break
+
+    def flush(self, timeout=1.0):
+        # Wait until queued, in-flight (not task_done) and OS buffered data is sent
+        end_time = time.perf_counter() + timeout
+        while self.queue.unfinished_tasks > 0 or self.get_out_waiting() > 0:
+            if time.perf_counter() > end_time:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def get_queue_cnt(self):
+        return self.queue.qsize()
+
+    def get_out_waiting(self):
+        try:
+            return self.ser.out_waiting
+        except:
+            return 0
+
+    def is_busy(self):
+        return (self.get_queue_cnt() >= self.queue_high_water
+                or self.get_out_waiting() >= self.out_high_water)
+
+    def wait_writable(self, timeout):
+        # Wait until not busy (False on timeout)
+        end_time = time.perf_counter() + timeout
+        while self.is_busy():
+            if time.perf_counter() > end_time:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def get_sent_bytes(self):
+        return self.sent_bytes
+
+    def get_received_bytes(self):
+        return self.received_bytes
+
+    def get_dropped_cnt(self):
+        return self.dropped_cnt
+
+    def get_error_cnt(self):
+        return self.error_cnt
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                break
+            data, record_id = item
+            try:
+                nbytes = self.ser.write(data)
+                self.sent_bytes += nbytes
+                if record_id is not None and self.telemetry is not None:
+                    self.telemetry.set_written(record_id, time.perf_counter(), nbytes)
+            except:
+                self.error_cnt += 1
+                if self.tx_error_callback is not None:
+                    self.tx_error_callback()
+            finally:
+                self.queue.task_done()
 
+    def run_rx(self):
+        while self.rx_running:
+            try:
+                data = self.ser.read(max(self.ser.in_waiting, 1))
+            except:
+                if self.rx_running:
+                    self.error_cnt += 1
+                break
+            if len(data) == 0:
+                continue
+            self.received_bytes += len(data)
+            if self.rx_callback is not None:
+                self.rx_callback(data)
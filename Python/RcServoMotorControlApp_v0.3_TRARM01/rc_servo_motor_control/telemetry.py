@@ -0,0 +1,164 @@
+# --------------------------------------------------------------------------------
+#   File        telemetry.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Allocate record ids under a lock (several producers)
+#                   Keep record ids after clear() and ignore ids from before
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import csv
+import threading
+import time
+import numpy as np
+
+# --------------------------------------------------------------------------------
+#   Define
+# --------------------------------------------------------------------------------
+FRAME_PENDING = 0
+FRAME_WRITTEN = 1
+FRAME_DROPPED = 2       # SerialComm queue full
+FRAME_COALESCED = 3     # Replaced by a newer frame in TxCoalescer
+FRAME_SKIPPED = 4       # Unchanged delta frame (protocol v2)
+
+FRAME_STATUS_NAMES = ['pending', 'written', 'dropped', 'coalesced', 'skipped']
+
+# --------------------------------------------------------------------------------
+#   Class - Telemetry
+#
+#   Per-frame records in a fixed size ring buffer (one array per field).
+#   add_frame() is called by several frame producers (GUI thread, player
+#   and fleet threads), so record ids are allocated under a lock. set_*() is
+#   called by the TX threads on their own fields of a record and takes no
+#   lock. A record id older than the ring size or from before clear() is
+#   ignored (clear() moves base, ids are never reused).
+#   Times are time.perf_counter() seconds, scheduled is NaN if unpaced.
+# --------------------------------------------------------------------------------
+class Telemetry:
+    def __init__(self, size=8192):
+        self.size = size
+        self.scheduled = np.full(size, np.nan)
+        self.encoded = np.full(size, np.nan)
+        self.written = np.full(size, np.nan)
+        self.nbytes = np.zeros(size, dtype=np.int32)
+        self.queue_cnt = np.zeros(size, dtype=np.int32)
+        self.status = np.zeros(size, dtype=np.int8)
+        self.count = 0
+        self.base = 0
+        self.lock = threading.Lock()
+
+    def clear(self):
+        # Records from before base are dropped, late set_*() on them ignored
+        with self.lock:
+            self.base = self.count
+
+    def get_size(self):
+        return self.size
+
+    def get_count(self):
+        return self.count - self.base
+
+    def is_valid(self, record_id):
+        return record_id >= self.base and self.count - record_id <= self.size
+
+    def add_frame(self, scheduled, encoded, queue_cnt):
+        # Returns record id
+        with self.lock:
+            record_id = self.count
+            slot = record_id % self.size
+            self.scheduled[slot] = np.nan if scheduled is None else scheduled
+            self.encoded[slot] = encoded
+            self.written[slot] = np.nan
+            self.nbytes[slot] = 0
+            self.queue_cnt[slot] = queue_cnt
+            self.status[slot] = FRAME_PENDING
+            self.count = record_id + 1
+        return record_id
+
+    def set_written(self, record_id, written, nbytes):
+        if self.is_valid(record_id):
+            slot = record_id % self.size
+            self.written[slot] = written
+            self.nbytes[slot] = nbytes
+            self.status[slot] = FRAME_WRITTEN
+
+    def set_status(self, record_id, status):
+        if self.is_valid(record_id):
+            self.status[record_id % self.size] = status
+
+    def get_records(self):
+        # Last records since clear() in order, {field: array}, ids from 0
+        count = self.count
+        cnt = min(count - self.base, self.size)
+        index = np.arange(count - cnt, count) % self.size
+        return {
+            'id': np.arange(count - cnt, count) - self.base,
+            'scheduled': self.scheduled[index],
+            'encoded': self.encoded[index],
+            'written': self.written[index],
+            'bytes': self.nbytes[index],
+            'queue': self.queue_cnt[index],
+            'status': self.status[index],
+        }
+
+    def get_stats(self, window=1.0):
+        # Live statistics of the records encoded in the last window seconds
+        records = self.get_records()
+        encoded = records['encoded']
+        mask = encoded >= time.perf_counter() - window
+        status = records['status'][mask]
+        written = records['written'][mask][status == FRAME_WRITTEN]
+
+        # Latency from scheduled time (encoded time if unpaced) to write
+        start = records['scheduled'][mask][status == FRAME_WRITTEN]
+        start = np.where(np.isnan(start), encoded[mask][status == FRAME_WRITTEN], start)
+        latency = written - start
+        intervals = np.diff(np.sort(written))
+        return {
+            'frames': int(np.count_nonzero(mask)),
+            'rate': len(written) / window,
+            'byte_rate': float(records['bytes'][mask].sum()) / window,
+            'latency_mean': float(latency.mean()) if len(latency) > 0 else 0.0,
+            'latency_max': float(latency.max()) if len(latency) > 0 else 0.0,
+            'jitter': float(intervals.std()) if len(intervals) > 1 else 0.0,
+            'dropped': int(np.count_nonzero(status == FRAME_DROPPED)),
+            'coalesced': int(np.count_nonzero(status == FRAME_COALESCED)),
+            'skipped': int(np.count_nonzero(status == FRAME_SKIPPED)),
+            'queue_max': int(records['queue'][mask].max()) if np.any(mask) else 0,
+        }
+
+    def save_csv(self, path):
+        records = self.get_records()
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'scheduled', 'encoded', 'written', 'bytes', 'queue', 'status'])
+            for i in range(len(records['id'])):
+                writer.writerow([
+                    int(records['id'][i]),
+                    f'{records["scheduled"][i]:.6f}',
+                    f'{records["encoded"][i]:.6f}',
+                    f'{records["written"][i]:.6f}',
+                    int(records['bytes'][i]),
+                    int(records['queue'][i]),
+                    FRAME_STATUS_NAMES[records['status'][i]],
+                ])
+
+    def save_parquet(self, path):
+        # Needs pyarrow (optional)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        records = self.get_records()
+        records['status'] = np.array(FRAME_STATUS_NAMES)[records['status']]
+        pq.write_table(pa.table(records), path)
+
+    def save(self, path):
+        if path.lower().endswith('.parquet'):
+            self.save_parquet(path)
+        else:
+            self.save_csv(path)
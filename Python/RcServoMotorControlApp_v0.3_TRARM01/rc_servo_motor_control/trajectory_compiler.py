@@ -0,0 +1,158 @@
+# --------------------------------------------------------------------------------
+#   File        trajectory_compiler.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Add trapezoid and min_jerk profiles
+#
+#               v0.3  2026.10.17  Tony Kwon
+#                   Add catmull_rom and cubic_spline profiles
+#
+#               v0.4  2026.10.17  Tony Kwon
+#                   Round linear frames of non-integer step (disk cache)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import hashlib
+import os
+from collections import OrderedDict
+import numpy as np
+
+from .interp import Interp
+from .motion_profile import MotionProfile
+from .trajectory_file import TrajectoryFile
+
+# --------------------------------------------------------------------------------
+#   Class - CompiledTrajectory
+# --------------------------------------------------------------------------------
+class CompiledTrajectory:
+    def __init__(self, frames, ticks, data, is_tick):
+        self.frames = frames        # (frames x motors) in tick or angle
+        self.ticks = ticks          # (frames x motors) clamped ticks
+        self.data = data            # encoded frames, back-to-back
+        self.is_tick = is_tick
+        self.frame_size = len(data) // len(frames) if len(frames) > 0 else 0
+        self.data_view = memoryview(data)
+
+    def get_frame_cnt(self):
+        return len(self.frames)
+
+    def get_frame(self, index):
+        return self.frames[index].tolist()
+
+    def get_ticks(self, index):
+        return self.ticks[index].tolist()
+
+    def get_data(self, index):
+        return self.data_view[index * self.frame_size:(index + 1) * self.frame_size]
+
+    def get_nbytes(self):
+        return self.frames.nbytes + self.ticks.nbytes + len(self.data)
+
+# --------------------------------------------------------------------------------
+#   Class - TrajectoryCompiler
+#
+#   Compiles action rows, step and tick/angle type into a CompiledTrajectory.
+#   profile 'linear' steps joints by step per frame (Interp), other profiles
+#   (trapezoid, min_jerk, catmull_rom, cubic_spline) are time-based at
+#   interval (MotionProfile).
+#   Results are cached by content hash in memory (LRU) and optionally in
+#   cache_dir as trajectory files.
+# --------------------------------------------------------------------------------
+class TrajectoryCompiler:
+    def __init__(self, model, cache_size=8, cache_dir=None):
+        self.model = model
+        self.interp = Interp()
+        self.file = TrajectoryFile()
+
+        # Cache
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        # Counters
+        self.hit_cnt = 0
+        self.disk_hit_cnt = 0
+        self.miss_cnt = 0
+
+    def get_key(self, rows, step, is_tick, profile, interval):
+        rows = np.ascontiguousarray(rows)
+        motors = [(self.model.get_tick_min(i), self.model.get_tick_max(i),
+                   self.model.get_angle_min(i), self.model.get_angle_max(i))
+                  for i in range(self.model.get_motor_cnt())]
+        if profile == 'linear':
+            params = (step,)
+        else:
+            vel_max, acc_max = self.model.get_motion_limits(is_tick)
+            params = (interval, vel_max.tolist(), acc_max.tolist())
+        key = hashlib.sha1()
+        key.update(rows.tobytes())
+        key.update(repr((rows.dtype.str, rows.shape, is_tick, motors, profile, params)).encode('utf-8'))
+        return key.hexdigest()
+
+    def compile(self, rows, step, is_tick, profile='linear', interval=0.02):
+        key = self.get_key(rows, step, is_tick, profile, interval)
+
+        # Memory cache
+        trajectory = self.cache.get(key)
+        if trajectory is not None:
+            self.cache.move_to_end(key)
+            self.hit_cnt += 1
+            return trajectory
+
+        # Disk cache
+        path = None
+        if self.cache_dir is not None:
+            path = os.path.join(self.cache_dir, key + '.trj')
+        if path is not None and os.path.exists(path):
+            frames, _, _ = self.file.load(path)
+            frames = np.array(frames, dtype=int)
+            self.disk_hit_cnt += 1
+        else:
+            frames = self.get_frames(rows, step, is_tick, profile, interval)
+            self.miss_cnt += 1
+            if path is not None:
+                self.file.save(path, frames, is_tick=is_tick)
+
+        trajectory = self.build(frames, is_tick)
+        self.cache[key] = trajectory
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return trajectory
+
+    def get_frames(self, rows, step, is_tick, profile, interval):
+        if profile == 'linear':
+            # Non-integer step gives float frames, round like MotionProfile
+            # (trajectory files store int16)
+            frames = self.interp.get_interp_array(rows, step)
+            if not np.issubdtype(frames.dtype, np.integer):
+                frames = np.rint(frames).astype(int)
+            return frames
+        vel_max, acc_max = self.model.get_motion_limits(is_tick)
+        return MotionProfile(profile, vel_max, acc_max).get_profile_array(rows, interval)
+
+    def build(self, frames, is_tick):
+        if is_tick is True:
+            ticks = self.model.clip_ticks_array(frames)
+        else:
+            ticks = self.model.convert_angles_to_ticks(frames)
+        data = self.model.encode_ticks_array(ticks)
+        return CompiledTrajectory(frames, ticks, data, is_tick)
+
+    def clear(self):
+        self.cache.clear()
+
+    def get_hit_cnt(self):
+        return self.hit_cnt
+
+    def get_disk_hit_cnt(self):
+        return self.disk_hit_cnt
+
+    def get_miss_cnt(self):
+        return self.miss_cnt
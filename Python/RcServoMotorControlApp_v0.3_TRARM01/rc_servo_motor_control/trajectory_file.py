@@ -0,0 +1,132 @@
+# --------------------------------------------------------------------------------
+#   File        trajectory_file.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Check data type, shape and int16 range in save()
+#                   Accept empty (0 x motors) data in save()
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import ast
+import json
+import struct
+import numpy as np
+
+# --------------------------------------------------------------------------------
+#   Define
+#
+#   File    Header (32 bytes, little-endian)
+#               magic        4s   b'TRJ1'
+#               version      H
+#               flags        H    bit0: is_tick
+#               rows         I
+#               motors       I
+#               data_offset  I
+#               names_offset I
+#               names_size   I
+#               reserved     4x
+#           Data  rows x motors int16 (little-endian)
+#           Names UTF-8 JSON list of row names (empty for trajectories)
+# --------------------------------------------------------------------------------
+TRAJECTORY_MAGIC = b'TRJ1'
+TRAJECTORY_VERSION = 1
+TRAJECTORY_HEADER = struct.Struct('<4sHHIIIII4x')
+TRAJECTORY_DTYPE = np.dtype('<i2')
+TRAJECTORY_FLAG_TICK = 0x0001
+
+# --------------------------------------------------------------------------------
+#   Class - TrajectoryFile
+# --------------------------------------------------------------------------------
+class TrajectoryFile:
+
+    def save(self, path, data, names=None, is_tick=True):
+        # Data must be (rows x motors) integers within int16 (rows may be 0)
+        data = np.asarray(data)
+        if data.ndim != 2:
+            raise ValueError(f'Data shape {data.shape} != (rows, motors)')
+        if not np.issubdtype(data.dtype, np.integer):
+            raise ValueError(f'Data type {data.dtype} is not integer')
+        limits = np.iinfo(TRAJECTORY_DTYPE)
+        if data.size > 0 and (data.min() < limits.min or data.max() > limits.max):
+            raise ValueError(f'Data out of int16 range [{data.min()}, {data.max()}]')
+        rows, motors = data.shape
+        names = json.dumps(names or [], ensure_ascii=False).encode('utf-8')
+        
+        data_offset = TRAJECTORY_HEADER.size
+        names_offset = data_offset + rows * motors * TRAJECTORY_DTYPE.itemsize
+        flags = TRAJECTORY_FLAG_TICK if is_tick else 0
+
+        with open(path, 'wb') as f:
+            f.write(TRAJECTORY_HEADER.pack(TRAJECTORY_MAGIC, TRAJECTORY_VERSION, flags,
+                                           rows, motors, data_offset, names_offset, len(names)))
+            f.write(np.ascontiguousarray(data, dtype=TRAJECTORY_DTYPE).tobytes())
+            f.write(names)
+
+    def load_header(self, path):
+        with open(path, 'rb') as f:
+            header = f.read(TRAJECTORY_HEADER.size)
+        if len(header) < TRAJECTORY_HEADER.size:
+            raise ValueError(f'{path} - Not trajectory file')
+        magic, version, flags, rows, motors, data_offset, names_offset, names_size = TRAJECTORY_HEADER.unpack(header)
+        if magic != TRAJECTORY_MAGIC or version != TRAJECTORY_VERSION:
+            raise ValueError(f'{path} - Not trajectory file')
+        return {
+            'is_tick': bool(flags & TRAJECTORY_FLAG_TICK),
+            'rows': rows,
+            'motors': motors,
+            'data_offset': data_offset,
+            'names_offset': names_offset,
+            'names_size': names_size,
+        }
+
+    def load(self, path, mode='r'):
+        # Data is memory-mapped (no parsing), names are read from file end
+        header = self.load_header(path)
+        if header['rows'] == 0:
+            data = np.empty((0, header['motors']), dtype=TRAJECTORY_DTYPE)
+        else:
+            data = np.memmap(path, dtype=TRAJECTORY_DTYPE, mode=mode, offset=header['data_offset'],
+                             shape=(header['rows'], header['motors']))
+
+        names = []
+        if header['names_size'] > 0:
+            with open(path, 'rb') as f:
+                f.seek(header['names_offset'])
+                names = json.loads(f.read(header['names_size']).decode('utf-8'))
+        return data, names, header['is_tick']
+
+    def load_json(self, path):
+        # Pose.json / Action.json -> (rows x motors) data, names, is_tick
+        with open(path, 'r', encoding='utf-8') as f:
+            items = json.load(f)
+        if len(items) < 1:
+            raise ValueError(f'{path} - File error')
+        names = [item['name'] for item in items[1:]]
+        rows = [ast.literal_eval(item['data']) for item in items[1:]]
+        data = np.array(rows, dtype=int) if rows else np.empty((0, 0), dtype=int)
+        return data, names, items[0]['is_tick']
+
+    def save_json(self, path, data, names, is_tick):
+        items = [{'is_tick': bool(is_tick)}]
+        for name, row in zip(names, np.asarray(data).tolist()):
+            items.append({
+                'name': name,
+                'data': str(row),
+            })
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(items, f, indent=4, ensure_ascii=False)
+
+    def convert_json_to_binary(self, json_path, path):
+        data, names, is_tick = self.load_json(json_path)
+        self.save(path, data, names, is_tick)
+
+    def convert_binary_to_json(self, path, json_path):
+        data, names, is_tick = self.load(path)
+        if len(names) < len(data):
+            names = names + [f'Frame{i + 1}' for i in range(len(names), len(data))]
+        self.save_json(json_path, data, names, is_tick)
@@ -0,0 +1,94 @@
+# --------------------------------------------------------------------------------
+#   File        trajectory_stream.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Add trapezoid and min_jerk profiles
+#
+#               v0.3  2026.10.17  Tony Kwon
+#                   Reject spline profiles (need the whole keyframe list)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import numpy as np
+
+from .interp import Interp
+from .motion_profile import MotionProfile, PROFILE_SPLINES
+from .trajectory_compiler import CompiledTrajectory
+
+# --------------------------------------------------------------------------------
+#   Class - TrajectoryStream
+#
+#   Lazy pipeline, one chunk of at most about chunk_size frames per stage:
+#       iter_keyframes()  keyframe source (loop 0: forever)
+#       iter_frames()     interpolator
+#       iter_ticks()      tick/angle to tick converter
+#       iter_data()       frame encoder -> CompiledTrajectory chunks
+#   The chunks are sent by ActionPlayer.start_stream() (transport).
+# --------------------------------------------------------------------------------
+class TrajectoryStream:
+    def __init__(self, model, chunk_size=256):
+        self.model = model
+        self.interp = Interp()
+        self.chunk_size = chunk_size
+
+    def stream(self, rows, step, is_tick, loop=1, profile='linear', interval=0.02):
+        keyframes = self.iter_keyframes(rows, loop)
+        frames = self.iter_frames(keyframes, step, is_tick, profile, interval)
+        ticks = self.iter_ticks(frames, is_tick)
+        return self.iter_data(ticks, is_tick)
+
+    def iter_keyframes(self, rows, loop=1):
+        # rows may be a list, array or trajectory file memmap
+        count = 0
+        while loop == 0 or count < loop:
+            for row in rows:
+                yield np.asarray(row)
+            count += 1
+
+    def iter_frames(self, keyframes, step, is_tick=True, profile='linear', interval=0.02):
+        # Spline tangents depend on following keyframes, compile them instead
+        if profile in PROFILE_SPLINES:
+            raise ValueError(f'Profile {profile} is not supported in stream mode')
+
+        motion = None
+        if profile != 'linear':
+            vel_max, acc_max = self.model.get_motion_limits(is_tick)
+            motion = MotionProfile(profile, vel_max, acc_max)
+
+        chunk = []
+        chunk_cnt = 0
+        row_pre = None
+        for row in keyframes:
+            if row_pre is None:
+                frames = row.reshape(1, -1)
+            elif motion is None:
+                frames = self.interp.get_interp_array([row_pre, row], step)[1:]
+            else:
+                frames = motion.get_profile_array([row_pre, row], interval)[1:]
+            row_pre = row
+
+            chunk.append(frames)
+            chunk_cnt += len(frames)
+            if chunk_cnt >= self.chunk_size:
+                yield np.concatenate(chunk)
+                chunk = []
+                chunk_cnt = 0
+
+        if chunk_cnt > 0:
+            yield np.concatenate(chunk)
+
+    def iter_ticks(self, frames_chunks, is_tick):
+        for frames in frames_chunks:
+            if is_tick is True:
+                yield frames, self.model.clip_ticks_array(frames)
+            else:
+                yield frames, self.model.convert_angles_to_ticks(frames)
+
+    def iter_data(self, ticks_chunks, is_tick):
+        for frames, ticks in ticks_chunks:
+            yield CompiledTrajectory(frames, ticks, self.model.encode_ticks_array(ticks), is_tick)
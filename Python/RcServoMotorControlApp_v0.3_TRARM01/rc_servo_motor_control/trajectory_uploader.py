@@ -0,0 +1,262 @@
+# --------------------------------------------------------------------------------
+#   File        trajectory_uploader.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Raise ValueError in start() for interval out of 1~254 ms (was clamped)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import queue
+import threading
+import time
+
+from .frame_encoder import (
+    FRAME_START,
+    FRAME_UPLOAD,
+    FRAME_SEQ_MAX,
+    CONTROL_CLEAR,
+    CONTROL_PLAY,
+    CONTROL_STOP,
+    CONTROL_ARG_MAX,
+    UploadFrameEncoder,
+)
+
+# --------------------------------------------------------------------------------
+#   Define
+# --------------------------------------------------------------------------------
+UPLOAD_STATE_PLAY = 0x01
+UPLOAD_STATE_UNDERRUN = 0x02
+
+# --------------------------------------------------------------------------------
+#   Class - UploadAckDecoder
+#
+#   Ack     0xFF 0xFF 0xFD seq free state   (board -> host)
+# --------------------------------------------------------------------------------
+class UploadAckDecoder:
+    def __init__(self):
+        self.header = bytes((FRAME_START, FRAME_START, FRAME_UPLOAD))
+        self.buffer = bytearray()
+
+    def clear(self):
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        # Returns decoded (seq, free, state) acks
+        self.buffer += data
+        acks = []
+        while True:
+            index = self.buffer.find(self.header)
+            if index < 0:
+                del self.buffer[:max(len(self.buffer) - 2, 0)]
+                break
+            if len(self.buffer) < index + 6:
+                del self.buffer[:index]
+                break
+            acks.append(tuple(self.buffer[index + 3:index + 6]))
+            del self.buffer[:index + 6]
+        return acks
+
+# --------------------------------------------------------------------------------
+#   Class - TrajectoryUploader
+#
+#   Uploads a CompiledTrajectory to the board buffer in chunks and lets the
+#   board play it on its own timer (RcServoMotorControl.ino v0.3).
+#   Flow control is credit based: chunks are sent while the frames in
+#   flight fit in the free frames of the last ack. Unacked chunks are sent
+#   again from the oldest one after ack_timeout (go-back-N).
+# --------------------------------------------------------------------------------
+class TrajectoryUploader:
+    def __init__(self, model, chunk_frames=16, ack_timeout=0.5):
+        self.model = model
+        self.encoder = UploadFrameEncoder(model.get_motor_cnt())
+        self.decoder = UploadAckDecoder()
+        self.chunk_frames = chunk_frames
+        self.ack_timeout = ack_timeout
+        self.acks = queue.Queue()
+
+        # Upload
+        self.trajectory = None
+        self.interval = 0.02
+        self.interval_ms = 20
+        self.capacity = 0
+
+        # Thread
+        self.thread = None
+        self.running = False
+        self.stop_event = threading.Event()
+        self.finish_callback = None
+
+        # Statistics
+        self.chunk_cnt = 0
+        self.retry_cnt = 0
+        self.acked_frame_cnt = 0
+        self.is_underrun = False
+        self.error = None
+
+    def set_finish_callback(self, callback):
+        self.finish_callback = callback
+
+    def start(self, trajectory, interval):
+        # Board interval is one control arg byte in ms
+        interval_ms = int(round(interval * 1000))
+        if not 1 <= interval_ms <= CONTROL_ARG_MAX:
+            raise ValueError(f'Upload interval {interval}[sec] out of 0.001~{CONTROL_ARG_MAX / 1000}[sec]')
+        self.stop()
+
+        self.trajectory = trajectory
+        self.interval = interval
+        self.interval_ms = interval_ms
+        self.chunk_cnt = 0
+        self.retry_cnt = 0
+        self.acked_frame_cnt = 0
+        self.is_underrun = False
+        self.error = None
+
+        self.stop_event.clear()
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+    def is_running(self):
+        return self.running
+
+    def get_capacity(self):
+        return self.capacity
+
+    def get_chunk_cnt(self):
+        return self.chunk_cnt
+
+    def get_retry_cnt(self):
+        return self.retry_cnt
+
+    def get_acked_frame_cnt(self):
+        return self.acked_frame_cnt
+
+    def get_underrun(self):
+        # Board buffer ran empty before the last chunk was acked
+        return self.is_underrun
+
+    def get_error(self):
+        return self.error
+
+    def on_rx(self, data):
+        # Called on the SerialComm RX thread
+        for ack in self.decoder.feed(data):
+            self.acks.put(ack)
+
+    def get_ack(self, timeout):
+        try:
+            return self.acks.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def clear_acks(self):
+        while True:
+            try:
+                self.acks.get_nowait()
+            except queue.Empty:
+                break
+
+    def run(self):
+        self.decoder.clear()
+        self.clear_acks()
+        self.model.set_rx_callback(self.on_rx)
+        try:
+            if not self.upload():
+                self.model.write_data(self.encoder.encode_control(CONTROL_STOP))
+        finally:
+            self.model.set_rx_callback(None)
+            self.running = False
+            if self.finish_callback is not None:
+                self.finish_callback()
+
+    def clear_board(self, retry=3):
+        # Clear board buffer and get its capacity (free frames)
+        for _ in range(retry):
+            self.model.write_data(self.encoder.encode_control(CONTROL_CLEAR, self.model.get_motor_cnt()))
+            end_time = time.perf_counter() + self.ack_timeout
+            while True:
+                ack = self.get_ack(max(end_time - time.perf_counter(), 0.0))
+                if ack is None:
+                    break
+                seq, free, state = ack
+                if seq == FRAME_SEQ_MAX - 1 and state == 0 and free > 0:
+                    return free
+        return 0
+
+    def upload(self):
+        ticks = self.trajectory.ticks
+        frame_cnt = len(ticks)
+        self.capacity = self.clear_board()
+        if self.capacity == 0:
+            self.error = 'No ack from board'
+            return False
+
+        # Chunks (start, end) frame ranges
+        chunk_frames = min(self.chunk_frames, self.encoder.get_chunk_frame_max(), self.capacity)
+        chunks = [(start, min(start + chunk_frames, frame_cnt)) for start in range(0, frame_cnt, chunk_frames)]
+        interval_ms = self.interval_ms
+
+        base = 0
+        index = 0
+        free = self.capacity
+        is_play = False
+        while base < len(chunks):
+            if self.stop_event.is_set():
+                return False
+
+            # Send chunks within credit
+            inflight = sum(end - start for start, end in chunks[base:index])
+            while index < len(chunks) and inflight + chunks[index][1] - chunks[index][0] <= free:
+                start, end = chunks[index]
+                self.model.write_data(self.encoder.encode_chunk(index % FRAME_SEQ_MAX, ticks[start:end]))
+                self.chunk_cnt += 1
+                inflight += end - start
+                index += 1
+
+            # Start board playback once the buffer is full or all chunks are sent
+            if is_play is False and (index == len(chunks) or inflight + chunks[index][1] - chunks[index][0] > free):
+                self.model.write_data(self.encoder.encode_control(CONTROL_PLAY, interval_ms))
+                is_play = True
+
+            ack = self.get_ack(self.ack_timeout)
+            if ack is None:
+                # Go back to the oldest unacked chunk
+                if index > base:
+                    self.retry_cnt += index - base
+                    index = base
+                continue
+
+            seq, free, state = ack
+            for k in range(base, index):
+                if k % FRAME_SEQ_MAX == seq:
+                    self.acked_frame_cnt = chunks[k][1]
+                    base = k + 1
+                    break
+            if state & UPLOAD_STATE_UNDERRUN and base < len(chunks):
+                self.is_underrun = True
+
+        # Wait until the board buffer is played out
+        end_time = time.perf_counter() + (self.capacity - free) * self.interval + 1.0
+        while free < self.capacity:
+            if self.stop_event.is_set():
+                return False
+            ack = self.get_ack(max(end_time - time.perf_counter(), 0.0))
+            if ack is None:
+                self.error = 'Playback timeout'
+                return False
+            free = ack[1]
+
+        self.model.write_data(self.encoder.encode_control(CONTROL_STOP))
+        return True
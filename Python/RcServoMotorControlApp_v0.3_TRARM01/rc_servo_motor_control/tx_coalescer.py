@@ -0,0 +1,167 @@
+# --------------------------------------------------------------------------------
+#   File        tx_coalescer.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Convert written frames with DeltaFrameEncoder (protocol v2)
+#                   Pass Telemetry record id to comm
+#                   Take and write pending frame in one write_lock section
+#                   Add set_resync() function (full frame after comm TX error)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import threading
+import time
+
+from .telemetry import FRAME_COALESCED, FRAME_SKIPPED
+
+# --------------------------------------------------------------------------------
+#   Class - TxCoalescer
+#
+#   Keeps only the newest submitted frame and writes it to comm at most
+#   max_rate times per second. Superseded frames are dropped.
+# --------------------------------------------------------------------------------
+class TxCoalescer:
+    def __init__(self, comm, max_rate=50):
+        self.comm = comm
+        self.interval = 1.0 / max_rate
+
+        # Pending frame
+        self.pending = None
+        self.cond = threading.Condition()
+        self.write_lock = threading.Lock()
+        self.delta_encoder = None
+        self.resync = False
+        self.telemetry = None
+
+        # Thread
+        self.thread = None
+        self.running = False
+
+        # Counters
+        self.queued_cnt = 0
+        self.coalesced_cnt = 0
+        self.sent_cnt = 0
+
+    def set_max_rate(self, max_rate):
+        self.interval = 1.0 / max_rate
+
+    def get_max_rate(self):
+        return 1.0 / self.interval
+
+    def set_delta_encoder(self, delta_encoder):
+        with self.write_lock:
+            self.delta_encoder = delta_encoder
+
+    def get_delta_encoder(self):
+        return self.delta_encoder
+
+    def set_resync(self):
+        # Frame lost after submit (comm TX error), next frame is a full frame
+        self.resync = True
+
+    def set_telemetry(self, telemetry):
+        self.telemetry = telemetry
+
+    def set_coalesced(self, pending):
+        # Called with cond held
+        if pending[1] is not None and self.telemetry is not None:
+            self.telemetry.set_status(pending[1], FRAME_COALESCED)
+        self.coalesced_cnt += 1
+
+    def start(self):
+        self.stop()
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self.cond:
+            self.running = False
+            self.pending = None
+            self.cond.notify()
+        if self.thread is not None:
+            self.thread.join()
+        self.thread = None
+
+    def submit(self, data, record_id=None):
+        # Copy data (trajectory frames are views of the compiled buffer)
+        with self.cond:
+            if self.pending is not None:
+                self.set_coalesced(self.pending)
+            self.pending = (bytes(data), record_id)
+            self.queued_cnt += 1
+            self.cond.notify()
+
+    def send(self, data, record_id=None):
+        # Write now and drop any older pending frame
+        with self.write_lock:
+            with self.cond:
+                if self.pending is not None:
+                    self.set_coalesced(self.pending)
+                    self.pending = None
+            self.write(data, record_id)
+
+    def reset_counters(self):
+        self.queued_cnt = 0
+        self.coalesced_cnt = 0
+        self.sent_cnt = 0
+
+    def get_queued_cnt(self):
+        return self.queued_cnt
+
+    def get_coalesced_cnt(self):
+        return self.coalesced_cnt
+
+    def get_sent_cnt(self):
+        return self.sent_cnt
+
+    def write(self, data, record_id=None):
+        # Called with write_lock held
+        delta_encoder = self.delta_encoder
+        if delta_encoder is not None:
+            if self.resync:
+                self.resync = False
+                delta_encoder.reset()
+            data = delta_encoder.convert(data)
+            if len(data) == 0:
+                if record_id is not None and self.telemetry is not None:
+                    self.telemetry.set_status(record_id, FRAME_SKIPPED)
+                return
+        if not self.comm.write(data, record_id) and delta_encoder is not None:
+            # Dropped frame, resync with a full frame
+            delta_encoder.reset()
+        self.sent_cnt += 1
+
+    def run(self):
+        next_time = time.perf_counter()
+        while True:
+            with self.cond:
+                # Wait for pending frame
+                while self.running and self.pending is None:
+                    self.cond.wait()
+
+                # Wait for next TX slot (newer frames may replace pending)
+                while self.running:
+                    delay = next_time - time.perf_counter()
+                    if delay <= 0:
+                        break
+                    self.cond.wait(delay)
+
+                if not self.running:
+                    break
+
+            # Take pending frame under write_lock (same order as send()), so a
+            # frame written by send() can not be followed by an older one
+            with self.write_lock:
+                with self.cond:
+                    pending = self.pending
+                    self.pending = None
+                if pending is None:
+                    continue
+                self.write(pending[0], pending[1])
+            next_time = time.perf_counter() + self.interval
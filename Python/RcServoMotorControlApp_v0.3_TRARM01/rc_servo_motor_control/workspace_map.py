@@ -0,0 +1,156 @@
+# --------------------------------------------------------------------------------
+#   File        workspace_map.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Raise ValueError in load() if the map is for other dimensions or calibration
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from .forward_kinematics import ForwardKinematics
+
+# --------------------------------------------------------------------------------
+#   Function - process pool worker
+# --------------------------------------------------------------------------------
+def reduce_voxels(voxels, ticks, distances):
+    # One pose per voxel, the one closest to the voxel center
+    order = np.lexsort((distances, voxels))
+    voxels = voxels[order]
+    first = np.ones(len(voxels), dtype=bool)
+    first[1:] = voxels[1:] != voxels[:-1]
+    return voxels[first], ticks[order][first], distances[order][first]
+
+def sweep_workspace(params, ticks_list, origin, voxel_size, shape):
+    # Tool voxels of the (ticks1 x ticks2 x ticks3) joint grid
+    fk = ForwardKinematics(**params)
+    ticks = np.stack(np.meshgrid(*ticks_list, indexing='ij'), axis=-1).reshape(-1, 3)
+    positions = fk.get_positions_from_ticks(ticks)
+
+    index = np.floor((positions - origin) / voxel_size).astype(int)
+    inside = np.all((index >= 0) & (index < shape), axis=1)
+    ticks = ticks[inside]
+    positions = positions[inside]
+    index = index[inside]
+
+    distances = np.linalg.norm(positions - (origin + (index + 0.5) * voxel_size), axis=1)
+    voxels = np.ravel_multi_index(index.T, shape)
+    return reduce_voxels(voxels, ticks, distances)
+
+# --------------------------------------------------------------------------------
+#   Class - WorkspaceMap
+#
+#   Reachable tool workspace of TRARM01 within the motor tick limits as a
+#   voxel occupancy grid with one joint pose (ticks) per voxel.
+#   build() sweeps the joint grid (tick_step) through ForwardKinematics
+#   split by motor 1 ticks over a process pool. Queries index the grid
+#   directly, so their cost does not depend on the map size.
+# --------------------------------------------------------------------------------
+class WorkspaceMap:
+    def __init__(self, model=None, fk=None, voxel_size=5.0):
+        self.fk = fk if fk is not None else ForwardKinematics(model)
+        self.voxel_size = voxel_size
+
+        # Grid (centered on motor 2 axis, arm length in every direction)
+        reach = self.fk.link2_length + self.fk.link3_length
+        self.origin = np.array([-reach, -reach, self.fk.get_shoulder_height() - reach])
+        self.shape = tuple([int(np.ceil(2 * reach / voxel_size)) + 1] * 3)
+        self.occupancy = np.zeros(self.shape, dtype=bool)
+        self.poses = np.full(self.shape + (3,), -1, dtype=np.int16)
+        self.sample_cnt = 0
+
+    def build(self, tick_step=1, workers=None):
+        # Sweep joint grid, workers: process count (None: CPU count, 1: no pool)
+        params = self.fk.get_params()
+        tick_mins, tick_maxs = params['calibration'][0], params['calibration'][1]
+        ticks_list = [np.arange(tick_mins[i], tick_maxs[i] + 1, tick_step, dtype=np.int16) for i in range(3)]
+        self.sample_cnt = len(ticks_list[0]) * len(ticks_list[1]) * len(ticks_list[2])
+
+        # Chunks of about 8 motor 1 ticks (bounded memory), at least 4 per worker
+        workers = workers if workers is not None else os.cpu_count()
+        chunk_cnt = max(workers * 4, len(ticks_list[0]) // 8)
+        chunks = [chunk for chunk in np.array_split(ticks_list[0], chunk_cnt) if len(chunk) > 0]
+        if workers == 1:
+            results = [sweep_workspace(params, [chunk, ticks_list[1], ticks_list[2]], self.origin, self.voxel_size, self.shape)
+                       for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(sweep_workspace, params, [chunk, ticks_list[1], ticks_list[2]],
+                                           self.origin, self.voxel_size, self.shape) for chunk in chunks]
+                results = [future.result() for future in futures]
+
+        # Merge chunks
+        voxels, ticks, distances = reduce_voxels(np.concatenate([result[0] for result in results]),
+                                                 np.concatenate([result[1] for result in results]),
+                                                 np.concatenate([result[2] for result in results]))
+        self.occupancy = np.zeros(self.shape, dtype=bool)
+        self.occupancy.flat[voxels] = True
+        self.poses = np.full(self.shape + (3,), -1, dtype=np.int16)
+        self.poses.reshape(-1, 3)[voxels] = ticks
+
+    def save(self, path):
+        np.savez_compressed(path, occupancy=self.occupancy, poses=self.poses, origin=self.origin,
+                            voxel_size=self.voxel_size, sample_cnt=self.sample_cnt,
+                            params=json.dumps(self.fk.get_params()))
+
+    def load(self, path):
+        with np.load(path, allow_pickle=False) as data:
+            params = json.loads(str(data['params']))
+            if params != self.fk.get_params():
+                raise ValueError(f'{path} is for other dimensions or calibration')
+            self.occupancy = data['occupancy']
+            self.poses = data['poses']
+            self.origin = data['origin']
+            self.voxel_size = float(data['voxel_size'])
+            self.sample_cnt = int(data['sample_cnt'])
+            self.shape = self.occupancy.shape
+
+    def get_voxel_size(self):
+        return self.voxel_size
+
+    def get_voxel_cnt(self):
+        return int(np.count_nonzero(self.occupancy))
+
+    def get_volume(self):
+        # Reachable volume [mm^3]
+        return self.get_voxel_cnt() * self.voxel_size ** 3
+
+    def get_sample_cnt(self):
+        return self.sample_cnt
+
+    def get_index(self, point):
+        # Voxel index of a point, None if outside the grid
+        index = tuple(int(value) for value in np.floor((np.asarray(point, dtype=float) - self.origin) / self.voxel_size))
+        if any(value < 0 or value >= size for value, size in zip(index, self.shape)):
+            return None
+        return index
+
+    def is_reachable(self, point):
+        index = self.get_index(point)
+        return index is not None and bool(self.occupancy[index])
+
+    def get_pose(self, point):
+        # Ticks reaching the voxel of a point, None if not reachable
+        index = self.get_index(point)
+        if index is None or not self.occupancy[index]:
+            return None
+        return self.poses[index].tolist()
+
+    def query_array(self, points):
+        # (n x 3) points -> (n) reachable, (n x 3) ticks (-1 if not reachable)
+        index = np.floor((np.asarray(points, dtype=float) - self.origin) / self.voxel_size).astype(int)
+        inside = np.all((index >= 0) & (index < self.shape), axis=1)
+        reachable = np.zeros(len(index), dtype=bool)
+        ticks = np.full((len(index), 3), -1, dtype=int)
+        index = tuple(index[inside].T)
+        reachable[inside] = self.occupancy[index]
+        ticks[inside] = self.poses[index]
+        return reachable, ticks
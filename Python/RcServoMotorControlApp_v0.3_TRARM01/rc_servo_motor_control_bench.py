@@ -0,0 +1,420 @@
+# --------------------------------------------------------------------------------
+#   File        rc_servo_motor_control_bench.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Add conversion, encoding and playback benchmarks
+#                   Save results to JSON file
+#
+#               v0.3  2026.10.17  Tony Kwon
+#                   Add cold-start benchmark
+#
+#               v0.4  2026.10.17  Tony Kwon
+#                   Add link utilization benchmark (protocol v1, v2)
+#                   Set frame ticks in rotate benchmark (encoded the same frame)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import argparse
+import copy
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+from rc_servo_motor_control.interp import Interp
+from rc_servo_motor_control.rc_servo_motor_control_model import RcServoMotor, RcServoMotorControlModel
+from rc_servo_motor_control.action_player import ActionPlayer
+from rc_servo_motor_control.trajectory_compiler import TrajectoryCompiler
+from rc_servo_motor_control.board_emulator import BoardEmulator
+from rc_servo_motor_control.frame_encoder import DeltaFrameEncoder
+from rc_servo_motor_control.motion_profile import MotionProfile
+
+# --------------------------------------------------------------------------------
+#   Class - LegacyInterp (v0.1 loop implementation, reference only)
+# --------------------------------------------------------------------------------
+class LegacyInterp:
+
+    def get_interp_lists(self, arrs, step):
+        arr_list = []
+        arr_list.append(arrs[0])
+        for i in range(len(arrs) - 1):
+            arr_list.extend(self.get_interp_list(arrs[i], arrs[i + 1], step))
+        return arr_list
+
+    def get_interp_list(self, arr1, arr2, step):
+        arr_list = []
+        arr1 = copy.copy(arr1)
+        arr2 = copy.copy(arr2)
+        cnt = int(self.get_max_value(arr1, arr2) / step)
+        for j in range(cnt):
+            arr = []
+            for i in range(len(arr1)):
+                if arr1[i] < arr2[i]:
+                    if arr1[i] < (arr2[i] + step):
+                        arr.append(arr1[i] + step)
+                    else:
+                        arr.append(arr2[i])
+                else:
+                    if (arr1[i] - step) > arr2[i]:
+                        arr.append(arr1[i] - step)
+                    else:
+                        arr.append(arr2[i])
+                arr1[i] = arr[i]
+            arr_list.append(arr)
+        return arr_list
+
+    def get_max_value(self, arr1, arr2):
+        diffs = [abs(x - y) for x, y in zip(arr1, arr2)]
+        return max(diffs)
+
+# --------------------------------------------------------------------------------
+#   Function
+# --------------------------------------------------------------------------------
+def get_action(pose_cnt, motor_ticks, seed=0):
+    rand = random.Random(seed)
+    return [[rand.randint(tick[1], tick[2]) for tick in motor_ticks] for _ in range(pose_cnt)]
+
+def get_model(motor_ticks, motor_angles):
+    model = RcServoMotorControlModel()
+    for i in range(len(motor_ticks)):
+        model.add_motor(RcServoMotor(motor_ticks[i], motor_angles[i]))
+    return model
+
+def get_time(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def get_peak_memory(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def get_slider(frame_cnt, motor_ticks, seed=0):
+    # Slider drags: one joint moves 1 tick per frame toward a random target
+    rand = random.Random(seed)
+    ticks = [tick[0] for tick in motor_ticks]
+    frames = []
+    while len(frames) < frame_cnt:
+        index = rand.randrange(len(motor_ticks))
+        target = rand.randint(motor_ticks[index][1], motor_ticks[index][2])
+        while ticks[index] != target and len(frames) < frame_cnt:
+            ticks[index] += 1 if target > ticks[index] else -1
+            frames.append(list(ticks))
+    return frames
+
+def get_percentiles(values):
+    if len(values) == 0:
+        return {}
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {'p50': p50, 'p90': p90, 'p99': p99, 'max': max(values)}
+
+def bench_interp(motor_ticks, pose_cnts, steps, repeat):
+    legacy = LegacyInterp()
+    interp = Interp()
+    results = []
+
+    print('Interp')
+    print(f'{"Poses":>8}{"Step":>6}{"Frames":>10}{"Legacy[ms]":>12}{"Array[ms]":>12}{"Speedup":>10}{"Mem[KB]":>10}')
+    for pose_cnt in pose_cnts:
+        arrs = get_action(pose_cnt, motor_ticks)
+        for step in steps:
+            frames = legacy.get_interp_lists(arrs, step)
+            if interp.get_interp_lists(arrs, step) != frames:
+                print(f'Interp mismatch - poses={pose_cnt} step={step}')
+                continue
+            t_legacy = get_time(lambda: legacy.get_interp_lists(arrs, step), repeat)
+            t_array = get_time(lambda: interp.get_interp_array(arrs, step), repeat)
+            mem = get_peak_memory(lambda: interp.get_interp_array(arrs, step))
+            print(f'{pose_cnt:>8}{step:>6}{len(frames):>10}'
+                  f'{t_legacy * 1000:>12.3f}{t_array * 1000:>12.3f}{t_legacy / t_array:>10.1f}{mem / 1024:>10.1f}')
+            results.append({
+                'poses': pose_cnt,
+                'step': step,
+                'frames': len(frames),
+                'legacy_sec': t_legacy,
+                'array_sec': t_array,
+                'fps': len(frames) / t_array,
+                'peak_bytes': mem,
+            })
+    return results
+
+def bench_convert(model, motor_ticks, frame_cnt, repeat):
+    interp = Interp()
+    arrs = get_action(frame_cnt // 50 + 2, motor_ticks)
+    ticks = interp.get_interp_lists(arrs, 1)[:frame_cnt]
+    motor_cnt = model.get_motor_cnt()
+
+    def tick_to_angle():
+        return [[model.convert_tick_to_angle(i, frame[i]) for i in range(motor_cnt)] for frame in ticks]
+
+    angles = tick_to_angle()
+
+    def angle_to_tick():
+        return [[model.convert_angle_to_tick(i, frame[i]) for i in range(motor_cnt)] for frame in angles]
+
+    results = []
+    print('Convert')
+    print(f'{"Function":>24}{"Frames":>10}{"Time[ms]":>12}{"Frames/s":>14}{"Mem[KB]":>10}')
+    for name, func in [('convert_tick_to_angle', tick_to_angle), ('convert_angle_to_tick', angle_to_tick)]:
+        t = get_time(func, repeat)
+        mem = get_peak_memory(func)
+        print(f'{name:>24}{len(ticks):>10}{t * 1000:>12.3f}{len(ticks) / t:>14.0f}{mem / 1024:>10.1f}')
+        results.append({
+            'function': name,
+            'frames': len(ticks),
+            'sec': t,
+            'fps': len(ticks) / t,
+            'peak_bytes': mem,
+        })
+    return results
+
+def bench_encode(model, motor_ticks, frame_cnt, repeat):
+    interp = Interp()
+    arrs = get_action(frame_cnt // 50 + 2, motor_ticks)
+    ticks = interp.get_interp_lists(arrs, 1)[:frame_cnt]
+
+    def legacy_rotate():
+        # v0.3 rotate() frame build (without print)
+        for frame in ticks:
+            data = [0xFF, 0xFF, len(frame)]
+            for tick in frame:
+                data.append(0xFF & (tick >> 8))
+                data.append(0xFF & tick)
+            bytearray(data)
+
+    def rotate():
+        # Set ticks and encode (model is not connected)
+        for frame in ticks:
+            model.set_ticks(frame)
+            model.rotate()
+
+    def encode_array():
+        model.encode_ticks_array(ticks)
+
+    results = []
+    print('Encode')
+    print(f'{"Function":>24}{"Frames":>10}{"Time[ms]":>12}{"Frames/s":>14}{"Mem[KB]":>10}')
+    for name, func in [('legacy_rotate', legacy_rotate), ('rotate', rotate), ('encode_ticks_array', encode_array)]:
+        t = get_time(func, repeat)
+        mem = get_peak_memory(func)
+        print(f'{name:>24}{len(ticks):>10}{t * 1000:>12.3f}{len(ticks) / t:>14.0f}{mem / 1024:>10.1f}')
+        results.append({
+            'function': name,
+            'frames': len(ticks),
+            'sec': t,
+            'fps': len(ticks) / t,
+            'peak_bytes': mem,
+        })
+    return results
+
+def get_latencies(sent, applied):
+    # Match applied frames to sent frames in order (lost frames are skipped)
+    latencies = []
+    index = 0
+    for applied_time, pwms in applied:
+        while index < len(sent) and tuple(sent[index][1]) != pwms[:len(sent[index][1])]:
+            index += 1
+        if index >= len(sent):
+            break
+        latencies.append(applied_time - sent[index][0])
+        index += 1
+    return latencies
+
+def bench_playback(model, motor_ticks, frame_cnt, interval):
+    interp = Interp()
+    arrs = get_action(frame_cnt // 50 + 2, motor_ticks)
+    ticks = interp.get_interp_lists(arrs, 1)[:frame_cnt]
+
+    emulator = BoardEmulator()
+    model.connect(emulator.open(), 115200)
+    results = []
+
+    print('Playback')
+    print(f'{"Mode":>12}{"Frames":>10}{"Applied":>10}{"Frames/s":>12}'
+          f'{"p50[ms]":>10}{"p99[ms]":>10}{"Max[ms]":>10}{"Missed":>8}')
+
+    # Stream mode (as fast as the link accepts) and paced mode (ActionPlayer)
+    for mode in ['stream', 'paced']:
+        emulator.clear()
+        sent = []
+        start = time.perf_counter()
+        if mode == 'stream':
+            for frame in ticks:
+                model.wait_writable(1.0)
+                model.set_ticks(frame)
+                sent.append((time.perf_counter(), frame))
+                model.rotate()
+            missed = 0
+        else:
+            player = ActionPlayer(model)
+            player.set_frame_callback(lambda index, data: sent.append((time.perf_counter(), data)))
+            player.start(TrajectoryCompiler(model).build(np.array(ticks), True), interval)
+            while player.is_running():
+                time.sleep(0.01)
+            player.stop()
+            missed = player.get_pacer().get_missed_cnt()
+        model.comm.flush()
+        time.sleep(0.05)
+        elapsed = time.perf_counter() - start
+
+        applied = emulator.get_frames()
+        latencies = [latency * 1000 for latency in get_latencies(sent, applied)]
+        percentiles = get_percentiles(latencies)
+        print(f'{mode:>12}{len(ticks):>10}{len(applied):>10}{len(applied) / elapsed:>12.0f}'
+              f'{percentiles.get("p50", 0):>10.3f}{percentiles.get("p99", 0):>10.3f}'
+              f'{percentiles.get("max", 0):>10.3f}{missed:>8}')
+        results.append({
+            'mode': mode,
+            'frames': len(ticks),
+            'applied': len(applied),
+            'fps': len(applied) / elapsed,
+            'latency_ms': percentiles,
+            'missed': missed,
+        })
+
+    model.disconnect()
+    emulator.close()
+    return results
+
+def bench_link(model, motor_ticks, frame_cnt, interval, baud=115200):
+    # Bytes on the link per workload, decoded by the board emulator
+    arrs = get_action(frame_cnt // 50 + 2, motor_ticks)
+    vel_max, acc_max = model.get_motion_limits(True)
+    workloads = [
+        ('slider', get_slider(frame_cnt, motor_ticks), 50),
+        ('linear', Interp().get_interp_lists(arrs, 1)[:frame_cnt], 1 / interval),
+        ('trapezoid', MotionProfile('trapezoid', vel_max, acc_max).get_profile_array(arrs, interval)[:frame_cnt].tolist(), 1 / interval),
+    ]
+    motor_cnt = model.get_motor_cnt()
+    results = []
+
+    print('Link')
+    print(f'{"Workload":>12}{"Protocol":>10}{"Frames":>10}{"Bytes":>10}{"Bytes/frame":>13}{"Util[%]":>10}{"Mismatch":>10}')
+    for name, ticks, rate in workloads:
+        for protocol in [1, 2]:
+            delta_encoder = DeltaFrameEncoder(motor_cnt) if protocol == 2 else None
+            emulator = BoardEmulator()
+            total = 0
+            mismatch = 0
+            for frame in ticks:
+                data = bytes(model.encoder.encode(frame))
+                if delta_encoder is not None:
+                    data = delta_encoder.convert(data)
+                total += len(data)
+                emulator.feed(data)
+                if emulator.get_pwms()[:motor_cnt] != frame:
+                    mismatch += 1
+
+            # 10 bits per byte (start, 8 data, stop)
+            size = total / len(ticks)
+            util = size * 10 * rate / baud * 100
+            print(f'{name:>12}{protocol:>10}{len(ticks):>10}{total:>10}{size:>13.2f}{util:>10.2f}{mismatch:>10}')
+            results.append({
+                'workload': name,
+                'protocol': protocol,
+                'frames': len(ticks),
+                'bytes': total,
+                'bytes_per_frame': size,
+                'rate': rate,
+                'utilization': util,
+                'mismatch': mismatch,
+            })
+    return results
+
+def bench_startup(repeat):
+    # Cold start in a new interpreter (best of repeat)
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    commands = [
+        ('python', ['-c', 'pass']),
+        ('import package', ['-c', 'import rc_servo_motor_control']),
+        ('import model', ['-c', 'import rc_servo_motor_control.rc_servo_motor_control_model']),
+        ('cli --help', [os.path.join(app_dir, 'rc_servo_motor_control_cli.py'), '--help']),
+        ('import view (Qt)', ['-c', 'import rc_servo_motor_control.rc_servo_motor_control_view']),
+    ]
+
+    results = []
+    print('Startup')
+    print(f'{"Command":>24}{"Time[ms]":>12}')
+    for name, command in commands:
+        def run():
+            subprocess.run([sys.executable] + command, cwd=app_dir, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            t = get_time(run, repeat)
+        except subprocess.CalledProcessError:
+            print(f'{name:>24}{"-":>12}')
+            continue
+        print(f'{name:>24}{t * 1000:>12.1f}')
+        results.append({
+            'command': name,
+            'sec': t,
+        })
+    return results
+
+# --------------------------------------------------------------------------------
+#   Run
+# --------------------------------------------------------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--output', default='Bench.json')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--quick', action='store_true')
+    args = parser.parse_args()
+
+    # Set configuration data
+    motor_ticks = [
+        #Init   Min     Max
+        [244,   134,    354],
+        [312,   202,    422],
+        [306,   196,    416]
+    ]
+    motor_angles = [
+        #Init   Min     Max
+        [0,     -45,    45],
+        [0,     -45,    45],
+        [0,     -45,    45]
+    ]
+    model = get_model(motor_ticks, motor_angles)
+
+    if args.quick:
+        pose_cnts, frame_cnt, playback_cnt = [10, 100], 2000, 100
+    else:
+        pose_cnts, frame_cnt, playback_cnt = [10, 100, 1000], 20000, 500
+
+    results = {
+        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'interp': bench_interp(motor_ticks, pose_cnts, [1, 2, 5], args.repeat),
+        'convert': bench_convert(model, motor_ticks, frame_cnt, args.repeat),
+        'encode': bench_encode(model, motor_ticks, frame_cnt, args.repeat),
+        'link': bench_link(model, motor_ticks, frame_cnt, 0.01),
+        'startup': bench_startup(args.repeat),
+    }
+    try:
+        results['playback'] = bench_playback(model, motor_ticks, playback_cnt, 0.01)
+    except Exception as e:
+        print(f'Playback Skip - {e}')
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=4)
+    print(f'Saved {args.output}')
@@ -0,0 +1,175 @@
+# --------------------------------------------------------------------------------
+#   File        rc_servo_motor_control_cli.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Add --stream option
+#                   Add --profile option and motor limits config
+#
+#               v0.3  2026.10.17  Tony Kwon
+#                   Add catmull_rom and cubic_spline profiles
+#                   Add --protocol option and protocol config
+#                   Add --upload option
+#                   Add --telemetry option
+#                   Add --kinematics option
+#                   Dry run with --port none or '' (was taken as a port name)
+#                   Move load_config() and load_action() to rc_servo_motor_control.config
+#                   Check --interval range with --upload (1~254 ms)
+#                   Run angle action in ticks (load_action(), same as the GUI)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import time
+start_time = time.perf_counter()
+
+import argparse
+import sys
+
+from rc_servo_motor_control.config import load_config, load_action, get_port
+from rc_servo_motor_control.trajectory_compiler import TrajectoryCompiler
+from rc_servo_motor_control.trajectory_stream import TrajectoryStream
+from rc_servo_motor_control.action_player import ActionPlayer
+from rc_servo_motor_control.trajectory_uploader import TrajectoryUploader
+from rc_servo_motor_control.frame_encoder import CONTROL_ARG_MAX
+from rc_servo_motor_control.telemetry import Telemetry
+from rc_servo_motor_control.forward_kinematics import ForwardKinematics
+
+# --------------------------------------------------------------------------------
+#   Run
+# --------------------------------------------------------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='RC Servo Motor Control (headless)')
+    parser.add_argument('--config', default='Config.json')
+    parser.add_argument('--action', default='Action.json')
+    parser.add_argument('--port', help="serial port (default: config port, none or '' to dry run)")
+    parser.add_argument('--baud', type=int)
+    parser.add_argument('--step', type=int, help='interp step (default: 5 tick, 1 angle)')
+    parser.add_argument('--interval', type=float, default=0.02,
+                        help=f'frame interval [sec] (--upload: 0.001~{CONTROL_ARG_MAX / 1000})')
+    parser.add_argument('--profile', default='linear', choices=['linear', 'trapezoid', 'min_jerk', 'catmull_rom', 'cubic_spline'],
+                        help='linear: step per frame, others: time-based under motor_limits')
+    parser.add_argument('--loop', type=int, default=1, help='run count (0: forever)')
+    parser.add_argument('--cache-dir', help='compiled trajectory cache directory')
+    parser.add_argument('--stream', action='store_true',
+                        help='interpolate while playing (flat memory, loops move last pose to first pose)')
+    parser.add_argument('--protocol', type=int, choices=[1, 2],
+                        help='1: full frames, 2: delta frames (default: config protocol)')
+    parser.add_argument('--upload', action='store_true',
+                        help='upload to the board buffer and play on the board timer (1[ms] interval resolution)')
+    parser.add_argument('--telemetry', metavar='PATH',
+                        help='record per-frame telemetry to .csv or .parquet (needs pyarrow)')
+    parser.add_argument('--kinematics', action='store_true',
+                        help='print tool path length and reach of the trajectory (TRARM01) and exit')
+    parser.add_argument('--echo', action='store_true')
+    args = parser.parse_args()
+    if args.stream is True and args.profile in ('catmull_rom', 'cubic_spline'):
+        parser.error(f'--profile {args.profile} is not supported with --stream')
+    if args.stream is True and args.upload is True:
+        parser.error('--upload is not supported with --stream')
+    if args.stream is True and args.kinematics is True:
+        parser.error('--kinematics is not supported with --stream')
+    if args.upload is True and not 1 <= round(args.interval * 1000) <= CONTROL_ARG_MAX:
+        parser.error(f'--interval {args.interval} is out of 0.001~{CONTROL_ARG_MAX / 1000} with --upload')
+
+    # Set model
+    model, config = load_config(args.config)
+    model.set_echo(args.echo)
+    if args.protocol is not None:
+        model.set_protocol(args.protocol)
+    telemetry = None
+    if args.telemetry is not None:
+        telemetry = Telemetry(size=1 << 16)
+        model.set_telemetry(telemetry)
+
+    # Set trajectory
+    data, step = load_action(args.action, model, args.step)
+    if len(data) < 2:
+        print('Action Run - At least 2 Pose need')
+        sys.exit(1)
+    if args.stream is False:
+        compiler = TrajectoryCompiler(model, cache_dir=args.cache_dir)
+        trajectory = compiler.compile(data, step, True, args.profile, args.interval)
+
+    # Check trajectory kinematics (offline)
+    if args.kinematics is True:
+        fk = ForwardKinematics(model)
+        positions = fk.get_positions_from_ticks(trajectory.ticks)
+        (reach_min, reach_max), (box_min, box_max) = fk.get_reach(positions)
+        print(f'Kinematics - Frames {len(positions)}, Path {fk.get_path_length(positions):.1f}[mm], '
+              f'Reach {reach_min:.1f}~{reach_max:.1f}[mm], '
+              f'Box {box_min.round(1).tolist()}~{box_max.round(1).tolist()}[mm]')
+        sys.exit(0)
+
+    # Connect
+    port = get_port(args.port, config)
+    baud = args.baud if args.baud is not None else config.get('baud', 115200)
+    if port is not None:
+        model.connect(port, baud)
+        if not model.connected:
+            sys.exit(1)
+
+    print(f'Startup {(time.perf_counter() - start_time) * 1000:.1f}[ms] - '
+          f'Poses {len(data)}, Step {step}, Interval {args.interval}[sec]')
+
+    # Run upload mode
+    if args.upload is True:
+        if not model.connected:
+            print('Action Upload - Port need')
+            sys.exit(1)
+        uploader = TrajectoryUploader(model)
+        count = 0
+        try:
+            while args.loop == 0 or count < args.loop:
+                uploader.start(trajectory, args.interval)
+                while uploader.is_running():
+                    time.sleep(0.05)
+                count += 1
+                if uploader.get_error() is not None:
+                    print(f'Action Upload NG - {uploader.get_error()}')
+                    break
+                print(f'Action Finished ({count}) - Frames {trajectory.get_frame_cnt()}, '
+                      f'Chunks {uploader.get_chunk_cnt()}, Retries {uploader.get_retry_cnt()}, '
+                      f'Underrun {uploader.get_underrun()}')
+        except KeyboardInterrupt:
+            print('Action Stop')
+            uploader.stop()
+        model.comm.flush()
+        model.disconnect()
+        sys.exit(0)
+
+    # Run (stream mode plays all loops in one stream)
+    player = ActionPlayer(model)
+    run_cnt = 1 if args.stream is True else args.loop
+    count = 0
+    try:
+        while run_cnt == 0 or count < run_cnt:
+            if args.stream is True:
+                stream = TrajectoryStream(model).stream(data, step, True, args.loop, args.profile, args.interval)
+                player.start_stream(stream, args.interval)
+            else:
+                player.start(trajectory, args.interval)
+            while player.is_running():
+                time.sleep(0.05)
+            count += 1
+            pacer = player.get_pacer()
+            print(f'Action Finished ({count}) - Frames {pacer.get_frame_cnt()}, Missed {pacer.get_missed_cnt()}, '
+                  f'Jitter mean {pacer.get_jitter_mean() * 1000:.3f}[ms] max {pacer.get_jitter_max() * 1000:.3f}[ms]')
+    except KeyboardInterrupt:
+        print('Action Stop')
+        player.stop()
+
+    if model.connected:
+        model.comm.flush()
+        model.disconnect()
+
+    if telemetry is not None:
+        stats = telemetry.get_stats(window=float('inf'))
+        print(f'Telemetry - Records {telemetry.get_count()}, Latency mean {stats["latency_mean"] * 1000:.3f}[ms] '
+              f'max {stats["latency_max"] * 1000:.3f}[ms], Jitter {stats["jitter"] * 1000:.3f}[ms], '
+              f'Dropped {stats["dropped"]}')
+        telemetry.save(args.telemetry)
+        print(f'Telemetry - Saved {args.telemetry}')
@@ -0,0 +1,89 @@
+# --------------------------------------------------------------------------------
+#   File        rc_servo_motor_control_fleet.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Dry run with port none or ''
+#                   Import config functions from the package
+#                   Honor --loop without --stream
+#                   Run angle action in ticks (load_action(), same as the GUI)
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import argparse
+import itertools
+import sys
+
+from rc_servo_motor_control.config import load_config, load_action, get_port
+from rc_servo_motor_control.trajectory_compiler import TrajectoryCompiler
+from rc_servo_motor_control.trajectory_stream import TrajectoryStream
+from rc_servo_motor_control.fleet_controller import FleetController
+
+# --------------------------------------------------------------------------------
+#   Run
+#
+#   python rc_servo_motor_control_fleet.py --arm Config.json Action.json COM5
+#                                          --arm Config2.json Action2.json COM6
+# --------------------------------------------------------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='RC Servo Motor Control (fleet)')
+    parser.add_argument('--arm', action='append', nargs='+', required=True,
+                        metavar='CONFIG ACTION [PORT]',
+                        help="arm config, action and port (default: config port, none or '' to dry run)")
+    parser.add_argument('--step', type=int, help='interp step (default: 5 tick, 1 angle)')
+    parser.add_argument('--interval', type=float, default=0.02)
+    parser.add_argument('--profile', default='linear', choices=['linear', 'trapezoid', 'min_jerk', 'catmull_rom', 'cubic_spline'])
+    parser.add_argument('--loop', type=int, default=1, help='loop count (0: forever)')
+    parser.add_argument('--stream', action='store_true', help='interpolate while playing')
+    args = parser.parse_args()
+    if args.stream is True and args.profile in ('catmull_rom', 'cubic_spline'):
+        parser.error(f'--profile {args.profile} is not supported with --stream')
+
+    # Set arms
+    fleet = FleetController()
+    trajectories = {}
+    ports = {}
+    for i, arm_args in enumerate(args.arm):
+        if len(arm_args) not in (2, 3):
+            parser.error('--arm takes CONFIG ACTION [PORT]')
+        name = f'arm{i}'
+        model, config = load_config(arm_args[0])
+        data, step = load_action(arm_args[1], model, args.step)
+        fleet.add_arm(name, model)
+
+        if args.stream is True:
+            trajectories[name] = TrajectoryStream(model).stream(data, step, True, args.loop, args.profile, args.interval)
+        else:
+            # Same trajectory loop times in one run (shared time base)
+            trajectory = TrajectoryCompiler(model).compile(data, step, True, args.profile, args.interval)
+            trajectories[name] = itertools.repeat(trajectory) if args.loop == 0 else itertools.repeat(trajectory, args.loop)
+
+        port = get_port(arm_args[2] if len(arm_args) == 3 else None, config)
+        if port is not None:
+            ports[name] = (port, config.get('baud', 115200))
+
+    # Connect
+    failed = fleet.connect(ports)
+    if failed:
+        print(f'Fleet connect NG - {", ".join(failed)}')
+        fleet.disconnect()
+        sys.exit(1)
+
+    # Run
+    print(f'Fleet Start - Arms {len(trajectories)}, Interval {args.interval}[sec]')
+    fleet.start(trajectories, args.interval)
+    try:
+        fleet.wait()
+    except KeyboardInterrupt:
+        print('Fleet Stop')
+        fleet.stop()
+
+    for name, stats in fleet.get_stats().items():
+        print(f'{name} - Frames {stats["frames"]}, Skipped {stats["skipped"]}, Dropped {stats["dropped"]}, '
+              f'Rate {stats["frame_rate"]:.1f}[fps] {stats["byte_rate"]:.0f}[B/s], '
+              f'Lag mean {stats["lag_mean"] * 1000:.3f}[ms] max {stats["lag_max"] * 1000:.3f}[ms]')
+    fleet.disconnect()
@@ -0,0 +1,71 @@
+# --------------------------------------------------------------------------------
+#   File        rc_servo_motor_control_workspace.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+#
+#               v0.2  2026.10.17  Tony Kwon
+#                   Rebuild if the map is for other dimensions, calibration or voxel size
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import argparse
+import os
+import time
+
+from rc_servo_motor_control.config import load_config
+from rc_servo_motor_control.workspace_map import WorkspaceMap
+
+# --------------------------------------------------------------------------------
+#   Run
+#
+#   python rc_servo_motor_control_workspace.py --build
+#   python rc_servo_motor_control_workspace.py --query 150 0 180 --query 0 0 300
+# --------------------------------------------------------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='RC Servo Motor Control (TRARM01 workspace map)')
+    parser.add_argument('--config', default='Config.json')
+    parser.add_argument('--map', default='Workspace.npz', help='workspace map file')
+    parser.add_argument('--build', action='store_true', help='build the map even if the file exists')
+    parser.add_argument('--voxel', type=float, default=5.0, help='voxel size [mm]')
+    parser.add_argument('--tick-step', type=int, default=1, help='joint grid step [tick]')
+    parser.add_argument('--workers', type=int, help='process count (default: CPU count)')
+    parser.add_argument('--query', action='append', nargs=3, type=float, metavar=('X', 'Y', 'Z'),
+                        help='tool point [mm] to look up')
+    args = parser.parse_args()
+
+    model, config = load_config(args.config)
+    workspace = WorkspaceMap(model, voxel_size=args.voxel)
+
+    # Load (rebuild if the map does not match)
+    is_build = args.build is True or not os.path.exists(args.map)
+    if is_build is False:
+        try:
+            workspace.load(args.map)
+            print(f'Workspace Load - Voxels {workspace.get_voxel_cnt()} ({workspace.get_voxel_size()}[mm]), {args.map}')
+            if workspace.get_voxel_size() != args.voxel:
+                print(f'Workspace Load - Voxel size {workspace.get_voxel_size()} != {args.voxel}[mm], rebuild')
+                is_build = True
+        except ValueError as e:
+            print(f'Workspace Load - {e}, rebuild')
+            is_build = True
+
+    # Build
+    if is_build is True:
+        workspace = WorkspaceMap(model, voxel_size=args.voxel)
+        start_time = time.perf_counter()
+        workspace.build(args.tick_step, args.workers)
+        workspace.save(args.map)
+        print(f'Workspace Build {time.perf_counter() - start_time:.2f}[sec] - '
+              f'Samples {workspace.get_sample_cnt()}, Voxels {workspace.get_voxel_cnt()}, '
+              f'Volume {workspace.get_volume() / 1000:.0f}[cm^3], Saved {args.map}')
+
+    # Query
+    for point in args.query or []:
+        ticks = workspace.get_pose(point)
+        if ticks is None:
+            print(f'Workspace Query {point} - Not reachable')
+        else:
+            print(f'Workspace Query {point} - Reachable, Ticks {ticks}')
@@ -0,0 +1,29 @@
+# --------------------------------------------------------------------------------
+#   File        conftest.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import os
+import sys
+
+import pytest
+
+# App directory (rc_servo_motor_control package, Config.json)
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from rc_servo_motor_control.config import load_config
+
+# --------------------------------------------------------------------------------
+#   Fixture
+# --------------------------------------------------------------------------------
+@pytest.fixture
+def model():
+    # TRARM01 model of Config.json (not connected)
+    model, _ = load_config(os.path.join(APP_DIR, 'Config.json'))
+    return model
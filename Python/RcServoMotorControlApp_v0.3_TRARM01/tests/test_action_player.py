@@ -0,0 +1,45 @@
+# --------------------------------------------------------------------------------
+#   File        test_action_player.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import threading
+
+from rc_servo_motor_control.action_player import ActionPlayer
+from rc_servo_motor_control.trajectory_compiler import TrajectoryCompiler
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def play(model, trajectory):
+    finished = threading.Event()
+    frames = []
+    player = ActionPlayer(model)
+    player.set_frame_callback(lambda index, data: frames.append(list(data)))
+    player.set_finish_callback(finished.set)
+    player.start(trajectory, 0.001)
+    assert finished.wait(5.0)
+    return player, frames
+
+def test_play_all_frames(model):
+    trajectory = TrajectoryCompiler(model).compile([[244, 312, 306], [264, 292, 326]], 5, True)
+    player, frames = play(model, trajectory)
+    assert not player.is_running()
+    assert frames == [trajectory.get_frame(index) for index in range(trajectory.get_frame_cnt())]
+    assert [model.get_tick(i) for i in range(3)] == frames[-1]
+
+def test_finish_on_error(model, capsys):
+    # Error on the player thread still ends the run and calls the finish callback
+    def rotate_data(data, scheduled=None):
+        raise RuntimeError('Rotate failed')
+    model.rotate_data = rotate_data
+    trajectory = TrajectoryCompiler(model).compile([[244, 312, 306], [264, 292, 326]], 5, True)
+    player, frames = play(model, trajectory)
+    assert not player.is_running()
+    assert frames == []
+    assert 'Action Player Error - Rotate failed' in capsys.readouterr().out
@@ -0,0 +1,74 @@
+# --------------------------------------------------------------------------------
+#   File        test_delta_frame_encoder.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+from rc_servo_motor_control.frame_encoder import FrameEncoder, DeltaFrameEncoder, FRAME_V2
+from rc_servo_motor_control.board_emulator import BoardEmulator
+
+# --------------------------------------------------------------------------------
+#   Define
+# --------------------------------------------------------------------------------
+TICKS_LIST = [
+    [244, 312, 306],
+    [245, 312, 306],        # 1 channel
+    [245, 312, 306],        # unchanged
+    [246, 313, 306],        # 2 channels (11 bytes, full frame is not bigger)
+    [246, 314, 306],        # 1 channel
+    [300, 250, 350],
+]
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def convert_all(ticks_list, key_interval=50):
+    encoder = FrameEncoder(3)
+    delta_encoder = DeltaFrameEncoder(3, key_interval)
+    return [delta_encoder.convert(encoder.encode(ticks)) for ticks in ticks_list]
+
+def test_delta_frame_layout():
+    frames = convert_all(TICKS_LIST)
+    assert frames[0] == FrameEncoder(3).encode(TICKS_LIST[0])
+    assert frames[1] == bytes((0xFF, 0xFF, FRAME_V2, 0, 1, 0, 245 >> 8, 245 & 0xFF))
+    assert frames[2] == b''
+    assert frames[3] == FrameEncoder(3).encode(TICKS_LIST[3])
+    assert frames[4] == bytes((0xFF, 0xFF, FRAME_V2, 1, 1, 1, 314 >> 8, 314 & 0xFF))
+
+def test_emulator_applies_delta_frames():
+    emulator = BoardEmulator()
+    for ticks, frame in zip(TICKS_LIST, convert_all(TICKS_LIST)):
+        emulator.feed(frame)
+        assert emulator.get_pwms()[:3] == ticks
+    assert emulator.get_lost_cnt() == 0
+
+def test_emulator_counts_lost_frame():
+    emulator = BoardEmulator()
+    frames = convert_all([[244, 312, 306], [245, 312, 306], [246, 312, 306], [247, 312, 306]])
+    for frame in frames[:2] + frames[3:]:
+        emulator.feed(frame)
+    assert emulator.get_lost_cnt() == 1
+
+def test_key_frame_refreshes_after_lost_frame():
+    emulator = BoardEmulator()
+    ticks_list = [[244, 312, 306 + i] for i in range(8)]
+    frames = convert_all(ticks_list, key_interval=4)
+    for index, frame in enumerate(frames):
+        if index != 2:
+            emulator.feed(frame)
+        if index == 3:
+            assert emulator.get_pwms()[:3] == ticks_list[3]
+    assert frames[4] == FrameEncoder(3).encode(ticks_list[4])
+    assert emulator.get_pwms()[:3] == ticks_list[-1]
+
+def test_reset_sends_full_frame():
+    encoder = FrameEncoder(3)
+    delta_encoder = DeltaFrameEncoder(3)
+    delta_encoder.convert(encoder.encode([244, 312, 306]))
+    delta_encoder.reset()
+    data = encoder.encode([245, 312, 306])
+    assert delta_encoder.convert(data) == data
@@ -0,0 +1,52 @@
+# --------------------------------------------------------------------------------
+#   File        test_forward_kinematics.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import numpy as np
+
+from rc_servo_motor_control.forward_kinematics import ForwardKinematics
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def test_zero_pose():
+    # Link2 up, Link3 forward
+    fk = ForwardKinematics()
+    assert np.allclose(fk.get_positions([0, 0, 0]), [100, 0, 200])
+    assert np.allclose(fk.get_joint_positions([0, 0, 0]), [[0, 0, 30], [0, 0, 100], [0, 0, 200], [100, 0, 200]])
+
+def test_joint_directions():
+    fk = ForwardKinematics()
+    assert np.allclose(fk.get_positions([90, 0, 0]), [0, 100, 200])
+    assert np.allclose(fk.get_positions([0, 90, 0]), [100, 0, 0])
+    assert np.allclose(fk.get_positions([0, 0, 90]), [0, 0, 100])
+
+def test_link_frames_match_positions():
+    fk = ForwardKinematics()
+    angles = np.random.default_rng(0).uniform(-45, 45, (50, 3))
+    frames = fk.get_link_frames(angles)
+    assert np.allclose(frames[:, 3, 0:3, 3], fk.get_positions(angles))
+
+    # Rotations are orthonormal, Tool = Link3 origin + Link3 x axis * length
+    rotations = frames[..., 0:3, 0:3]
+    assert np.allclose(rotations @ rotations.swapaxes(-1, -2), np.eye(3))
+    assert np.allclose(frames[:, 2, 0:3, 3] + 100 * frames[:, 2, 0:3, 0], frames[:, 3, 0:3, 3])
+
+def test_tick_angle_round_trip(model):
+    fk = ForwardKinematics(model)
+    ticks = np.array([[134, 202, 196], [244, 312, 306], [354, 422, 416]])
+    angles = fk.convert_ticks_to_angles(ticks)
+    assert np.allclose(angles, [[-45, -45, -45], [0, 0, 0], [45, 45, 45]])
+    assert np.allclose(fk.convert_angles_to_ticks(angles), ticks)
+
+def test_params_rebuild(model):
+    fk = ForwardKinematics(model)
+    ticks = np.random.default_rng(1).integers(134, 355, (20, 3))
+    assert np.allclose(ForwardKinematics(**fk.get_params()).get_positions_from_ticks(ticks),
+                       fk.get_positions_from_ticks(ticks))
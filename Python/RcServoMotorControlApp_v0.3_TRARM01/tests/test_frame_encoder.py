@@ -0,0 +1,53 @@
+# --------------------------------------------------------------------------------
+#   File        test_frame_encoder.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import numpy as np
+
+from rc_servo_motor_control.frame_encoder import FrameEncoder
+from rc_servo_motor_control.board_emulator import BoardEmulator
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def test_encode_layout():
+    data = FrameEncoder(3).encode([0x0102, 300, 0xFFFF])
+    assert data == bytes((0xFF, 0xFF, 3, 0x01, 0x02, 0x01, 0x2C, 0xFF, 0xFF))
+
+def test_encode_returns_new_bytes():
+    encoder = FrameEncoder(2)
+    first = encoder.encode([200, 300])
+    encoder.encode([400, 500])
+    assert isinstance(first, bytes)
+    assert first == bytes((0xFF, 0xFF, 2, 0x00, 0xC8, 0x01, 0x2C))
+
+def test_encode_array_matches_encode():
+    encoder = FrameEncoder(3)
+    ticks_array = np.array([[134, 202, 196], [244, 312, 306], [354, 422, 416]])
+    assert encoder.encode_array(ticks_array) == b''.join(encoder.encode(ticks) for ticks in ticks_array.tolist())
+
+def test_emulator_decodes_frames():
+    encoder = FrameEncoder(3)
+    emulator = BoardEmulator()
+    ticks_array = [[134, 202, 196], [255, 256, 511], [354, 422, 416]]
+    emulator.feed(encoder.encode_array(ticks_array))
+    assert [list(pwms[:3]) for _, pwms in emulator.get_frames()] == ticks_array
+
+def test_model_frame_follows_set_ticks(model):
+    model.set_ticks([250, 300, 310])
+    model.set_angle(0, 0)
+    emulator = BoardEmulator()
+    emulator.feed(model.get_frame())
+    assert emulator.get_pwms()[:3] == [model.get_tick(i) for i in range(3)]
+
+def test_get_frame_reads_motor_ticks(model):
+    # Direct RcServoMotor set_*() calls are in the next frame
+    model.motors[0].set_tick(250)
+    model.motors[1].set_angle(0)
+    assert model.get_frame() == FrameEncoder(3).encode([250, 312, model.get_tick(2)])
@@ -0,0 +1,74 @@
+# --------------------------------------------------------------------------------
+#   File        test_inverse_kinematics.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import numpy as np
+import pytest
+
+from rc_servo_motor_control.forward_kinematics import ForwardKinematics
+from rc_servo_motor_control.inverse_kinematics import InverseKinematics
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def get_random_ticks(cnt, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.integers(134, 355, cnt), rng.integers(202, 423, cnt), rng.integers(196, 417, cnt)])
+
+def test_fk_ik_round_trip(model):
+    fk = ForwardKinematics(model)
+    ik = InverseKinematics(model)
+    ticks = get_random_ticks(2000)
+    positions = fk.get_positions_from_ticks(ticks)
+
+    ik.set_warm_start([244, 312, 306])
+    solved = ik.solve_array(positions)
+    assert np.all(ik.get_reachables())
+    assert ik.get_errors().max() < 1e-6
+    assert np.all((solved >= ik.tick_mins) & (solved <= ik.tick_maxs))
+    assert np.allclose(fk.get_positions_from_ticks(solved), positions)
+
+def test_warm_start_keeps_branch(model):
+    # Small moves from the current pose stay on its branch (no joint jumps)
+    fk = ForwardKinematics(model)
+    ik = InverseKinematics(model)
+    path = np.rint(np.linspace([200, 260, 380], [300, 400, 220], 50)).astype(int)
+    ik.set_warm_start(path[0])
+    solved = np.array([ik.solve(position) for position in fk.get_positions_from_ticks(path)])
+    assert np.abs(np.diff(solved, axis=0)).max() <= np.abs(np.diff(path, axis=0)).max() + 1
+
+@pytest.mark.parametrize('target', [[500, 0, 0], [150, 0, 300], [120, 80, 20], [-100, 0, 200], [0, 0, 400]])
+def test_nearest_reachable_point(model, target):
+    # Not worse than a brute force over every other tick
+    fk = ForwardKinematics(model)
+    ik = InverseKinematics(model)
+    grid = np.stack(np.meshgrid(np.arange(134, 355, 2), np.arange(202, 423, 2), np.arange(196, 417, 2),
+                                indexing='ij'), axis=-1).reshape(-1, 3)
+    best = np.linalg.norm(fk.get_positions_from_ticks(grid) - target, axis=1).min()
+
+    ticks = ik.solve(target)
+    assert not ik.is_reachable()
+    assert ik.get_error() <= best + 1e-6
+    assert ik.get_error() == pytest.approx(np.linalg.norm(fk.get_positions_from_ticks(ticks) - target))
+
+def test_straight_ahead_keeps_base(model):
+    ik = InverseKinematics(model)
+    assert ik.solve([500, 0, 0])[0] == 244
+
+def test_cache_keyed_by_warm_start(model):
+    ik = InverseKinematics(model)
+    ik.set_warm_start([244, 312, 306])
+    first = ik.solve([150, 30, 180])
+    ik.set_warm_start([244, 312, 306])
+    assert ik.solve([150, 30, 180]) == first
+    assert (ik.get_hit_cnt(), ik.get_miss_cnt()) == (1, 1)
+
+    ik.set_warm_start([300, 250, 350])
+    ik.solve([150, 30, 180])
+    assert ik.get_miss_cnt() == 2
@@ -0,0 +1,58 @@
+# --------------------------------------------------------------------------------
+#   File        test_motion_profile.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import numpy as np
+import pytest
+
+from rc_servo_motor_control.motion_profile import MotionProfile
+
+# --------------------------------------------------------------------------------
+#   Define
+# --------------------------------------------------------------------------------
+KEYFRAMES = np.array([[244, 312, 306], [300, 250, 350], [200, 400, 220], [354, 202, 416], [244, 312, 306]])
+VEL_MAX = [300.0, 300.0, 300.0]
+ACC_MAX = [1500.0, 1500.0, 1500.0]
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def test_cubic_spline_tangents_solve_system():
+    # Thomas algorithm == dense solve of the clamped spline system
+    profile = MotionProfile('cubic_spline', VEL_MAX, ACC_MAX)
+    points = KEYFRAMES.astype(float)
+    h = np.array([0.4, 0.7, 0.3, 0.9])
+    tangents = profile.get_tangents(points, h)
+
+    n = len(h) - 1
+    a = np.zeros((n, n))
+    for i in range(n):
+        a[i, i] = 2.0 * (h[i] + h[i + 1])
+        if i > 0:
+            a[i, i - 1] = h[i + 1]
+        if i < n - 1:
+            a[i, i + 1] = h[i]
+    slopes = (points[1:] - points[:-1]) / h[:, None]
+    rhs = 3.0 * (h[1:, None] * slopes[:-1] + h[:-1, None] * slopes[1:])
+    assert np.allclose(tangents[1:-1], np.linalg.solve(a, rhs))
+    assert np.all(tangents[[0, -1]] == 0)
+
+@pytest.mark.parametrize('name', ['trapezoid', 'min_jerk', 'catmull_rom', 'cubic_spline'])
+def test_profile_passes_keyframes(name):
+    frames = MotionProfile(name, VEL_MAX, ACC_MAX).get_profile_array(KEYFRAMES, 0.02)
+    assert np.array_equal(frames[0], KEYFRAMES[0])
+    assert np.array_equal(frames[-1], KEYFRAMES[-1])
+    for keyframe in KEYFRAMES:
+        assert np.abs(frames - keyframe).sum(axis=1).min() <= 3
+
+@pytest.mark.parametrize('interval', [0.005, 0.02, 0.05])
+def test_spline_sample_rate(interval):
+    profile = MotionProfile('cubic_spline', VEL_MAX, ACC_MAX)
+    frames = profile.get_profile_array(KEYFRAMES, interval)
+    assert len(frames) - 1 == pytest.approx(profile.get_duration(KEYFRAMES) / interval, abs=len(KEYFRAMES))
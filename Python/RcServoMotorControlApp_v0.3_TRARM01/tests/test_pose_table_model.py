@@ -0,0 +1,75 @@
+# --------------------------------------------------------------------------------
+#   File        test_pose_table_model.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import numpy as np
+import pytest
+
+QtCore = pytest.importorskip('PySide6.QtCore')
+
+from rc_servo_motor_control.pose_table_model import PoseTableModel, COLUMN_DATA
+
+# --------------------------------------------------------------------------------
+#   Fixture
+# --------------------------------------------------------------------------------
+@pytest.fixture(scope='module')
+def app():
+    # Qt models need a (core) application
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+@pytest.fixture
+def table_model(app, model):
+    table_model = PoseTableModel(model)
+    table_model.set_rows([f'R{i}' for i in range(8)], [[i + 200] * 3 for i in range(8)])
+    return table_model
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def get_names(table_model):
+    return table_model.get_names()
+
+def test_move_rows_up_and_down(table_model):
+    assert table_model.move_rows([3, 5, 6], -1) == [2, 4, 5]
+    assert get_names(table_model) == ['R0', 'R1', 'R3', 'R2', 'R5', 'R6', 'R4', 'R7']
+    assert table_model.move_rows([0, 1, 4], 1) == [1, 2, 5]
+    assert get_names(table_model) == ['R3', 'R0', 'R1', 'R2', 'R6', 'R5', 'R4', 'R7']
+    assert np.array_equal(table_model.get_ticks_array()[:, 0], [203, 200, 201, 202, 206, 205, 204, 207])
+
+def test_move_rows_pinned_at_edge(table_model):
+    assert table_model.move_rows([0, 1, 3], -1) == [0, 1, 2]
+    assert get_names(table_model) == ['R0', 'R1', 'R3', 'R2', 'R4', 'R5', 'R6', 'R7']
+    assert table_model.move_rows([6, 7], 1) == [6, 7]
+
+def test_remove_and_insert_rows(table_model):
+    table_model.remove_rows([1, 4, 5])
+    assert get_names(table_model) == ['R0', 'R2', 'R3', 'R6', 'R7']
+    table_model.insert_rows(1, ['A', 'B'], [[300, 300, 300], [301, 301, 301]])
+    assert get_names(table_model) == ['R0', 'A', 'B', 'R2', 'R3', 'R6', 'R7']
+    assert table_model.get_ticks(2) == [301, 301, 301]
+
+def test_tick_angle_display_keeps_ticks(table_model):
+    ticks_array = table_model.get_ticks_array().copy()
+    table_model.set_is_tick(False)
+    index = table_model.index(0, COLUMN_DATA)
+    assert table_model.data(index) == str(table_model.model.convert_ticks_to_angles(ticks_array[0]).tolist())
+    assert table_model.setData(index, '[0, 0, 0]')
+    assert table_model.get_ticks(0) == [244, 312, 306]
+    table_model.set_is_tick(True)
+    assert np.array_equal(table_model.get_ticks_array()[1:], ticks_array[1:])
+
+@pytest.mark.parametrize('names, ticks_array', [
+    (['A'], [[1, 2]]),
+    (['A', 'B'], [[1, 2, 3]]),
+    (['A'], [1, 2, 3]),
+])
+def test_set_rows_rejects_bad_shape(table_model, names, ticks_array):
+    with pytest.raises(ValueError):
+        table_model.set_rows(names, ticks_array)
+    assert table_model.get_row_cnt() == 8
@@ -0,0 +1,97 @@
+# --------------------------------------------------------------------------------
+#   File        test_serial_comm.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import threading
+
+from rc_servo_motor_control.serial_comm import SerialComm
+from rc_servo_motor_control.board_emulator import BoardEmulator
+
+# --------------------------------------------------------------------------------
+#   Class - HoldSerial
+#
+#   Serial stand-in, write() blocks until release
+# --------------------------------------------------------------------------------
+class HoldSerial:
+    def __init__(self):
+        self.out_waiting = 0
+        self.writing = threading.Event()
+        self.release = threading.Event()
+        self.fail = False
+        self.data = []
+
+    def write(self, data):
+        self.writing.set()
+        self.release.wait(5)
+        if self.fail:
+            raise OSError('write failed')
+        self.data.append(bytes(data))
+        return len(data)
+
+def start_tx(comm):
+    comm.ser = HoldSerial()
+    comm.thread = threading.Thread(target=comm.run, daemon=True)
+    comm.thread.start()
+
+def stop_tx(comm):
+    comm.queue.put(None)
+    comm.thread.join(5)
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def test_flush_waits_in_flight_write():
+    comm = SerialComm()
+    start_tx(comm)
+
+    assert comm.write(b'\x01\x02') is True
+    assert comm.ser.writing.wait(5)
+    # Queue is empty but the write is still in flight
+    assert comm.get_queue_cnt() == 0
+    assert comm.flush(timeout=0.05) is False
+
+    comm.ser.release.set()
+    assert comm.flush(timeout=5) is True
+    assert comm.ser.data == [b'\x01\x02']
+    stop_tx(comm)
+
+def test_tx_error_resyncs_delta_frames(model):
+    # A failed delta frame write makes the next frame a full frame
+    model.set_protocol(2)
+    start_tx(model.comm)
+    model.comm.ser.release.set()
+
+    model.tx.send(model.encoder.encode([244, 312, 306]))
+    assert model.comm.flush(timeout=5) is True
+    model.comm.ser.fail = True
+    model.tx.send(model.encoder.encode([250, 312, 306]))
+    assert model.comm.flush(timeout=5) is True
+    assert model.comm.get_error_cnt() == 1
+
+    model.comm.ser.fail = False
+    model.tx.send(model.encoder.encode([251, 312, 306]))
+    assert model.comm.flush(timeout=5) is True
+    assert model.comm.ser.data == [model.encoder.encode([244, 312, 306]),
+                                   model.encoder.encode([251, 312, 306])]
+    stop_tx(model.comm)
+
+def test_init_twice_closes_port():
+    emulator = BoardEmulator()
+    port = emulator.open()
+    comm = SerialComm()
+    assert comm.init(port, 115200) is True
+    ser, thread, rx_thread = comm.ser, comm.thread, comm.rx_thread
+
+    # Old port closed and its threads stopped (else deinit() would hang)
+    assert comm.init(port, 115200) is True
+    assert ser.is_open is False
+    assert not thread.is_alive() and not rx_thread.is_alive()
+
+    comm.deinit()
+    emulator.close()
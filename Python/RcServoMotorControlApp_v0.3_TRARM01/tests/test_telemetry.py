@@ -0,0 +1,65 @@
+# --------------------------------------------------------------------------------
+#   File        test_telemetry.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import threading
+
+import numpy as np
+
+from rc_servo_motor_control.telemetry import Telemetry, FRAME_WRITTEN, FRAME_PENDING
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def test_record_ids_unique_across_producers():
+    telemetry = Telemetry(size=1 << 16)
+    ids = [[] for _ in range(4)]
+
+    def produce(record_ids):
+        for _ in range(5000):
+            record_ids.append(telemetry.add_frame(None, 0.0, 0))
+
+    threads = [threading.Thread(target=produce, args=(record_ids,)) for record_ids in ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    record_ids = sum(ids, [])
+    assert sorted(record_ids) == list(range(20000))
+    assert telemetry.get_count() == 20000
+
+def test_ring_keeps_last_records():
+    telemetry = Telemetry(size=4)
+    for i in range(6):
+        record_id = telemetry.add_frame(float(i), float(i), i)
+    telemetry.set_written(record_id, 10.0, 9)
+    telemetry.set_written(0, 10.0, 9)       # older than the ring, ignored
+
+    records = telemetry.get_records()
+    assert records['id'].tolist() == [2, 3, 4, 5]
+    assert np.array_equal(records['scheduled'], [2.0, 3.0, 4.0, 5.0])
+    assert records['status'].tolist() == [FRAME_PENDING] * 3 + [FRAME_WRITTEN]
+
+def test_clear_ignores_old_record_ids():
+    telemetry = Telemetry(size=4)
+    old_id = telemetry.add_frame(None, 0.0, 0)
+    telemetry.clear()
+    assert telemetry.get_count() == 0
+    assert len(telemetry.get_records()['id']) == 0
+
+    # Late write of a record from before clear() keeps the new record
+    record_id = telemetry.add_frame(None, 1.0, 0)
+    assert record_id != old_id
+    telemetry.set_written(old_id, 10.0, 9)
+    records = telemetry.get_records()
+    assert records['id'].tolist() == [0]
+    assert records['status'].tolist() == [FRAME_PENDING]
+
+    telemetry.set_written(record_id, 10.0, 9)
+    assert telemetry.get_records()['status'].tolist() == [FRAME_WRITTEN]
@@ -0,0 +1,65 @@
+# --------------------------------------------------------------------------------
+#   File        test_trajectory_compiler.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import numpy as np
+import pytest
+
+from rc_servo_motor_control.config import load_action
+from rc_servo_motor_control.trajectory_compiler import TrajectoryCompiler
+from rc_servo_motor_control.trajectory_file import TrajectoryFile
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+@pytest.mark.parametrize('rows, step, is_tick', [
+    ([[244, 312, 306], [300, 250, 350]], 2.5, True),
+    ([[0, 0, 0], [40, -30, 20]], 2.5, False),
+    ([[244, 312, 306], [300, 250, 350]], 5, True),
+])
+def test_disk_cache(model, tmp_path, rows, step, is_tick):
+    # Miss -> saved to cache_dir
+    compiler = TrajectoryCompiler(model, cache_dir=str(tmp_path))
+    trajectory = compiler.compile(rows, step, is_tick)
+    assert np.issubdtype(trajectory.frames.dtype, np.integer)
+    assert len(list(tmp_path.glob('*.trj'))) == 1
+    assert (compiler.get_hit_cnt(), compiler.get_disk_hit_cnt(), compiler.get_miss_cnt()) == (0, 0, 1)
+
+    # Memory hit
+    assert compiler.compile(rows, step, is_tick) is trajectory
+    assert (compiler.get_hit_cnt(), compiler.get_disk_hit_cnt(), compiler.get_miss_cnt()) == (1, 0, 1)
+
+    # Disk hit in a new compiler, same frames, ticks and data
+    reloaded = TrajectoryCompiler(model, cache_dir=str(tmp_path)).compile(rows, step, is_tick)
+    assert np.array_equal(reloaded.frames, trajectory.frames)
+    assert np.array_equal(reloaded.ticks, trajectory.ticks)
+    assert reloaded.data == trajectory.data
+
+def test_disk_cache_counters(model, tmp_path):
+    compiler = TrajectoryCompiler(model, cache_size=1, cache_dir=str(tmp_path))
+    rows = [[244, 312, 306], [300, 250, 350]]
+    compiler.compile(rows, 5, True)
+    compiler.compile(rows, 10, True)
+    compiler.compile(rows, 5, True)
+    assert (compiler.get_hit_cnt(), compiler.get_disk_hit_cnt(), compiler.get_miss_cnt()) == (0, 1, 2)
+
+def test_load_angle_action(model, tmp_path):
+    # CLI and fleet (load_action) compile an angle action like the GUI
+    angles = np.array([[0, 0, 0], [40, -30, 20], [-20, 10, 0]])
+    path = str(tmp_path / 'Action.json')
+    TrajectoryFile().save_json(path, angles, ['Pose1', 'Pose2', 'Pose3'], False)
+    data, step = load_action(path, model, 2)
+    assert np.array_equal(data, model.convert_angles_to_ticks(angles))
+    assert step == model.convert_angle_step_to_ticks(2)
+
+    compiler = TrajectoryCompiler(model)
+    trajectory = compiler.compile(data, step, True)
+    assert trajectory.is_tick is True
+    assert np.array_equal(trajectory.ticks[0], data[0])
+    assert np.abs(trajectory.ticks[-1] - data[-1]).max() < step
@@ -0,0 +1,68 @@
+# --------------------------------------------------------------------------------
+#   File        test_trajectory_file.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import numpy as np
+import pytest
+
+from rc_servo_motor_control.trajectory_file import TrajectoryFile, TRAJECTORY_HEADER
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def test_save_load_round_trip(tmp_path):
+    file = TrajectoryFile()
+    path = str(tmp_path / 'action.trj')
+    data = np.array([[244, 312, 306], [-45, 0, 45], [32767, -32768, 0]])
+    file.save(path, data, ['A', 'B', '한글'], is_tick=False)
+
+    header = file.load_header(path)
+    assert (header['rows'], header['motors'], header['is_tick']) == (3, 3, False)
+    assert header['data_offset'] == TRAJECTORY_HEADER.size
+
+    loaded, names, is_tick = file.load(path)
+    assert isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded, data)
+    assert (names, is_tick) == (['A', 'B', '한글'], False)
+
+def test_json_binary_conversion(tmp_path):
+    file = TrajectoryFile()
+    data = np.array([[244, 312, 306], [300, 250, 350]])
+    file.save_json(str(tmp_path / 'Action.json'), data, ['Pose1', 'Pose2'], True)
+    file.convert_json_to_binary(str(tmp_path / 'Action.json'), str(tmp_path / 'Action.trj'))
+    file.convert_binary_to_json(str(tmp_path / 'Action.trj'), str(tmp_path / 'Action2.json'))
+    loaded, names, is_tick = file.load_json(str(tmp_path / 'Action2.json'))
+    assert np.array_equal(loaded, data)
+    assert (names, is_tick) == (['Pose1', 'Pose2'], True)
+
+def test_empty_action(tmp_path):
+    # Header-only Action.json -> 0 row trajectory file and back
+    file = TrajectoryFile()
+    file.save_json(str(tmp_path / 'Action.json'), [], [], True)
+    file.convert_json_to_binary(str(tmp_path / 'Action.json'), str(tmp_path / 'Action.trj'))
+    assert file.load_header(str(tmp_path / 'Action.trj'))['rows'] == 0
+
+    file.save(str(tmp_path / 'Empty.trj'), np.empty((0, 3), dtype=int), is_tick=False)
+    loaded, names, is_tick = file.load(str(tmp_path / 'Empty.trj'))
+    assert (loaded.shape, names, is_tick) == ((0, 3), [], False)
+
+    file.convert_binary_to_json(str(tmp_path / 'Empty.trj'), str(tmp_path / 'Empty.json'))
+    loaded, names, is_tick = file.load_json(str(tmp_path / 'Empty.json'))
+    assert (loaded.size, names, is_tick) == (0, [], False)
+
+@pytest.mark.parametrize('data', [[], [[]], [1, 2, 3], [[1.5, 2.0]], [[40000, 0]], [[0, -40000]]])
+def test_save_rejects_bad_data(tmp_path, data):
+    with pytest.raises(ValueError):
+        TrajectoryFile().save(str(tmp_path / 'bad.trj'), data)
+
+def test_load_rejects_other_file(tmp_path):
+    path = tmp_path / 'other.trj'
+    path.write_bytes(b'\x00' * 64)
+    with pytest.raises(ValueError):
+        TrajectoryFile().load(str(path))
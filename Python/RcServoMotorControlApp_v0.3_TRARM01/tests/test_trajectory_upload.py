@@ -0,0 +1,88 @@
+# --------------------------------------------------------------------------------
+#   File        test_trajectory_upload.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import numpy as np
+import pytest
+
+from rc_servo_motor_control.frame_encoder import (UploadFrameEncoder, FRAME_SEQ_MAX,
+                                                  CONTROL_CLEAR, CONTROL_PLAY, CONTROL_STOP)
+from rc_servo_motor_control.trajectory_uploader import TrajectoryUploader, UploadAckDecoder, UPLOAD_STATE_PLAY
+from rc_servo_motor_control.board_emulator import BoardEmulator, UPLOAD_BUF_SIZE
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def get_board():
+    # Emulator with its acks decoded (no pseudo-terminal)
+    emulator = BoardEmulator()
+    decoder = UploadAckDecoder()
+    acks = []
+    emulator.write = lambda data: acks.extend(decoder.feed(bytes(data)))
+    return emulator, acks
+
+def test_chunk_and_control_layout():
+    encoder = UploadFrameEncoder(3)
+    assert encoder.encode_chunk(5, [[244, 312, 306]]) == bytes((0xFF, 0xFF, 0xFD, 5, 1, 0, 244, 1, 56, 1, 50))
+    assert encoder.encode_control(CONTROL_PLAY, 20) == bytes((0xFF, 0xFF, 0xFC, CONTROL_PLAY, 20))
+    assert encoder.encode_control(CONTROL_PLAY, 0xFE)[-1] == 0xFE
+    for arg in (-1, 0xFF, 1000):
+        with pytest.raises(ValueError):
+            encoder.encode_control(CONTROL_PLAY, arg)
+
+@pytest.mark.parametrize('interval', [0.0, 0.0004, 0.255, 1.0])
+def test_upload_interval_out_of_range(model, interval):
+    uploader = TrajectoryUploader(model)
+    with pytest.raises(ValueError):
+        uploader.start(None, interval)
+    assert uploader.is_running() is False
+
+def test_ack_decoder_split_and_noise():
+    decoder = UploadAckDecoder()
+    assert decoder.feed(bytes((0x00, 0xFF, 0xFF, 0xFD, 3))) == []
+    assert decoder.feed(bytes((10, UPLOAD_STATE_PLAY, 0xFF, 0xFF, 0xFD, 4, 9, 0))) == [(3, 10, UPLOAD_STATE_PLAY), (4, 9, 0)]
+
+def test_upload_chunks_acked():
+    encoder = UploadFrameEncoder(3)
+    emulator, acks = get_board()
+    frame_max = UPLOAD_BUF_SIZE // 6
+
+    emulator.feed(encoder.encode_control(CONTROL_CLEAR, 3))
+    assert acks[-1] == (FRAME_SEQ_MAX - 1, frame_max, 0)
+
+    ticks_array = np.arange(30).reshape(10, 3) + 200
+    emulator.feed(encoder.encode_chunk(0, ticks_array[:4]))
+    emulator.feed(encoder.encode_chunk(1, ticks_array[4:]))
+    assert acks[-1] == (1, frame_max - 10, 0)
+    assert emulator.get_upload_cnt() == 10
+
+    # Duplicate and out of order chunks are acked with the last seq
+    emulator.feed(encoder.encode_chunk(1, ticks_array[4:]))
+    emulator.feed(encoder.encode_chunk(3, ticks_array[:1]))
+    assert acks[-2:] == [(1, frame_max - 10, 0), (1, frame_max - 10, 0)]
+    assert emulator.get_upload_cnt() == 10
+
+def test_upload_play_and_stop():
+    encoder = UploadFrameEncoder(3)
+    emulator, acks = get_board()
+    ticks_array = np.arange(15).reshape(5, 3) + 250
+    emulator.feed(encoder.encode_control(CONTROL_CLEAR, 3))
+    emulator.feed(encoder.encode_chunk(0, ticks_array))
+    emulator.feed(encoder.encode_control(CONTROL_PLAY, 20))
+    assert acks[-1][2] & UPLOAD_STATE_PLAY
+
+    # One frame per call once the play time is due
+    for _ in range(len(ticks_array)):
+        emulator.upload_time -= emulator.upload_interval
+        emulator.process_upload_play()
+    assert [list(pwms[:3]) for _, pwms in emulator.get_frames()] == ticks_array.tolist()
+    assert emulator.get_upload_cnt() == 0
+
+    emulator.feed(encoder.encode_control(CONTROL_STOP))
+    assert acks[-1][2] & UPLOAD_STATE_PLAY == 0
@@ -0,0 +1,90 @@
+# --------------------------------------------------------------------------------
+#   File        test_tx_coalescer.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import threading
+import time
+
+from rc_servo_motor_control.tx_coalescer import TxCoalescer
+
+# --------------------------------------------------------------------------------
+#   Class - RecordComm
+#
+#   SerialComm stand-in, records written frames
+# --------------------------------------------------------------------------------
+class RecordComm:
+    def __init__(self):
+        self.frames = []
+
+        # b'Hold' frame blocks write() (write_lock held) until release is set
+        self.holding = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, data, record_id=None):
+        if data == b'Hold':
+            self.holding.set()
+            self.release.wait()
+        self.frames.append(bytes(data))
+        return True
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def test_latest_wins():
+    comm = RecordComm()
+    tx = TxCoalescer(comm, max_rate=20)
+    tx.start()
+    try:
+        tx.submit(b'S0')
+        time.sleep(0.02)
+        for i in range(1, 10):
+            tx.submit(b'S%d' % i)
+        time.sleep(0.1)
+    finally:
+        tx.stop()
+    assert comm.frames == [b'S0', b'S9']
+    assert tx.get_coalesced_cnt() == 8
+
+def test_no_stale_frame_after_send():
+    # A submitted frame is never written after a newer send() frame, also
+    # when the TX thread wakes up while another thread holds write_lock
+    comm = RecordComm()
+    tx = TxCoalescer(comm, max_rate=1000)
+    tx.start()
+
+    def send_frames(i):
+        tx.send(b'Hold')
+        tx.send(b'P%d' % i)
+
+    try:
+        for i in range(20):
+            comm.holding.clear()
+            comm.release.clear()
+            thread = threading.Thread(target=send_frames, args=(i,))
+            thread.start()
+            comm.holding.wait()
+
+            # TX thread is due while b'Hold' is being written
+            tx.submit(b'S%d' % i)
+            time.sleep(0.003)
+            comm.release.set()
+            thread.join()
+            time.sleep(0.003)
+    finally:
+        tx.stop()
+
+    send_index = -1
+    for frame in comm.frames:
+        if frame == b'Hold':
+            continue
+        index = int(frame[1:])
+        if frame[:1] == b'P':
+            send_index = index
+        else:
+            assert index > send_index
@@ -0,0 +1,73 @@
+# --------------------------------------------------------------------------------
+#   File        test_workspace_map.py
+#
+#   Version     v0.1  2026.10.17  Tony Kwon
+#                   Initial revision
+# --------------------------------------------------------------------------------
+
+# --------------------------------------------------------------------------------
+#   Import
+# --------------------------------------------------------------------------------
+import copy
+
+import numpy as np
+import pytest
+
+from rc_servo_motor_control.forward_kinematics import ForwardKinematics
+from rc_servo_motor_control.workspace_map import WorkspaceMap
+
+# --------------------------------------------------------------------------------
+#   Fixture
+# --------------------------------------------------------------------------------
+@pytest.fixture
+def workspace(model):
+    # Coarse map (10 tick step, 20 mm voxels), no pool
+    workspace = WorkspaceMap(model, voxel_size=20.0)
+    workspace.build(tick_step=10, workers=1)
+    return workspace
+
+# --------------------------------------------------------------------------------
+#   Test
+# --------------------------------------------------------------------------------
+def test_pool_build_matches_inline(model, workspace):
+    pooled = WorkspaceMap(model, voxel_size=20.0)
+    pooled.build(tick_step=10, workers=2)
+    assert workspace.get_voxel_cnt() > 0
+    assert pooled.get_sample_cnt() == workspace.get_sample_cnt()
+    assert np.array_equal(pooled.occupancy, workspace.occupancy)
+    assert np.array_equal(pooled.poses, workspace.poses)
+
+def test_poses_map_back_to_their_voxel(workspace):
+    index = np.argwhere(workspace.occupancy)
+    ticks = workspace.poses[tuple(index.T)]
+    assert np.all(ticks >= 0)
+
+    positions = workspace.fk.get_positions_from_ticks(ticks)
+    voxels = np.floor((positions - workspace.origin) / workspace.get_voxel_size()).astype(int)
+    assert np.array_equal(voxels, index)
+
+    # Point queries agree with the grid
+    point = workspace.origin + (index[0] + 0.5) * workspace.get_voxel_size()
+    assert workspace.is_reachable(point)
+    assert workspace.get_pose(point) == ticks[0].tolist()
+
+def test_query_outside_grid(workspace):
+    far = workspace.origin - 1.0
+    reachable, ticks = workspace.query_array([far, -far * 10])
+    assert reachable.tolist() == [False, False]
+    assert np.all(ticks == -1)
+    assert workspace.get_index(far) is None
+    assert workspace.get_pose(far) is None
+
+def test_load_rejects_other_calibration(model, workspace, tmp_path):
+    path = str(tmp_path / 'workspace.npz')
+    workspace.save(path)
+
+    loaded = WorkspaceMap(model, voxel_size=20.0)
+    loaded.load(path)
+    assert np.array_equal(loaded.occupancy, workspace.occupancy)
+
+    params = copy.deepcopy(workspace.fk.get_params())
+    params['calibration'][1][0] += 10
+    with pytest.raises(ValueError):
+        WorkspaceMap(fk=ForwardKinematics(**params), voxel_size=20.0).load(path)